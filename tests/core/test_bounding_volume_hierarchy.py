@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as npy
+
+import volmdlr
+from volmdlr.core import BoundingBox, BoundingVolumeHierarchy
+
+
+class TestBoundingVolumeHierarchy(unittest.TestCase):
+    def setUp(self):
+        random_generator = npy.random.default_rng(0)
+        self.mins = random_generator.random((200, 3))
+        self.maxs = self.mins + 0.1 * random_generator.random((200, 3))
+        self.bvh = BoundingVolumeHierarchy(self.mins, self.maxs)
+        other_mins = random_generator.random((150, 3)) + 0.5
+        self.other = BoundingVolumeHierarchy(other_mins, other_mins + 0.1 * random_generator.random((150, 3)))
+
+    def test_from_bounding_boxes(self):
+        bvh = BoundingVolumeHierarchy.from_bounding_boxes([BoundingBox(0, 1, 0, 2, 0, 3),
+                                                           BoundingBox(4, 5, 4, 5, 4, 5)])
+        self.assertEqual(len(bvh), 2)
+        self.assertEqual(bvh.mins.tolist(), [[0, 0, 0], [4, 4, 4]])
+        self.assertEqual(bvh.maxs.tolist(), [[1, 2, 3], [5, 5, 5]])
+        self.assertEqual(len(BoundingVolumeHierarchy.from_bounding_boxes([]).box_query([0, 0, 0], [1, 1, 1])), 0)
+
+    def test_box_query(self):
+        indices = self.bvh.box_query([0.2, 0.2, 0.2], [0.4, 0.4, 0.4])
+        expected = npy.nonzero(((self.mins <= 0.4) & (self.maxs >= 0.2)).all(axis=1))[0]
+        self.assertEqual(indices.tolist(), expected.tolist())
+
+    def test_segment_query(self):
+        start, end = npy.array([0.1, 0.9, -0.5]), npy.array([0.8, 0.1, 1.5])
+        indices = self.bvh.segment_query(volmdlr.Point3D(*start), volmdlr.Point3D(*end))
+        parameters = npy.linspace(0, 1, 10001)[:, None]
+        points = start + parameters * (end - start)
+        crossed = [index for index, (box_min, box_max) in enumerate(zip(self.mins, self.maxs))
+                   if ((points >= box_min) & (points <= box_max)).all(axis=1).any()]
+        self.assertTrue(set(crossed).issubset(indices))
+        self.assertLessEqual(len(indices), len(crossed) + 2)
+        self.assertGreaterEqual(len(self.bvh.segment_query(start, end, infinite=True)), len(indices))
+
+    def test_pairs(self):
+        pairs = self.bvh.pairs(self.other, tol=0.01)
+        expected = npy.argwhere(((self.mins[:, None] <= self.other.maxs[None] + 0.01)
+                                 & (self.other.mins[None] <= self.maxs[:, None] + 0.01)).all(axis=-1))
+        self.assertEqual(pairs.tolist(), expected.tolist())
+
+    def test_nearest(self):
+        centers = 0.5 * (self.mins + self.maxs)
+        point = npy.array([0.5, 0.1, 0.7])
+        index, (distance,) = self.bvh.nearest(point, lambda i: (npy.linalg.norm(centers[i] - point),))
+        self.assertEqual(index, npy.argmin(npy.linalg.norm(centers - point, axis=1)))
+
+        other_centers = 0.5 * (self.other.mins + self.other.maxs)
+        distances = npy.linalg.norm(centers[:, None] - other_centers[None], axis=-1)
+        index1, index2, _ = self.bvh.nearest_pair(
+            self.other, lambda i, j: (npy.linalg.norm(centers[i] - other_centers[j]),))
+        self.assertEqual((index1, index2), npy.unravel_index(distances.argmin(), distances.shape))
+
+
+if __name__ == '__main__':
+    unittest.main()
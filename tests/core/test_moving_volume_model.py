@@ -0,0 +1,59 @@
+import math
+import unittest
+
+import volmdlr
+from volmdlr.core import MovingVolumeModel, PrimitiveInstance
+from volmdlr.primitives3d import Block
+
+
+class TestMovingVolumeModel(unittest.TestCase):
+    def setUp(self):
+        angle = math.pi / 5
+        self.frame1 = volmdlr.Frame3D(volmdlr.Point3D(3, 0, 0),
+                                      volmdlr.Vector3D(math.cos(angle), math.sin(angle), 0),
+                                      volmdlr.Vector3D(-math.sin(angle), math.cos(angle), 0), volmdlr.Z3D)
+        self.frame2 = volmdlr.Frame3D(volmdlr.Point3D(0, 1, 0.2), volmdlr.Y3D, -volmdlr.X3D, volmdlr.Z3D)
+        self.model = MovingVolumeModel([Block(volmdlr.OXYZ), Block(volmdlr.OXYZ)],
+                                       [[self.frame1, self.frame2], [self.frame2, self.frame1]])
+
+    def test_step_instances(self):
+        instances = self.model.step_instances(0)
+        self.assertIs(instances[0].primitive, self.model.primitives[0])
+        self.assertIs(instances[0].local_mesh, self.model.step_instances(1)[0].local_mesh)
+
+        for instance, primitive in zip(instances, self.model.step_volume_model(0).primitives):
+            bounding_box = primitive.bounding_box
+            self.assertAlmostEqual(instance.bounding_box.xmin, bounding_box.xmin)
+            self.assertAlmostEqual(instance.bounding_box.ymax, bounding_box.ymax)
+            self.assertAlmostEqual(instance.bounding_box.zmax, bounding_box.zmax)
+
+            point = volmdlr.Point3D(5, 0.5, 0.2)
+            self.assertTrue(instance.minimum_distance_point(point).is_close(primitive.minimum_distance_point(point)))
+
+        distance, point1, point2 = instances[0].minimum_distance(instances[1], return_points=True)
+        self.assertAlmostEqual(distance, point1.point_distance(point2))
+        self.assertGreaterEqual(distance, instances[0].bounding_box.xmin - instances[1].bounding_box.xmax)
+        self.assertAlmostEqual(point2.x, 0.5)
+
+    def test_minimum_distance_contacts(self):
+        bar = Block(volmdlr.Frame3D(volmdlr.O3D, 10 * volmdlr.X3D, volmdlr.Y3D, volmdlr.Z3D))
+        instance1 = PrimitiveInstance(bar, volmdlr.OXYZ)
+        rotated_frame = volmdlr.Frame3D(volmdlr.O3D, volmdlr.Y3D, -volmdlr.X3D, volmdlr.Z3D)
+        # Crossing bars: no vertex of a bar is close to the other
+        self.assertEqual(instance1.minimum_distance(PrimitiveInstance(bar, rotated_frame)), 0.)
+        # Bar inside the other
+        small_bar = Block(volmdlr.Frame3D(volmdlr.O3D, 2 * volmdlr.X3D, 0.2 * volmdlr.Y3D, 0.2 * volmdlr.Z3D))
+        self.assertEqual(instance1.minimum_distance(PrimitiveInstance(small_bar, volmdlr.OXYZ)), 0.)
+        # Edge to edge: bar rotated by 45 degrees around its axis, crossing above the other
+        half_diagonal = 0.5 ** 0.5
+        frame = volmdlr.Frame3D(volmdlr.Point3D(0, 0, 0.5 + half_diagonal + 0.3), volmdlr.Y3D,
+                                volmdlr.Vector3D(half_diagonal, 0, half_diagonal),
+                                volmdlr.Vector3D(half_diagonal, 0, -half_diagonal))
+        distance, point1, point2 = instance1.minimum_distance(PrimitiveInstance(bar, frame), return_points=True)
+        self.assertAlmostEqual(distance, 0.3)
+        self.assertAlmostEqual(distance, point1.point_distance(point2))
+        self.assertAlmostEqual(point1.z, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,15 @@ class TestVolumeModel(unittest.TestCase):
     def test_volume(self):
         self.assertEqual(self.volume_model.volume(), sum(p.volume() for p in self.primitives))
 
+    def test_babylon_data(self):
+        class OldBlock(Block):
+            def babylon_meshes(self):
+                return Block.babylon_meshes(self)
+
+        volume_model = VolumeModel([OldBlock(volmdlr.OXYZ), self.block2])
+        self.assertEqual(len(volume_model.babylon_data()['meshes']), 2)
+        self.assertIn('binary', self.volume_model.babylon_data(binary=True)['meshes'][0])
+
     def test_rotation(self):
         center = volmdlr.Point3D(0.0, 0.0, 0.0)
         axis = volmdlr.Vector3D(0.0, 0.0, 1.0)
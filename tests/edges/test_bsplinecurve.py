@@ -4,7 +4,9 @@ Unit tests for volmdlr.faces.BSplineCurve
 import unittest
 
 import dessia_common
+import numpy as npy
 from geomdl import BSpline
+from geomdl.operations import length_curve
 
 import volmdlr
 import volmdlr.edges as vme
@@ -17,7 +19,7 @@ class TestBSplineCurve(unittest.TestCase):
         bspline_curve2d = bspline_curves.bspline_curve2d_1
         point = volmdlr.Point2D(-0.31240117104573617, -2.8555856978321796)
 
-        self.assertAlmostEqual(bspline_curve2d.abscissa(point), 7.747599410268476)
+        self.assertAlmostEqual(bspline_curve2d.abscissa(point), 7.748578168643583)
 
     def test_line_intersections(self):
         bspline_curve2d = dessia_common.DessiaObject.load_from_file('edges/bsplinecurve2d_1.json')
@@ -71,6 +73,20 @@ class TestBSplineCurve(unittest.TestCase):
         points = bspline_curve2d.discretization_points(angle_resolution=10)
         self.assertEqual(len(points), 31)
 
+    def test_evaluate(self):
+        control_points = [volmdlr.Point3D(1, 0, 0), volmdlr.Point3D(1, 1, 0), volmdlr.Point3D(0, 1, 0)]
+        for weights in [None, [1, 0.5 * 2 ** 0.5, 1]]:
+            bspline_curve3d = vme.BSplineCurve3D(2, control_points, [3, 3], [0.0, 1.0], weights)
+            parameters = npy.linspace(0, 1, 7)
+            derivatives = bspline_curve3d.evaluate(parameters, 2)
+            self.assertEqual(derivatives.shape, (3, 7, 3))
+            for i, parameter in enumerate(parameters):
+                for order, expected in enumerate(bspline_curve3d.curve.derivatives(parameter, 2)):
+                    self.assertTrue(npy.allclose(derivatives[order, i], expected))
+            self.assertEqual(len(bspline_curve3d.points), 100)
+            # The length is integrated, the geomdl one is the length of a 100 points polyline
+            self.assertAlmostEqual(bspline_curve3d.length(), length_curve(bspline_curve3d.curve), 4)
+
 
 class TestBSplineCurve3D(unittest.TestCase):
     b_splinecurve3d = vme.BSplineCurve3D(degree=5, control_points=[
@@ -82,6 +98,19 @@ class TestBSplineCurve3D(unittest.TestCase):
         volmdlr.Point3D(0.5334, 1.86385510975, -1.03417888209)], knot_multiplicities=[6, 3, 6],
                                          knots=[0.0, 0.4999999725155696, 1.0])
 
+    def test_points_at_abscissas(self):
+        quarter_circle = vme.BSplineCurve3D(2, [volmdlr.Point3D(1, 0, 0), volmdlr.Point3D(1, 1, 0),
+                                                volmdlr.Point3D(0, 1, 0)],
+                                            [3, 3], [0.0, 1.0], [1, 0.5 * 2 ** 0.5, 1])
+        angles = npy.linspace(0, 0.5 * npy.pi, 9)
+        points = quarter_circle.points_at_abscissas(angles)
+        self.assertTrue(npy.allclose(points, npy.column_stack((npy.cos(angles), npy.sin(angles),
+                                                               npy.zeros(9)))))
+        self.assertTrue(quarter_circle.point_at_abscissa(0.25 * npy.pi).is_close(
+            volmdlr.Point3D(0.5 * 2 ** 0.5, 0.5 * 2 ** 0.5, 0)))
+        self.assertAlmostEqual(quarter_circle.length(), 0.5 * npy.pi)
+        self.assertTrue(quarter_circle.point_at_abscissa(quarter_circle.length()).is_close(quarter_circle.end))
+
     def test_line_intersections(self):
         line = vme.Line3D(volmdlr.Point3D(0.5334, -0.44659009801843536, 0.0),
                           volmdlr.Point3D(0.5334, 0.4342689853571558, -0.47337857496375274))
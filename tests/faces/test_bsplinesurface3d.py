@@ -3,6 +3,8 @@ Unit tests for volmdlr.faces.BSplineSurface3D
 """
 import unittest
 
+import numpy as npy
+
 import volmdlr.edges as vme
 import volmdlr.faces as vmf
 import volmdlr.grid
@@ -32,6 +34,41 @@ class TestBSplineSurface3D(unittest.TestCase):
         # Check if the bounding box volume is correct
         self.assertEqual(volume, 4.0)
 
+    def test_evaluate(self):
+        surface = bspline_surfaces.bspline_surface_4
+        rational_surface = vmf.BSplineSurface3D(surface.degree_u, surface.degree_v, surface.control_points,
+                                                surface.nb_u, surface.nb_v, surface.u_multiplicities,
+                                                surface.v_multiplicities, surface.u_knots, surface.v_knots,
+                                                bspline_surfaces.weights)
+        parameters = npy.array([[0.3, 0.6], [0.3, 0.1], [0.9, 0.6], [0., 1.]])
+        for bspline_surface in [surface, rational_surface]:
+            derivatives = bspline_surface.evaluate(parameters, 2)
+            self.assertEqual(derivatives.shape, (3, 3, 4, 3))
+            for i, (u, v) in enumerate(parameters):
+                expected = bspline_surface.surface.derivatives(u, v, 2)
+                for k in range(3):
+                    for l in range(3):
+                        self.assertTrue(npy.allclose(derivatives[k, l, i], expected[k][l]))
+
+    def test_points2d_to_3d(self):
+        surface = bspline_surfaces.bspline_surface_2
+        points2d = [volmdlr.Point2D(0.25, 0.5), volmdlr.Point2D(1.2, 0.5), volmdlr.Point2D(0.7, -0.1)]
+        points3d = surface.points2d_to_3d(points2d)
+        self.assertEqual(points3d.shape, (3, 3))
+        for point2d, point3d in zip(points2d, points3d):
+            self.assertTrue(surface.point2d_to_3d(point2d).is_close(volmdlr.Point3D(*point3d)))
+        grid = surface.evaluate_grid([0., 0.5, 1.], [0.2, 0.8])
+        self.assertEqual(grid.shape, (6, 3))
+        self.assertTrue(surface.point2d_to_3d(volmdlr.Point2D(0.5, 0.8)).is_close(volmdlr.Point3D(*grid[3])))
+
+    def test_points3d_to_2d(self):
+        surface = bspline_surfaces.bspline_surface_2
+        parameters = npy.array([[0.1, 0.2], [0.5, 0.5], [0.93, 0.01], [1., 0.7]])
+        points2d = surface.points3d_to_2d(surface.points2d_to_3d(parameters))
+        self.assertTrue(npy.allclose(points2d, parameters))
+        point3d = surface.point2d_to_3d(volmdlr.Point2D(0.3, 0.8))
+        self.assertTrue(surface.point3d_to_2d(point3d).is_close(volmdlr.Point2D(0.3, 0.8)))
+
     def test_arc3d_to_2d(self):
         bspline_surface = vmf.BSplineSurface3D.load_from_file('faces/BSplineSurface3D_with_Arc3D.json')
         arc = vme.Arc3D(volmdlr.Point3D(0.01, 0.018, 0.014),
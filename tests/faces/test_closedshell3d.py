@@ -1,6 +1,8 @@
 import math
 import unittest
 
+import numpy as npy
+
 import volmdlr
 from volmdlr import edges, faces, primitives3d, wires
 
@@ -121,6 +123,65 @@ class TestClosedShell3D(unittest.TestCase):
         union_shell1_shell2 = shell1.union(shell2)
         self.assertEqual(len(union_shell1_shell2), 2)
 
+    def test_triangulation_workers(self):
+        cylinder = primitives3d.Cylinder(volmdlr.O3D, volmdlr.X3D, 0.1, 0.3)
+        shell = faces.ClosedShell3D(cylinder.faces + [faces.Triangle3D(volmdlr.O3D, volmdlr.X3D, volmdlr.Y3D)])
+        mesh = shell.triangulation()
+        for face in cylinder.faces:
+            face._triangulation = None
+        parallel_mesh = shell.triangulation(workers=2)
+        self.assertTrue(all(face.cached_triangulation() is not None for face in cylinder.faces))
+        self.assertEqual(parallel_mesh.faces.tolist(), mesh.faces.tolist())
+        self.assertTrue(npy.allclose(parallel_mesh.vertices, mesh.vertices))
+
+    def test_faces_bvh(self):
+        block1 = primitives3d.Block(volmdlr.OXYZ.copy())
+        block2 = block1.translation(volmdlr.Vector3D(0.5, 0.3, 0.2))
+        block3 = block1.translation(volmdlr.Vector3D(3, 0.3, 0.2))
+        combinations = block1.intersecting_faces_combinations(block2, [], 1e-8)
+        self.assertEqual(combinations, [(face1, face2) for face1 in block1.faces for face2 in block2.faces
+                                        if face1.is_intersecting(face2, [], 1e-8)])
+        self.assertAlmostEqual(block1.distance_to_shell(block3, 0.1), 2.)
+        linesegment = edges.LineSegment3D(volmdlr.Point3D(-1, 0.1, 0.2), volmdlr.Point3D(1, 0.1, 0.2))
+        self.assertEqual(len(block1.linesegment_intersections(linesegment)), 2)
+        point = block1.minimum_distance_point(volmdlr.Point3D(0.1, 0.2, 2))
+        self.assertTrue(point.is_close(volmdlr.Point3D(0.1, 0.2, 0.5)))
+
+        shell = faces.ClosedShell3D(block1.faces)
+        self.assertEqual(len(shell.linesegment_intersections(linesegment)), 2)
+        shell.faces = block3.faces
+        self.assertFalse(shell.linesegment_intersections(linesegment))
+
+    def test_points_belong(self):
+        block = primitives3d.Block(volmdlr.OXYZ.copy())
+        points = npy.random.default_rng(0).random((2000, 3)) * 1.4 - 0.7
+        self.assertEqual(block.points_belong(points).tolist(), (npy.abs(points) < 0.5).all(axis=1).tolist())
+        # Rays through shared edges and vertices of the triangulation, and points on the boundary
+        grid = npy.array([(x, y, z) for x in npy.linspace(-0.7, 0.7, 15)
+                          for y in npy.linspace(-0.5, 0.5, 11) for z in npy.linspace(-0.5, 0.5, 11)])
+        self.assertEqual(block.points_belong(grid).tolist(), (npy.abs(grid) < 0.5 - 1e-9).all(axis=1).tolist())
+        self.assertTrue(block.point_belongs(volmdlr.Point3D(0.1, 0.2, 0.3)))
+        self.assertFalse(block.point_belongs(volmdlr.Point3D(0.5, 0.2, 0.3)))
+
+        sphere = primitives3d.Sphere(volmdlr.O3D, 0.3)
+        distances = npy.linalg.norm(points, axis=1)
+        far_from_surface = npy.abs(distances - 0.3) > 0.01
+        self.assertEqual(sphere.points_belong(points)[far_from_surface].tolist(),
+                         (distances < 0.3)[far_from_surface].tolist())
+
+    def test_mass_properties(self):
+        frame = volmdlr.Frame3D(volmdlr.Point3D(1, 2, 3), 2 * volmdlr.X3D, 3 * volmdlr.Y3D, 4 * volmdlr.Z3D)
+        block = primitives3d.Block(frame)
+        volume, area, center_of_mass, inertia_tensor = block.mass_properties()
+        self.assertAlmostEqual(volume, 24.)
+        self.assertAlmostEqual(area, 52.)
+        self.assertTrue(center_of_mass.is_close(volmdlr.Point3D(1, 2, 3)))
+        self.assertTrue(npy.allclose(inertia_tensor, npy.diag([50., 40., 26.])))
+        self.assertAlmostEqual(faces.ClosedShell3D.volume(block), 24.)
+
+        cylinder = primitives3d.Cylinder(volmdlr.O3D, volmdlr.X3D, 0.1, 1.)
+        self.assertAlmostEqual(cylinder.mass_properties()[0], cylinder.volume(), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import math
 import unittest
 
+import numpy as npy
+
 import volmdlr
 from volmdlr import edges, faces
 
@@ -21,6 +23,26 @@ class TestCylindricalFace3D(unittest.TestCase):
         self.assertEqual(line_inters_2[0], volmdlr.Point3D(0.2262741, 0.2262741, 0.2508494))
         self.assertEqual(line_inters_2[1], volmdlr.Point3D(-0.2262741, -0.2262741, -0.0508494))
 
+    def test_triangulation_cache(self):
+        surface = faces.CylindricalSurface3D(volmdlr.OXYZ.copy(), 0.32)
+        cylindrical_face = surface.rectangular_cut(-0.01, 1.3, -0.1, 0.3)
+        mesh = cylindrical_face.triangulation()
+        self.assertTrue(npy.shares_memory(cylindrical_face.triangulation().vertices, mesh.vertices))
+
+        # Transformed copies reuse the transformed mesh
+        frame = volmdlr.Frame3D(volmdlr.Point3D(0.1, 0.2, 0.3), volmdlr.Y3D, volmdlr.Z3D, volmdlr.X3D)
+        for transformed_face in [cylindrical_face.translation(volmdlr.Vector3D(1, 2, 3)),
+                                 cylindrical_face.rotation(volmdlr.O3D, volmdlr.Z3D, 0.5),
+                                 cylindrical_face.frame_mapping(frame, 'new')]:
+            self.assertIsNotNone(transformed_face.cached_triangulation())
+            transformed_mesh = transformed_face.triangulation()
+            transformed_face._triangulation = None
+            self.assertTrue(npy.allclose(transformed_mesh.vertices, transformed_face.triangulation().vertices))
+
+        # Inplace transformations invalidate the cache
+        cylindrical_face.translation_inplace(volmdlr.Vector3D(1, 0, 0))
+        self.assertTrue(npy.allclose(cylindrical_face.triangulation().vertices, mesh.vertices + [1, 0, 0]))
+
 
 if __name__ == '__main__':
     unittest.main()
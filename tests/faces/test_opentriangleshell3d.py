@@ -0,0 +1,76 @@
+import unittest
+
+import numpy as npy
+
+import volmdlr
+from volmdlr import faces
+
+
+class TestOpenTriangleShell3D(unittest.TestCase):
+    vertices = npy.array([[0., 0., 0.], [1., 0., 0.], [0., 1., 0.], [0., 0., 1.], [5., 5., 5.]])
+    triangles = npy.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+
+    def test_from_mesh_data(self):
+        shell = faces.ClosedTriangleShell3D.from_mesh_data(self.vertices, self.triangles)
+        self.assertTrue(shell.is_array_based())
+        self.assertEqual(shell.faces._triangles, [None] * 4)
+
+        triangle = shell.faces[3]
+        self.assertIsInstance(triangle, faces.Triangle3D)
+        self.assertEqual(triangle.point3, volmdlr.Point3D(0., 0., 1.))
+        self.assertIs(shell.faces[3], triangle)
+        self.assertIs(shell.faces[1].point3, triangle.point3)
+
+        vertices, triangles = shell.to_mesh_data()
+        self.assertIs(vertices, shell.faces.vertices)
+        self.assertIs(triangles, shell.faces.faces)
+
+    def test_mesh_data_bounding_box(self):
+        shell = faces.ClosedTriangleShell3D.from_mesh_data(self.vertices, self.triangles)
+        objects_shell = faces.ClosedTriangleShell3D([faces.Triangle3D(*[volmdlr.Point3D(*self.vertices[i])
+                                                                        for i in triangle])
+                                                     for triangle in self.triangles.tolist()])
+        self.assertFalse(objects_shell.is_array_based())
+        self.assertEqual(shell, objects_shell)
+
+        positions, triangles = objects_shell.to_mesh_data()
+        self.assertEqual(positions.shape, (12, 3))
+        self.assertEqual(triangles.tolist(), [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 10, 11]])
+
+        for bounding_box in (shell.bounding_box, objects_shell.bounding_box):
+            self.assertEqual((bounding_box.xmin, bounding_box.xmax, bounding_box.zmax), (0., 1., 1.))
+
+        display_mesh = shell.triangulation()
+        self.assertEqual(display_mesh.faces.tolist(), self.triangles.tolist())
+        self.assertAlmostEqual(shell.to_trimesh().volume, objects_shell.to_trimesh().volume)
+
+    def test_transformations(self):
+        frame = volmdlr.Frame3D(volmdlr.Point3D(1., 2., 3.), volmdlr.Y3D, volmdlr.Z3D, volmdlr.X3D)
+        transformations = [('translation', (volmdlr.X3D * 3,)),
+                           ('rotation', (volmdlr.Point3D(1., 0., 0.), volmdlr.Vector3D(1., 1., 0.), 0.7)),
+                           ('frame_mapping', (frame, 'old')),
+                           ('frame_mapping', (frame, 'new'))]
+        for method, arguments in transformations:
+            shell = faces.ClosedTriangleShell3D.from_mesh_data(self.vertices, self.triangles)
+            objects_shell = faces.ClosedTriangleShell3D([faces.Triangle3D(*[volmdlr.Point3D(*self.vertices[i])
+                                                                            for i in triangle])
+                                                         for triangle in self.triangles.tolist()])
+            triangle = shell.faces[0]
+            expected_shell = getattr(objects_shell, method)(*arguments)
+            new_shell = getattr(shell, method)(*arguments)
+            self.assertTrue(new_shell.is_array_based())
+            self.assertEqual(new_shell, faces.ClosedTriangleShell3D.from_mesh_data(*expected_shell.to_mesh_data()))
+
+            getattr(shell, method + '_inplace')(*arguments)
+            self.assertEqual(shell, new_shell)
+            self.assertIsNot(shell.faces[0], triangle)
+            self.assertTrue(shell.faces[0].point1.is_close(expected_shell.faces[0].point1))
+            self.assertAlmostEqual(shell.bounding_box.xmax, expected_shell.bounding_box.xmax)
+            display_mesh = shell.triangulation()
+            self.assertAlmostEqual(display_mesh.vertices[display_mesh.faces][..., 1].max(),
+                                   expected_shell.bounding_box.ymax)
+            self.assertAlmostEqual(shell.volume(), expected_shell.volume())
+
+
+if __name__ == '__main__':
+    unittest.main()
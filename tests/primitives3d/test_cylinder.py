@@ -1,6 +1,9 @@
 import unittest
 
+import numpy as npy
+
 import volmdlr
+from volmdlr import primitives3d
 from volmdlr.primitives3d import Cylinder
 
 
@@ -58,6 +61,28 @@ class TestCylinder(unittest.TestCase):
         self.assertTrue(intersecting_1_2)
         self.assertFalse(intersecting_1_3)
 
+    def test_cylinders_min_distances(self):
+        cylinders = [self.cylinder1, self.cylinder2, self.cylinder3]
+        pairs, distances = Cylinder.cylinders_min_distances(cylinders)
+        self.assertEqual(pairs.tolist(), [[0, 1]])
+        self.assertEqual(distances.tolist(), [0.])
+
+        pairs, distances = Cylinder.cylinders_min_distances(cylinders, max_distance=0.1)
+        self.assertEqual(pairs.tolist(), [[0, 1], [0, 2], [1, 2]])
+        self.assertTrue(npy.allclose(distances, [0., 0.095, 0.09]))
+
+        # Lateral faces closest: exact distance of the axes minus the radii
+        distances = primitives3d.cylinders_pairs_distances([[0, 0, 0], [0, 0, 1]], [[1, 0, 0], [0, 1, 0]],
+                                                           [0.1, 0.2], [1., 1.], [[0, 1]])
+        self.assertAlmostEqual(distances[0], 0.7)
+
+        # Cap against lateral face, compared to the optimizer
+        positions = npy.array([[0, 0, 0], [0.7, 0.05, 0.1]])
+        axes = npy.array([[1, 0, 0], [0, 0.6, 0.8]])
+        distances = primitives3d.cylinders_pairs_distances(positions, axes, [0.05, 0.02], [1., 0.2], [[0, 1]])
+        self.assertAlmostEqual(distances[0], primitives3d._cylinders_min_distance_optimization(
+            positions[0], axes[0], 0.05, 1., positions[1], axes[1], 0.02, 0.2), 5)
+
     def test_lhs_points_inside(self):
         points = self.cylinder1.lhs_points_inside(n_points=100)
         for point in points:
@@ -0,0 +1,67 @@
+import base64
+import unittest
+import zlib
+
+import numpy as npy
+
+import volmdlr as vm
+from volmdlr import display
+
+
+class TestDisplayMesh3D(unittest.TestCase):
+    mesh1 = display.DisplayMesh3D([display.Node3D(0., 0., 0.), display.Node3D(1., 0., 0.),
+                                   display.Node3D(0., 1., 0.)], [(0, 1, 2)])
+    mesh2 = display.DisplayMesh3D.from_arrays(npy.array([[1., 0., 0.], [0., 1., 1e-8], [1., 1., 0.]]),
+                                              npy.array([[0, 2, 1]]))
+
+    def test_arrays(self):
+        self.assertEqual(self.mesh1.vertices.shape, (3, 3))
+        self.assertEqual(self.mesh1.faces.dtype, npy.int32)
+        self.assertIsNone(self.mesh2._points)
+        self.assertEqual(self.mesh2.triangles, [(0, 2, 1)])
+        self.assertTrue(self.mesh2.points[1].is_close(vm.Point3D(0., 1., 1e-8)))
+
+    def test_merge_meshes(self):
+        merged_mesh = display.DisplayMesh3D.merge_meshes([self.mesh1, self.mesh2])
+        self.assertEqual(merged_mesh.vertices.shape, (4, 3))
+        self.assertEqual(merged_mesh.triangles, [(0, 1, 2), (1, 3, 2)])
+        self.assertTrue(merged_mesh.check())
+
+        added_mesh = self.mesh1 + self.mesh2
+        self.assertTrue(npy.array_equal(added_mesh.faces, merged_mesh.faces))
+
+        mesh = display.DisplayMesh3D(self.mesh1.points[:], self.mesh1.triangles[:])
+        mesh.merge_mesh(self.mesh2)
+        self.assertTrue(npy.array_equal(mesh.vertices, merged_mesh.vertices))
+        self.assertEqual(len(mesh.points), 4)
+
+        mesh = display.DisplayMesh3D.from_arrays(self.mesh2.vertices, self.mesh2.faces)
+        mesh.triangles = [(0, 1, 2)]
+        single_mesh = display.DisplayMesh3D.merge_meshes([mesh])
+        self.assertEqual(single_mesh.triangles, [(0, 1, 2)])
+        self.assertTrue(npy.array_equal(single_mesh.vertices, self.mesh2.vertices))
+
+    def test_to_babylon(self):
+        self.assertEqual(self.mesh2.to_babylon(), ([1., 0., 0., 0., 1., 0., 1., 1., 0.], [0, 2, 1]))
+
+        binary_data = self.mesh2.to_babylon_binary()
+        self.assertEqual(npy.frombuffer(base64.b64decode(binary_data['positions']), '<f4').tolist(),
+                         npy.float32(self.mesh2.vertices.ravel()).tolist())
+        self.assertEqual(npy.frombuffer(base64.b64decode(binary_data['indices']), '<u4').tolist(), [0, 2, 1])
+
+        binary_data = self.mesh2.to_babylon_binary(quantize=True, compress=True)
+        self.assertEqual(binary_data['compression'], 'deflate')
+        quantized = npy.frombuffer(zlib.decompress(base64.b64decode(binary_data['positions'])), '<u2').reshape(-1, 3)
+        positions = (npy.array(binary_data['quantization']['min'])
+                     + quantized * npy.array(binary_data['quantization']['step']))
+        self.assertTrue(npy.allclose(positions, self.mesh2.vertices, atol=1e-12))
+
+
+class TestDisplayMesh2D(unittest.TestCase):
+    def test_area(self):
+        mesh = display.DisplayMesh2D.from_arrays([[0., 0.], [2., 0.], [0., 1.], [2., 1.]], [[0, 1, 2], [1, 3, 2]])
+        self.assertAlmostEqual(mesh.area(), 2.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit tests for volmdlr.gmsh_vm
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as npy
+
+import volmdlr
+from volmdlr.gmsh_vm import GmshParser
+
+
+ASCII_MSH = """$MeshFormat
+4.1 0 8
+$EndMeshFormat
+$Nodes
+2 4 1 4
+0 1 0 1
+1
+0 0 1
+2 1 0 3
+2
+3
+4
+1 0 1
+1 1 1
+0 1 1
+$EndNodes
+$Elements
+1 2 1 2
+2 1 2 2
+1 1 2 3
+2 1 3 4
+$EndElements
+"""
+
+
+def binary_msh():
+    one = npy.array([1], dtype='<i4').tobytes()
+    nodes = (npy.array([2, 4, 1, 4], dtype='<u8').tobytes()
+             + npy.array([0, 1, 0], dtype='<i4').tobytes() + npy.array([1, 1], dtype='<u8').tobytes()
+             + npy.array([0, 0, 1], dtype='<f8').tobytes()
+             + npy.array([2, 1, 0], dtype='<i4').tobytes() + npy.array([3, 2, 3, 4], dtype='<u8').tobytes()
+             + npy.array([1, 0, 1, 1, 1, 1, 0, 1, 1], dtype='<f8').tobytes())
+    elements = (npy.array([1, 2, 1, 2], dtype='<u8').tobytes() + npy.array([2, 1, 2], dtype='<i4').tobytes()
+                + npy.array([2, 1, 1, 2, 3, 2, 1, 3, 4], dtype='<u8').tobytes())
+    return (b'$MeshFormat\n4.1 1 8\n' + one + b'\n$EndMeshFormat\n'
+            + b'$Entities\n' + npy.zeros(4, dtype='<u8').tobytes() + b'\n$EndEntities\n'
+            + b'$Nodes\n' + nodes + b'\n$EndNodes\n'
+            + b'$Elements\n' + elements + b'\n$EndElements\n')
+
+
+class TestGmshParser(unittest.TestCase):
+
+    def from_content(self, content: bytes):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'mesh.msh')
+            with open(file_path, 'wb') as file:
+                file.write(content)
+            return GmshParser.from_file(file_path)
+
+    def test_from_file(self):
+        for gmsh_parser in [self.from_content(ASCII_MSH.encode()), self.from_content(binary_msh())]:
+            self.assertEqual(gmsh_parser.nodes.coordinates.tolist(),
+                             [[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]])
+            self.assertEqual(gmsh_parser.elements.connectivity(2).tolist(), [[0, 1, 2], [0, 2, 3]])
+
+            # lazy dict layout
+            self.assertEqual(list(gmsh_parser.nodes.keys()), ['nodes_dim_0', 'nodes_dim_2', 'all_nodes'])
+            self.assertEqual(len(gmsh_parser.nodes['nodes_dim_2'][0]), 3)
+            self.assertIsInstance(gmsh_parser.nodes['all_nodes'][0], volmdlr.mesh.Node3D)
+            self.assertEqual(dict(gmsh_parser.elements), {'elements_type_2': [[[0, 1, 2], [0, 2, 3]]]})
+
+            mesh = gmsh_parser.define_triangular_element_mesh()
+            self.assertEqual(len(mesh.elements_groups[0].elements), 2)
+
+    def test_from_file_nodes(self):
+        lines = ASCII_MSH.splitlines()
+        nodes = GmshParser.from_file_nodes(lines[lines.index('$Nodes') + 1:lines.index('$EndNodes')])
+        self.assertEqual(nodes['all_nodes'][2], volmdlr.mesh.Node3D(1, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit tests for volmdlr.mesh
+"""
+import unittest
+
+import numpy as npy
+
+import volmdlr
+from volmdlr import mesh
+
+
+class TestElementsGroup(unittest.TestCase):
+    nodes_coordinates = npy.array([[0., 0.], [2., 0.], [2., 1.], [0., 1.]])
+    connectivity = npy.array([[0, 1, 2], [0, 2, 3]])
+
+    def test_from_arrays(self):
+        group = mesh.ElementsGroup.from_arrays(self.nodes_coordinates, self.connectivity)
+        self.assertTrue(group.is_array_based())
+        self.assertEqual(group.elements._elements, [None, None])
+
+        element = group.elements[1]
+        self.assertIsInstance(element, mesh.TriangularElement2D)
+        self.assertEqual(element.points[2], volmdlr.Point2D(0., 1.))
+        self.assertIs(group.elements[1], element)
+        self.assertIs(group.elements[0].points[0], element.points[0])
+        self.assertEqual(len(group.nodes), 4)
+
+    def test_areas_form_functions(self):
+        group = mesh.ElementsGroup.from_arrays(self.nodes_coordinates, self.connectivity)
+        self.assertTrue(npy.allclose(group.areas(), [1., 1.]))
+        for form_functions, element in zip(group.form_functions(), group.elements):
+            self.assertTrue(npy.allclose(form_functions, [[*vector] for vector in element.form_functions]))
+
+        tetrahedrons = mesh.ElementsGroup.from_arrays(npy.array([[0., 0, 0], [1, 0, 0], [0, 2, 0], [0, 0, 3]]),
+                                                      npy.array([[0, 1, 2, 3]]))
+        self.assertAlmostEqual(tetrahedrons.volumes()[0], 1.)
+        self.assertTrue(npy.allclose(tetrahedrons.form_functions()[0],
+                                     tetrahedrons.elements[0].form_functions))
+
+    def test_node_to_elements(self):
+        group = mesh.ElementsGroup.from_arrays(self.nodes_coordinates, self.connectivity)
+        offsets, elements_indices = group.node_to_elements()
+        self.assertEqual(offsets.tolist(), [0, 2, 3, 5, 6])
+        self.assertEqual(elements_indices.tolist(), [0, 1, 0, 0, 1, 1])
+
+
+class TestMesh(unittest.TestCase):
+
+    def test_nodes_coordinates(self):
+        group1 = mesh.ElementsGroup.from_arrays(npy.array([[0., 0.], [1., 0.], [0., 1.]]), npy.array([[0, 1, 2]]))
+        group2 = mesh.ElementsGroup.from_arrays(npy.array([[1., 1.], [0., 1.], [1., 0.]]), npy.array([[2, 0, 1]]))
+        array_mesh = mesh.Mesh([group1, group2])
+        self.assertEqual(array_mesh.nodes_coordinates.tolist(), [[0., 0.], [0., 1.], [1., 0.], [1., 1.]])
+        self.assertEqual([connectivity.tolist() for connectivity in array_mesh.groups_connectivity],
+                         [[[0, 2, 1]], [[2, 3, 1]]])
+        self.assertEqual(array_mesh.node_to_index[mesh.Node2D(1., 1.)], 3)
+        self.assertEqual(array_mesh.bounding_rectangle(), (0., 1., 0., 1.))
+
+        offsets, elements_indices = array_mesh.node_to_elements()
+        self.assertEqual(elements_indices[offsets[2]:offsets[3]].tolist(), [0, 1])
+
+        objects_mesh = mesh.Mesh([mesh.ElementsGroup(list(group1.elements), name=''),
+                                  mesh.ElementsGroup(list(group2.elements), name='')])
+        self.assertFalse(objects_mesh.is_array_based())
+        self.assertEqual(set(objects_mesh.nodes), set(array_mesh.nodes))
+        self.assertEqual(objects_mesh.bounding_rectangle(), array_mesh.bounding_rectangle())
+
+    def test_delete_duplicated_nodes(self):
+        group1 = mesh.ElementsGroup.from_arrays(npy.array([[0., 0.], [1., 0.], [0., 1.]]), npy.array([[0, 1, 2]]))
+        group2 = mesh.ElementsGroup.from_arrays(npy.array([[1., 1.], [0., 1. + 1e-6], [1. + 1e-3, 0.]]),
+                                                npy.array([[2, 0, 1]]))
+        two_groups_mesh = mesh.Mesh([group1, group2])
+
+        nodes_indices, reference_indices = two_groups_mesh.nodes_correction_indices(0, tol=1e-4)
+        self.assertEqual(two_groups_mesh.nodes_coordinates[nodes_indices].tolist(), [[0., 1. + 1e-6]])
+        self.assertEqual(two_groups_mesh.nodes_coordinates[reference_indices].tolist(), [[0., 1.]])
+        self.assertEqual(two_groups_mesh.nodes_correction(0), {mesh.Node2D(0., 1. + 1e-6): mesh.Node2D(0., 1.)})
+
+        new_mesh = two_groups_mesh.delete_duplicated_nodes(0, tol=1e-4)
+        self.assertEqual(len(new_mesh.nodes_coordinates), 5)
+        self.assertEqual(new_mesh.elements_groups[1].elements[0].points[2], mesh.Node2D(0., 1.))
+        self.assertEqual(len(two_groups_mesh.delete_duplicated_nodes(0, tol=1e-2).nodes_coordinates), 4)
+        self.assertEqual(len(two_groups_mesh.nodes_correction(0, tol=1e-2)), 2)
+
+        linear_elements = mesh.ElementsGroup([mesh.LinearElement(mesh.Node2D(0., 1. + 1e-6), mesh.Node2D(-1., 1.),
+                                                                 volmdlr.Y2D)], name='')
+        self.assertIsNone(linear_elements.arrays_element_class())
+        new_mesh = mesh.Mesh([group1, linear_elements]).delete_duplicated_nodes(0)
+        self.assertIsInstance(new_mesh.elements_groups[1].elements[0], mesh.LinearElement)
+        self.assertEqual(new_mesh.elements_groups[1].elements[0].start, mesh.Node2D(0., 1.))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import volmdlr
+from volmdlr import step
+from volmdlr.core import VolumeModel
+from volmdlr.primitives3d import Block, Cylinder
+
+
+class TestStep(unittest.TestCase):
+    volume_model = VolumeModel([Block(volmdlr.OXYZ),
+                                Cylinder(volmdlr.Point3D(2., 0., 0.), volmdlr.X3D, 0.1, 1.)])
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(suffix='.step', delete=False) as file:
+            self.filepath = file.name
+        self.volume_model.to_step(self.filepath)
+
+    def tearDown(self):
+        os.remove(self.filepath)
+
+    def test_index(self):
+        index = step.StepIndex(b"ISO-10303-21;\nHEADER;\nFILE_NAME('#1=A;');\nENDSEC;\nDATA;\n"
+                               b"#1 = CARTESIAN_POINT('#5;',(0.,0.,\n1.));\n"
+                               b"#2 = VERTEX_POINT('',#1);\n"
+                               b"#3 = ( LENGTH_UNIT() NAMED_UNIT(*) SI_UNIT(.MILLI.,.METRE.) );\n"
+                               b"ENDSEC;\nEND-ISO-10303-21;\n")
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.name(1), 'CARTESIAN_POINT')
+        self.assertEqual(index.name(3), 'LENGTH_UNIT, NAMED_UNIT, SI_UNIT')
+        self.assertEqual(index.connections(), [(2, 1)])
+        self.assertEqual(index.function_references(2), [1])
+        self.assertNotIn(2, index._functions)
+        self.assertEqual(index[2].arg, ["''", '#1'])
+        self.assertEqual(index[1].arg, ["'#5;'", '(0.,0.,1.)'])
+        with self.assertRaises(KeyError):
+            index[4]
+
+    def test_to_volume_model(self):
+        with open(self.filepath, 'rb') as file:
+            stream_step = step.Step.from_stream(io.BytesIO(file.read()))
+        with open(self.filepath, 'r', encoding='ISO-8859-1') as file:
+            lines_step = step.Step(file.readlines())
+
+        for step_object in [step.Step.from_file(self.filepath), stream_step, lines_step]:
+            model = step_object.to_volume_model()
+            self.assertEqual(len(model.primitives), 2)
+            self.assertEqual([len(shell.faces) for shell in model.primitives], [6, 4])
+            self.assertEqual(step_object.instantiation_profile.counts['CLOSED_SHELL'], 2)
+            self.assertEqual(step_object.instantiation_profile.counts['ADVANCED_FACE'], 10)
+
+    def test_to_volume_model_workers(self):
+        step_object = step.Step.from_file(self.filepath)
+        model = step_object.to_volume_model(workers=2)
+        sequential_step_object = step.Step.from_file(self.filepath)
+        self.assertEqual(model, sequential_step_object.to_volume_model())
+        # Each entity is instantiated once, either in a worker or in the main process
+        self.assertEqual(step_object.instantiation_profile.counts,
+                         sequential_step_object.instantiation_profile.counts)
+
+        # A worker failing unexpectedly, here as its function can't be pickled, is warned about
+        step_object = step.Step.from_file(self.filepath)
+        with mock.patch.object(step, 'instantiate_step_functions', mock.Mock()):
+            with self.assertWarns(RuntimeWarning):
+                model = step_object.to_volume_model(workers=2)
+        self.assertEqual(model, sequential_step_object.to_volume_model())
+
+    def test_instantiation_profile_merge(self):
+        profile = step.InstantiationProfile()
+        profile.add('CLOSED_SHELL', 1.)
+        other_profile = step.InstantiationProfile()
+        other_profile.add('CLOSED_SHELL', 2.)
+        other_profile.add('ADVANCED_FACE', 0.5)
+        profile.merge(other_profile)
+        self.assertEqual(profile.counts, {'CLOSED_SHELL': 2, 'ADVANCED_FACE': 1})
+        self.assertEqual(profile.times, {'CLOSED_SHELL': 3., 'ADVANCED_FACE': 0.5})
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = step.StepCache(directory)
+            model = cache.volume_model_from_file(self.filepath)
+            cached_model = cache.volume_model_from_file(self.filepath)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(model, cached_model)
+            self.assertGreater(cache.size, 0)
+
+            cache.max_size = 0
+            cache.evict()
+            self.assertEqual(cache.size, 0)
+            cache.volume_model_from_file(self.filepath)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'POSIX permissions')
+    def test_cache_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': directory}):
+                cache = step.StepCache()
+            self.assertEqual(cache.directory, os.path.join(directory, 'volmdlr', 'step'))
+            self.assertEqual(os.stat(cache.directory).st_mode & 0o777, 0o700)
+
+            os.chmod(cache.directory, 0o777)
+            with self.assertRaises(PermissionError):
+                step.StepCache(cache.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import struct
+import unittest
+from unittest import mock
+
+import numpy as npy
+
+import volmdlr as vm
+from volmdlr import faces, stl
+
+
+class TestStl(unittest.TestCase):
+    point1 = vm.Point3D(0., 0., 0.)
+    point2 = vm.Point3D(1., 0., 0.)
+    point3 = vm.Point3D(0., 1., 0.)
+    point4 = vm.Point3D(0., 0., 1.)
+    triangles = [faces.Triangle3D(point1, point3, point2),
+                 faces.Triangle3D(point1, point2, point4),
+                 faces.Triangle3D(point1, point4, point3),
+                 faces.Triangle3D(point2, point3, point4)]
+
+    def binary_stream(self, with_degenerated_triangle=False):
+        stream = io.BytesIO()
+        stl.Stl(self.triangles, name='tetrahedron').save_to_stream(stream, distance_multiplier=1000)
+        if with_degenerated_triangle:
+            stream.seek(80)
+            stream.write(struct.pack('<I', len(self.triangles) + 1))
+            stream.seek(0, 2)
+            stream.write(struct.pack('<12fH', 0., 0., 0., 0., 0., 0., 1000., 0., 0., 1000., 0., 0., 0))
+        return stream
+
+    def test_from_binary_stream(self):
+        stl_model = stl.Stl.from_binary_stream(self.binary_stream(with_degenerated_triangle=True))
+        self.assertEqual(stl_model.vertices.shape, (4, 3))
+        self.assertEqual(stl_model.faces.shape, (4, 3))
+        self.assertEqual(stl_model.faces.dtype, npy.int32)
+        self.assertTrue(stl_model.name.startswith('tetrahedron'))
+        self.assertIsNone(stl_model._triangles)
+
+        self.assertEqual(len(stl_model.triangles), 4)
+        for triangle, original_triangle in zip(stl_model.triangles, self.triangles):
+            for point, original_point in zip(triangle.points, original_triangle.points):
+                self.assertTrue(point.is_close(original_point))
+
+    def test_save_to_stream(self):
+        stl_model = stl.Stl.from_binary_stream(self.binary_stream())
+        stream = io.BytesIO()
+        stl_model.save_to_stream(stream, distance_multiplier=1000)
+        self.assertEqual(stream.getvalue(), self.binary_stream().getvalue())
+
+    def test_mesh_data(self):
+        stl_model = stl.Stl(self.triangles)
+        with mock.patch.object(stl, '_weld_facets_points', wraps=stl._weld_facets_points) as weld:
+            vertices, triangles = stl_model.mesh_data()
+            stl_model.save_to_stream(io.BytesIO())
+        self.assertEqual(weld.call_count, 2)
+        self.assertEqual((vertices.shape, triangles.shape), ((4, 3), (4, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
 """
 Unittest for ClosedPolygon2D class
 """
+import math
 import unittest
 
+import numpy as npy
+
 import volmdlr
 import volmdlr.display as vmd
 import volmdlr.wires as vmw
@@ -57,6 +60,54 @@ class TestClosedPolygon2D(unittest.TestCase):
         self.assertFalse(polygon.point_belongs(point))
         self.assertFalse(polygon.point_belongs(point, include_edge_points=True))
 
+    def test_points_belong(self):
+        polygon = vmw.ClosedPolygon2D([volmdlr.Point2D(0, 0), volmdlr.Point2D(1, 2), volmdlr.Point2D(3, 0),
+                                       volmdlr.Point2D(2, -2), volmdlr.Point2D(0, -1)])
+        points = [volmdlr.Point2D(1, 1), volmdlr.Point2D(0.5, 1), volmdlr.Point2D(2, -2), volmdlr.Point2D(4, 0)]
+        self.assertEqual(polygon.points_belong(points).tolist(), [True, False, False, False])
+        self.assertEqual(polygon.points_belong(points, include_edge_points=True).tolist(),
+                         [True, True, True, False])
+
+        # Polygons with many vertices distribute their edges in bands
+        angles = npy.linspace(0, 2 * math.pi, 500, endpoint=False)
+        radii = 1 + 0.3 * npy.sin(7 * angles)
+        polygon = vmw.ClosedPolygon2D([volmdlr.Point2D(radius * math.cos(angle), radius * math.sin(angle))
+                                       for radius, angle in zip(radii, angles)])
+        points = npy.random.uniform(-1.5, 1.5, (200, 2))
+        self.assertEqual(polygon.points_belong(points).tolist(),
+                         [polygon.point_belongs(volmdlr.Point2D(*point)) for point in points])
+
+    def test_self_intersections(self):
+        polygon = vmw.ClosedPolygon2D([volmdlr.Point2D(0, 0), volmdlr.Point2D(1, 0), volmdlr.Point2D(1, 1),
+                                       volmdlr.Point2D(0, 1)])
+        self.assertEqual(polygon.self_intersections(), [])
+        self.assertFalse(polygon.self_intersects()[0])
+
+        # Bow tie, with a repeated point
+        polygon = vmw.ClosedPolygon2D([volmdlr.Point2D(0, 0), volmdlr.Point2D(1, 1), volmdlr.Point2D(1, 1),
+                                       volmdlr.Point2D(1, 0), volmdlr.Point2D(0, 1)])
+        self.assertEqual(polygon.self_intersections(), [(0, 3)])
+        intersects, line1, line2 = polygon.self_intersects()
+        self.assertTrue(intersects)
+        self.assertEqual(line1.start, volmdlr.Point2D(0, 0))
+        self.assertEqual(line2.start, volmdlr.Point2D(1, 0))
+
+        # Touching vertex and overlapping consecutive edges
+        polygon = vmw.ClosedPolygon2D([volmdlr.Point2D(0, 0), volmdlr.Point2D(2, 0), volmdlr.Point2D(1, 1),
+                                       volmdlr.Point2D(2, 2), volmdlr.Point2D(0, 2), volmdlr.Point2D(2, 0)])
+        self.assertEqual(polygon.self_intersections(), [(0, 4), (0, 5), (1, 4), (1, 5), (2, 4)])
+
+        angles = npy.linspace(0, 2 * math.pi, 2000, endpoint=False)
+        radii = 1 + 0.3 * npy.sin(40 * angles)
+        points = [volmdlr.Point2D(radius * math.cos(angle), radius * math.sin(angle))
+                  for radius, angle in zip(radii, angles)]
+        self.assertEqual(vmw.ClosedPolygon2D(points).self_intersections(), [])
+        points[100] = volmdlr.Point2D(0, 2)
+        intersections = vmw.ClosedPolygon2D(points).self_intersections()
+        self.assertEqual(len(intersections), 22)
+        self.assertEqual(intersections[:2], [(99, 126), (99, 148)])
+        self.assertEqual(intersections[-1], (100, 367))
+
 
 if __name__ == '__main__':
     unittest.main()
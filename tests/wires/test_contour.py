@@ -1,8 +1,10 @@
 """
 Unit tests for volmdlr.wires.Contour
 """
+import random
 import unittest
 
+import volmdlr.edges
 import volmdlr.wires
 
 
@@ -19,6 +21,30 @@ class TestContour(unittest.TestCase):
         self.assertFalse(contour1.is_overlapping(contour2))
         self.assertTrue(contour1.is_overlapping(contour3))
 
+    def test_contours_from_edges(self):
+        edges = []
+        for x_offset in (0., 2.):
+            points = [volmdlr.Point2D(x_offset, 0), volmdlr.Point2D(x_offset + 1, 0),
+                      volmdlr.Point2D(x_offset + 1, 1), volmdlr.Point2D(x_offset, 1)]
+            for i, point in enumerate(points):
+                edge = volmdlr.edges.LineSegment2D(point, points[(i + 1) % 4])
+                edges.append(edge.reverse() if i % 2 else edge)
+        random.Random(0).shuffle(edges)
+
+        contours = volmdlr.wires.Contour2D.contours_from_edges(edges)
+        self.assertEqual(len(contours), 2)
+        for contour in contours:
+            self.assertEqual(len(contour.primitives), 4)
+            self.assertTrue(contour.is_ordered())
+            self.assertAlmostEqual(contour.area(), 1.)
+
+    def test_points_hash_grid(self):
+        grid = volmdlr.wires.PointsHashGrid(1e-6)
+        points = [volmdlr.Point2D(0, 0), volmdlr.Point2D(1, 0), volmdlr.Point2D(0, 0)]
+        self.assertEqual([grid.add(point) for point in points], [0, 1, 2])
+        self.assertEqual(grid.close_points(volmdlr.Point2D(1e-7, 0), 1e-6), [0, 2])
+        self.assertEqual(grid.close_points(volmdlr.Point2D(0.5, 0), 1e-6), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ from functools import lru_cache
 from math import factorial
 
 import cython
+import numpy as npy
 
 
 @lru_cache(maxsize=10000)
@@ -275,3 +276,227 @@ def rational_derivatives(dict datadict, tuple parpos, int deriv_order=0):
             SKL[k][li][:] = res
     # Return S(u,v) derivatives
     return SKL
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int find_span_binsearch(int degree, double[:] knot_vector, int num_ctrlpts, double knot):
+    """
+    Finds the span of a single knot over the knot vector using binary search (Algorithm A2.1).
+    """
+    cdef int low = degree
+    cdef int high = num_ctrlpts
+    cdef int mid
+    if knot >= knot_vector[num_ctrlpts]:
+        return num_ctrlpts - 1
+    while high - low > 1:
+        mid = (low + high) // 2
+        if knot < knot_vector[mid]:
+            high = mid
+        else:
+            low = mid
+    return low
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void typed_basis_function_ders(int degree, double[:] knot_vector, int span, double knot, int order,
+                                    double[:, :] ndu, double[:, :] a, double[:] left, double[:] right,
+                                    double[:, :] ders):
+    """
+    Computes derivatives of the basis functions in preallocated arrays (Algorithm A2.3).
+    """
+    cdef int j, k, r, s1, s2, j1, j2, pk, rk
+    cdef double saved, temp, d, f
+
+    ndu[0, 0] = 1.0
+    for j in range(1, degree + 1):
+        left[j] = knot - knot_vector[span + 1 - j]
+        right[j] = knot_vector[span + j] - knot
+        saved = 0.0
+        for r in range(j):
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = ndu[r, j - 1] / ndu[j, r]
+            ndu[r, j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j, j] = saved
+
+    for j in range(degree + 1):
+        ders[0, j] = ndu[j, degree]
+
+    for r in range(degree + 1):
+        s1 = 0
+        s2 = 1
+        a[0, 0] = 1.0
+        for k in range(1, order + 1):
+            d = 0.0
+            rk = r - k
+            pk = degree - k
+            if r >= k:
+                a[s2, 0] = a[s1, 0] / ndu[pk + 1, rk]
+                d = a[s2, 0] * ndu[rk, pk]
+            if rk >= -1:
+                j1 = 1
+            else:
+                j1 = -rk
+            if r - 1 <= pk:
+                j2 = k - 1
+            else:
+                j2 = degree - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = (a[s1, j] - a[s1, j - 1]) / ndu[pk + 1, rk + j]
+                d += a[s2, j] * ndu[rk + j, pk]
+            if r <= pk:
+                a[s2, k] = -a[s1, k - 1] / ndu[pk + 1, r]
+                d += a[s2, k] * ndu[r, pk]
+            ders[k, r] = d
+            j = s1
+            s1 = s2
+            s2 = j
+
+    f = degree
+    for k in range(1, order + 1):
+        for j in range(degree + 1):
+            ders[k, j] *= f
+        f *= degree - k
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def curve_derivatives(int degree, double[:] knot_vector, double[:, :] ctrlpts, double[:] parameters,
+                      int deriv_order=0):
+    """
+    Evaluates a B-spline curve and its derivatives at several parameters (Algorithm A3.2).
+
+    Rational curves are evaluated by giving the weighted control points in homogeneous coordinates.
+
+    :param degree: degree of the curve
+    :param knot_vector: the knot vector, as an array
+    :param ctrlpts: (number of control points, dimension) array of control points
+    :param parameters: the parameters where the curve is evaluated
+    :param deriv_order: the maximum order of the derivatives
+    :return: (deriv_order + 1, number of parameters, dimension) array of derivatives
+    """
+    cdef int num_ctrlpts = ctrlpts.shape[0]
+    cdef int dimension = ctrlpts.shape[1]
+    cdef int order = min(degree, deriv_order)
+    cdef int ip, k, j, i, span
+    cdef double basis
+
+    result = npy.zeros((deriv_order + 1, parameters.shape[0], dimension))
+    cdef double[:, :, :] ck = result
+    cdef double[:, :] ders = npy.zeros((order + 1, degree + 1))
+    cdef double[:, :] ndu = npy.zeros((degree + 1, degree + 1))
+    cdef double[:, :] a = npy.zeros((2, degree + 1))
+    cdef double[:] left = npy.zeros(degree + 1)
+    cdef double[:] right = npy.zeros(degree + 1)
+
+    for ip in range(parameters.shape[0]):
+        span = find_span_binsearch(degree, knot_vector, num_ctrlpts, parameters[ip])
+        typed_basis_function_ders(degree, knot_vector, span, parameters[ip], order, ndu, a, left, right, ders)
+        for k in range(order + 1):
+            for j in range(degree + 1):
+                basis = ders[k, j]
+                for i in range(dimension):
+                    ck[k, ip, i] += basis * ctrlpts[span - degree + j, i]
+    return result
+
+
+def basis_functions_derivatives(int degree, double[:] knot_vector, int num_ctrlpts, double[:] parameters,
+                                int deriv_order=0):
+    """
+    Computes the knot spans and the derivatives of the non-vanishing basis functions at several parameters.
+
+    :param degree: degree of the basis functions
+    :param knot_vector: the knot vector, as an array
+    :param num_ctrlpts: number of control points
+    :param parameters: the parameters where the basis functions are evaluated
+    :param deriv_order: the maximum order of the derivatives
+    :return: (number of parameters,) array of spans and (number of parameters, deriv_order + 1, degree + 1) array
+        of basis functions derivatives
+    """
+    cdef int order = min(degree, deriv_order)
+    cdef int ip, k, j
+
+    spans = npy.zeros(parameters.shape[0], dtype=npy.intc)
+    basis = npy.zeros((parameters.shape[0], deriv_order + 1, degree + 1))
+    cdef int[:] spans_view = spans
+    cdef double[:, :, :] basis_view = basis
+    cdef double[:, :] ders = npy.zeros((order + 1, degree + 1))
+    cdef double[:, :] ndu = npy.zeros((degree + 1, degree + 1))
+    cdef double[:, :] a = npy.zeros((2, degree + 1))
+    cdef double[:] left = npy.zeros(degree + 1)
+    cdef double[:] right = npy.zeros(degree + 1)
+
+    for ip in range(parameters.shape[0]):
+        spans_view[ip] = find_span_binsearch(degree, knot_vector, num_ctrlpts, parameters[ip])
+        typed_basis_function_ders(degree, knot_vector, spans_view[ip], parameters[ip], order, ndu, a, left, right,
+                                  ders)
+        for k in range(order + 1):
+            for j in range(degree + 1):
+                basis_view[ip, k, j] = ders[k, j]
+    return spans, basis
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def surface_derivatives(int degree_u, int degree_v, double[:] knot_vector_u, double[:] knot_vector_v,
+                        double[:, :, :] ctrlpts, double[:] u_parameters, double[:] v_parameters,
+                        int deriv_order=0):
+    """
+    Evaluates a B-spline surface and its derivatives at several (u, v) parameters (Algorithm A3.6).
+
+    Spans and basis functions are computed once per distinct u and per distinct v value, so that points sharing a
+    row or a column of a grid reuse them. Rational surfaces are evaluated by giving the weighted control points in
+    homogeneous coordinates.
+
+    :param degree_u: degree of the surface in the u direction
+    :param degree_v: degree of the surface in the v direction
+    :param knot_vector_u: the knot vector in the u direction, as an array
+    :param knot_vector_v: the knot vector in the v direction, as an array
+    :param ctrlpts: (number of control points in u, number of control points in v, dimension) array
+    :param u_parameters: the u parameters where the surface is evaluated
+    :param v_parameters: the v parameters where the surface is evaluated
+    :param deriv_order: the maximum order of the derivatives
+    :return: (deriv_order + 1, deriv_order + 1, number of parameters, dimension) array of derivatives, where
+        [k, l] is the derivative k times with respect to u and l times with respect to v
+    """
+    cdef int dimension = ctrlpts.shape[2]
+    cdef int ip, k, l, r, s, i, iu, iv, span_u, span_v
+    cdef double basis_u, basis
+
+    unique_u, u_inverse = npy.unique(npy.asarray(u_parameters), return_inverse=True)
+    unique_v, v_inverse = npy.unique(npy.asarray(v_parameters), return_inverse=True)
+    spans_u, basis_functions_u = basis_functions_derivatives(degree_u, knot_vector_u, ctrlpts.shape[0], unique_u,
+                                                             deriv_order)
+    spans_v, basis_functions_v = basis_functions_derivatives(degree_v, knot_vector_v, ctrlpts.shape[1], unique_v,
+                                                             deriv_order)
+    cdef int[:] u_indices = u_inverse.ravel().astype(npy.intc)
+    cdef int[:] v_indices = v_inverse.ravel().astype(npy.intc)
+    cdef int[:] spans_u_view = spans_u
+    cdef int[:] spans_v_view = spans_v
+    cdef double[:, :, :] nu = basis_functions_u
+    cdef double[:, :, :] nv = basis_functions_v
+    cdef int order_u = min(degree_u, deriv_order)
+    cdef int order_v = min(degree_v, deriv_order)
+
+    result = npy.zeros((deriv_order + 1, deriv_order + 1, u_parameters.shape[0], dimension))
+    cdef double[:, :, :, :] skl = result
+
+    for ip in range(u_parameters.shape[0]):
+        iu = u_indices[ip]
+        iv = v_indices[ip]
+        span_u = spans_u_view[iu] - degree_u
+        span_v = spans_v_view[iv] - degree_v
+        for k in range(order_u + 1):
+            for l in range(order_v + 1):
+                for r in range(degree_u + 1):
+                    basis_u = nu[iu, k, r]
+                    if basis_u == 0.:
+                        continue
+                    for s in range(degree_v + 1):
+                        basis = basis_u * nv[iv, l, s]
+                        for i in range(dimension):
+                            skl[k, l, ip, i] += basis * ctrlpts[span_u + r, span_v + s, i]
+    return result
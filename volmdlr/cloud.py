@@ -273,11 +273,8 @@ class PointCloud3D(dc.DessiaObject):
             extended_points.extend(sphere_primitive.triangulation().points)
 
         for sphere in spheres:
-            clean_extended_zone = []
-            for point in extended_points:
-                if not sphere.point_belongs(point):
-                    clean_extended_zone.append(point)
-            extended_points = clean_extended_zone
+            extended_points = [point for point, inside in zip(extended_points, sphere.points_belong(extended_points))
+                               if not inside]
 
         return extended_points
 
@@ -4,6 +4,8 @@
 Base classes.
 """
 
+import heapq
+import math
 import os
 import tempfile
 import warnings
@@ -17,6 +19,8 @@ import dessia_common.files as dcf
 # import gmsh
 import matplotlib.pyplot as plt
 import numpy as npy
+from trimesh import Trimesh
+from trimesh.proximity import closest_point
 
 import volmdlr
 import volmdlr.templates
@@ -296,19 +300,41 @@ class Primitive3D(dc.PhysicalObject):
         raise NotImplementedError(
             f"triangulation method should be implemented on class {self.__class__.__name__}")
 
-    def babylon_meshes(self):
+    def babylon_meshes(self, binary: bool = False, quantize: bool = False, compress: bool = False):
+        """
+        Gets the babylonjs meshes of the primitive.
+
+        :param binary: whether to encode the mesh as base64 typed arrays instead of lists of numbers,
+            see volmdlr.display.babylon_binary_data
+        :param quantize: whether to quantize the positions on 16 bits, for a binary mesh
+        :param compress: whether to compress the arrays with deflate, for a binary mesh
+        """
         mesh = self.triangulation()
         if mesh is None:
             return []
-        positions, indices = mesh.to_babylon()
-
-        babylon_mesh = {'positions': positions,
-                        'indices': indices
-                        }
+        if binary:
+            babylon_mesh = {'binary': mesh.to_babylon_binary(quantize=quantize, compress=compress)}
+        else:
+            positions, indices = mesh.to_babylon()
+            babylon_mesh = {'positions': positions,
+                            'indices': indices
+                            }
         babylon_mesh.update(self.babylon_param())
         return [babylon_mesh]
 
 
+def primitive_babylon_meshes(primitive, binary: bool = False, quantize: bool = False, compress: bool = False):
+    """
+    Gets the babylonjs meshes of a primitive, see Primitive3D.babylon_meshes.
+
+    The binary options are only given for binary meshes, so that babylon_meshes overrides without these arguments
+    still work for the default meshes.
+    """
+    if binary:
+        return primitive.babylon_meshes(binary=True, quantize=quantize, compress=compress)
+    return primitive.babylon_meshes()
+
+
 class CompositePrimitive3D(CompositePrimitive, Primitive3D):
     """
     A collection of simple primitives3D.
@@ -868,6 +894,336 @@ class BoundingBox(dc.DessiaObject):
         return (dx ** 2 + dy ** 2 + dz ** 2) ** 0.5
 
 
+class BoundingVolumeHierarchy:
+    """
+    An axis aligned bounding box tree over a set of objects.
+
+    The objects are only known by their index and bounding box: queries return the indices of the objects whose
+    boxes may satisfy them, exact tests are left to the caller. Nodes are stored in flat arrays, each node covering
+    the objects ``order[start:end]`` of its range, leaves having -1 as children.
+
+    :param mins: The lower corners of the objects bounding boxes, array of shape (n, 3).
+    :type mins: numpy.ndarray
+    :param maxs: The upper corners of the objects bounding boxes, array of shape (n, 3).
+    :type maxs: numpy.ndarray
+    :param leaf_size: The maximum number of objects in a leaf.
+    :type leaf_size: int
+    """
+
+    def __init__(self, mins, maxs, leaf_size: int = 4):
+        self.mins = npy.asarray(mins, dtype=float).reshape(-1, 3)
+        self.maxs = npy.asarray(maxs, dtype=float).reshape(-1, 3)
+        self._build(max(int(leaf_size), 1))
+
+    def __len__(self):
+        return len(self.mins)
+
+    @classmethod
+    def from_bounding_boxes(cls, bounding_boxes: List[BoundingBox], leaf_size: int = 4):
+        """
+        Builds a bounding volume hierarchy from a list of bounding boxes.
+
+        :param bounding_boxes: The bounding boxes of the objects, the index in the list is the object index.
+        :type bounding_boxes: List[BoundingBox]
+        :param leaf_size: The maximum number of objects in a leaf.
+        :type leaf_size: int
+        :return: The bounding volume hierarchy.
+        :rtype: BoundingVolumeHierarchy
+        """
+        bounds = npy.array([(bbox.xmin, bbox.ymin, bbox.zmin, bbox.xmax, bbox.ymax, bbox.zmax)
+                            for bbox in bounding_boxes], dtype=float).reshape(-1, 6)
+        return cls(bounds[:, :3], bounds[:, 3:], leaf_size=leaf_size)
+
+    def _build(self, leaf_size: int):
+        """
+        Top-down construction: each node is split at the median of the objects centers along its longest axis.
+
+        """
+        centers = 0.5 * (self.mins + self.maxs)
+        order = npy.arange(len(self.mins))
+        node_mins, node_maxs, starts, ends, lefts, rights = [], [], [], [], [], []
+
+        def new_node(start, end):
+            indices = order[start:end]
+            node_mins.append(self.mins[indices].min(axis=0))
+            node_maxs.append(self.maxs[indices].max(axis=0))
+            starts.append(start)
+            ends.append(end)
+            lefts.append(-1)
+            rights.append(-1)
+            return len(starts) - 1
+
+        stack = [new_node(0, len(order))] if len(order) else []
+        while stack:
+            node = stack.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= leaf_size:
+                continue
+            indices = order[start:end]
+            node_centers = centers[indices]
+            axis = npy.argmax(node_centers.max(axis=0) - node_centers.min(axis=0))
+            middle = (end - start) // 2
+            order[start:end] = indices[npy.argpartition(node_centers[:, axis], middle)]
+            lefts[node] = new_node(start, start + middle)
+            rights[node] = new_node(start + middle, end)
+            stack.extend((lefts[node], rights[node]))
+
+        self.order = order
+        self.node_mins = npy.array(node_mins, dtype=float).reshape(-1, 3)
+        self.node_maxs = npy.array(node_maxs, dtype=float).reshape(-1, 3)
+        self.node_ranges = npy.array([starts, ends], dtype=int).T.reshape(-1, 2)
+        self.node_children = npy.array([lefts, rights], dtype=int).T.reshape(-1, 2)
+
+    def node_objects(self, node):
+        """Indices of the objects covered by a node."""
+        return self.order[self.node_ranges[node, 0]:self.node_ranges[node, 1]]
+
+    def _query(self, boxes_test):
+        """
+        Returns the sorted indices of the objects whose boxes pass a test, pruning the nodes that do not pass it.
+
+        :param boxes_test: A function taking arrays of lower and upper corners, of shape (3,) or (k, 3), and
+            returning whether each box passes the test.
+        """
+        indices = []
+        stack = [0] if len(self.node_ranges) else []
+        while stack:
+            node = stack.pop()
+            if not boxes_test(self.node_mins[node], self.node_maxs[node]):
+                continue
+            if self.node_children[node, 0] == -1:
+                objects = self.node_objects(node)
+                indices.extend(objects[boxes_test(self.mins[objects], self.maxs[objects])])
+            else:
+                stack.extend((self.node_children[node, 1], self.node_children[node, 0]))
+        return npy.sort(npy.array(indices, dtype=int))
+
+    def box_query(self, box_min, box_max, tol: float = 0.):
+        """
+        Returns the indices of the objects whose bounding boxes intersect a given box.
+
+        :param box_min: The lower corner of the box.
+        :param box_max: The upper corner of the box.
+        :param tol: The boxes are considered intersecting if they are closer than tol along each axis.
+        :return: The sorted indices of the objects.
+        :rtype: numpy.ndarray
+        """
+        box_min = npy.array(tuple(box_min), dtype=float) - tol
+        box_max = npy.array(tuple(box_max), dtype=float) + tol
+
+        def boxes_test(mins, maxs):
+            return ((mins <= box_max) & (maxs >= box_min)).all(axis=-1)
+
+        return self._query(boxes_test)
+
+    def boxes_query(self, boxes_mins, boxes_maxs, tol: float = 0.):
+        """
+        Batch version of box_query: all the boxes are traversed at once, level by level, with array operations.
+
+        :param boxes_mins: The lower corners of the query boxes, array of shape (m, 3).
+        :param boxes_maxs: The upper corners of the query boxes, array of shape (m, 3).
+        :param tol: The boxes are considered intersecting if they are closer than tol along each axis.
+        :return: An array of shape (k, 2) of (query box index, object index) pairs, in lexicographic order.
+        :rtype: numpy.ndarray
+        """
+        boxes_mins = npy.asarray(boxes_mins, dtype=float).reshape(-1, 3) - tol
+        boxes_maxs = npy.asarray(boxes_maxs, dtype=float).reshape(-1, 3) + tol
+        queries = npy.arange(len(boxes_mins)) if len(self.node_ranges) else npy.zeros(0, dtype=int)
+        nodes = npy.zeros(len(queries), dtype=int)
+        pairs = []
+        while len(queries):
+            intersecting = ((self.node_mins[nodes] <= boxes_maxs[queries])
+                            & (self.node_maxs[nodes] >= boxes_mins[queries])).all(axis=1)
+            queries, nodes = queries[intersecting], nodes[intersecting]
+            leaves = self.node_children[nodes, 0] == -1
+            leaves_queries, leaves_nodes = queries[leaves], nodes[leaves]
+            counts = self.node_ranges[leaves_nodes, 1] - self.node_ranges[leaves_nodes, 0]
+            positions = (npy.repeat(self.node_ranges[leaves_nodes, 0] - npy.cumsum(counts) + counts, counts)
+                         + npy.arange(counts.sum()))
+            objects = self.order[positions]
+            objects_queries = npy.repeat(leaves_queries, counts)
+            intersecting = ((self.mins[objects] <= boxes_maxs[objects_queries])
+                            & (self.maxs[objects] >= boxes_mins[objects_queries])).all(axis=1)
+            pairs.append(npy.column_stack((objects_queries[intersecting], objects[intersecting])))
+            queries = npy.repeat(queries[~leaves], 2)
+            nodes = self.node_children[nodes[~leaves]].ravel()
+        pairs = npy.concatenate(pairs) if pairs else npy.zeros((0, 2), dtype=int)
+        return pairs[npy.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    def segment_query(self, start, end, tol: float = 0., infinite: bool = False):
+        """
+        Returns the indices of the objects whose bounding boxes are crossed by a segment, or a line.
+
+        :param start: The start point of the segment.
+        :param end: The end point of the segment.
+        :param tol: Tolerance by which the boxes are enlarged.
+        :param infinite: If True, the query is made with the line passing through start and end.
+        :return: The sorted indices of the objects.
+        :rtype: numpy.ndarray
+        """
+        start = npy.array(tuple(start), dtype=float)
+        direction = npy.array(tuple(end), dtype=float) - start
+        parallel = direction == 0.
+        with npy.errstate(divide='ignore'):
+            inverse_direction = 1 / direction
+        parameter_min, parameter_max = (-npy.inf, npy.inf) if infinite else (0., 1.)
+
+        def boxes_test(mins, maxs):
+            with npy.errstate(invalid='ignore'):
+                parameters1 = (mins - tol - start) * inverse_direction
+                parameters2 = (maxs + tol - start) * inverse_direction
+            inside = (start >= mins - tol) & (start <= maxs + tol)
+            entries = npy.where(parallel, npy.where(inside, -npy.inf, npy.inf),
+                                npy.minimum(parameters1, parameters2))
+            exits = npy.where(parallel, npy.where(inside, npy.inf, -npy.inf),
+                              npy.maximum(parameters1, parameters2))
+            return (npy.maximum(entries.max(axis=-1), parameter_min)
+                    <= npy.minimum(exits.min(axis=-1), parameter_max))
+
+        return self._query(boxes_test)
+
+    @staticmethod
+    def _point_boxes_distances(point, mins, maxs):
+        """
+        Distances of a point to boxes, 0 for the boxes containing the point.
+
+        """
+        return npy.linalg.norm(npy.maximum(npy.maximum(mins - point, point - maxs), 0.), axis=-1)
+
+    @staticmethod
+    def _boxes_distances(mins1, maxs1, mins2, maxs2):
+        """
+        Distances between boxes, 0 for the overlapping ones. Arrays are broadcast against each other.
+
+        """
+        return npy.linalg.norm(npy.maximum(npy.maximum(mins1 - maxs2, mins2 - maxs1), 0.), axis=-1)
+
+    def nearest(self, point, distance_function):
+        """
+        Finds the object closest to a point, by branch and bound on the boxes distances.
+
+        :param point: The point.
+        :param distance_function: A function taking an object index and returning a tuple whose first element is
+            the distance of the object to the point.
+        :return: The index of the closest object and the tuple returned by distance_function for it, or
+            (None, None) if the hierarchy is empty.
+        """
+        point = npy.array(tuple(point), dtype=float)
+        best_index, best_result, best_distance = None, None, npy.inf
+        if len(self.node_ranges) == 0:
+            return best_index, best_result
+        heap = [(float(self._point_boxes_distances(point, self.node_mins[0], self.node_maxs[0])), 0)]
+        while heap:
+            box_distance, node = heapq.heappop(heap)
+            if box_distance >= best_distance:
+                break
+            if self.node_children[node, 0] == -1:
+                objects = self.node_objects(node)
+                objects_distances = self._point_boxes_distances(point, self.mins[objects], self.maxs[objects])
+                for argument in npy.argsort(objects_distances, kind='stable'):
+                    if objects_distances[argument] >= best_distance:
+                        break
+                    result = distance_function(int(objects[argument]))
+                    if result[0] < best_distance:
+                        best_index, best_result, best_distance = int(objects[argument]), result, result[0]
+            else:
+                for child in self.node_children[node]:
+                    child_distance = float(self._point_boxes_distances(point, self.node_mins[child],
+                                                                       self.node_maxs[child]))
+                    if child_distance < best_distance:
+                        heapq.heappush(heap, (child_distance, child))
+        return best_index, best_result
+
+    def _children_pairs(self, other, node1, node2):
+        """
+        Splits a pair of nodes of two hierarchies, descending in the non leaf node with the most objects.
+
+        """
+        size1 = self.node_ranges[node1, 1] - self.node_ranges[node1, 0]
+        size2 = other.node_ranges[node2, 1] - other.node_ranges[node2, 0]
+        if other.node_children[node2, 0] == -1 or (self.node_children[node1, 0] != -1 and size1 >= size2):
+            return [(self.node_children[node1, 0], node2), (self.node_children[node1, 1], node2)]
+        return [(node1, other.node_children[node2, 0]), (node1, other.node_children[node2, 1])]
+
+    def pairs(self, other: 'BoundingVolumeHierarchy', tol: float = 0.):
+        """
+        Returns the pairs of objects of two hierarchies whose bounding boxes intersect.
+
+        :param other: The other bounding volume hierarchy.
+        :param tol: The boxes are considered intersecting if they are closer than tol along each axis.
+        :return: An array of shape (k, 2) of (index in self, index in other) pairs, in lexicographic order.
+        :rtype: numpy.ndarray
+        """
+        def boxes_test(mins1, maxs1, mins2, maxs2):
+            return ((mins1 <= maxs2 + tol) & (mins2 <= maxs1 + tol)).all(axis=-1)
+
+        pairs = []
+        stack = [(0, 0)] if len(self.node_ranges) and len(other.node_ranges) else []
+        while stack:
+            node1, node2 = stack.pop()
+            if not boxes_test(self.node_mins[node1], self.node_maxs[node1],
+                              other.node_mins[node2], other.node_maxs[node2]):
+                continue
+            if self.node_children[node1, 0] == -1 and other.node_children[node2, 0] == -1:
+                objects1 = self.node_objects(node1)
+                objects2 = other.node_objects(node2)
+                intersecting = boxes_test(self.mins[objects1][:, None], self.maxs[objects1][:, None],
+                                          other.mins[objects2][None, :], other.maxs[objects2][None, :])
+                arguments1, arguments2 = npy.nonzero(intersecting)
+                pairs.extend(zip(objects1[arguments1], objects2[arguments2]))
+            else:
+                stack.extend(self._children_pairs(other, node1, node2))
+        pairs = npy.array(pairs, dtype=int).reshape(-1, 2)
+        return pairs[npy.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    def nearest_pair(self, other: 'BoundingVolumeHierarchy', distance_function):
+        """
+        Finds the closest pair of objects of two hierarchies, by branch and bound on the boxes distances.
+
+        The search stops as soon as a pair at distance 0 is found.
+
+        :param other: The other bounding volume hierarchy.
+        :param distance_function: A function taking an index in self and an index in other and returning a tuple
+            whose first element is the distance between the two objects.
+        :return: The indices of the closest pair and the tuple returned by distance_function for it, or
+            (None, None, None) if one of the hierarchies is empty.
+        """
+        best_pair, best_result, best_distance = (None, None), None, npy.inf
+        if len(self.node_ranges) == 0 or len(other.node_ranges) == 0:
+            return None, None, None
+
+        def nodes_distance(node1, node2):
+            return float(self._boxes_distances(self.node_mins[node1], self.node_maxs[node1],
+                                               other.node_mins[node2], other.node_maxs[node2]))
+
+        heap = [(nodes_distance(0, 0), 0, 0)]
+        while heap:
+            box_distance, node1, node2 = heapq.heappop(heap)
+            if box_distance >= best_distance:
+                break
+            if self.node_children[node1, 0] == -1 and other.node_children[node2, 0] == -1:
+                objects1 = self.node_objects(node1)
+                objects2 = other.node_objects(node2)
+                distances = self._boxes_distances(self.mins[objects1][:, None], self.maxs[objects1][:, None],
+                                                  other.mins[objects2][None, :], other.maxs[objects2][None, :])
+                for argument in npy.argsort(distances, axis=None, kind='stable'):
+                    argument1, argument2 = divmod(int(argument), len(objects2))
+                    if distances[argument1, argument2] >= best_distance:
+                        break
+                    index1, index2 = int(objects1[argument1]), int(objects2[argument2])
+                    result = distance_function(index1, index2)
+                    if result[0] < best_distance:
+                        best_pair, best_result, best_distance = (index1, index2), result, result[0]
+                        if best_distance == 0.:
+                            return index1, index2, best_result
+            else:
+                for child1, child2 in self._children_pairs(other, node1, node2):
+                    child_distance = nodes_distance(child1, child2)
+                    if child_distance < best_distance:
+                        heapq.heappush(heap, (child_distance, child1, child2))
+        return best_pair[0], best_pair[1], best_result
+
+
 class VolumeModel(dc.PhysicalObject):
     """
     A class containing one or several :class:`volmdlr.core.Primitive3D`.
@@ -1055,17 +1411,20 @@ class VolumeModel(dc.PhysicalObject):
         ax.margins(0.1)
         return ax
 
-    def babylon_data(self):
+    def babylon_data(self, binary: bool = False, quantize: bool = False, compress: bool = False):
         """
         Get babylonjs data.
 
+        :param binary: whether to encode the meshes as base64 typed arrays, see Primitive3D.babylon_meshes
+        :param quantize: whether to quantize the positions of the binary meshes on 16 bits
+        :param compress: whether to compress the binary meshes with deflate
         :return: Dictionary with babylon data.
         """
         meshes = []
         lines = []
         for primitive in self.primitives:
             if hasattr(primitive, 'babylon_meshes'):
-                meshes.extend(primitive.babylon_meshes())
+                meshes.extend(primitive_babylon_meshes(primitive, binary, quantize, compress))
             if hasattr(primitive, 'babylon_curves'):
                 lines.append(primitive.babylon_curves())
 
@@ -1094,8 +1453,9 @@ class VolumeModel(dc.PhysicalObject):
             babylon_data=babylon_data)
         return script
 
-    def babylonjs(self, page_name=None, use_cdn=True, debug=False):
-        babylon_data = self.babylon_data()
+    def babylonjs(self, page_name=None, use_cdn=True, debug=False, binary: bool = False,
+                  quantize: bool = False, compress: bool = False):
+        babylon_data = self.babylon_data(binary=binary, quantize=quantize, compress=compress)
         script = self.babylonjs_script(babylon_data, use_cdn=use_cdn,
                                        debug=debug)
         if page_name is None:
@@ -1114,8 +1474,9 @@ class VolumeModel(dc.PhysicalObject):
         return page_name
 
     def save_babylonjs_to_file(self, filename: str = None,
-                               use_cdn=True, debug=False):
-        babylon_data = self.babylon_data()
+                               use_cdn=True, debug=False, binary: bool = False,
+                               quantize: bool = False, compress: bool = False):
+        babylon_data = self.babylon_data(binary=binary, quantize=quantize, compress=compress)
         script = self.babylonjs_script(babylon_data, use_cdn=use_cdn,
                                        debug=debug)
         if filename is None:
@@ -1131,10 +1492,19 @@ class VolumeModel(dc.PhysicalObject):
                 file.write(script)
             return filename
 
-    def to_stl_model(self):
-        mesh = self.primitives[0].triangulation()
-        for primitive in self.primitives[1:]:
-            mesh.merge_mesh(primitive.triangulation())
+    def to_stl_model(self, workers: int = None, executor=None):
+        """
+        Converts the volume model to a stl model.
+
+        :param workers: The number of processes triangulating the faces of the shells. Default is None,
+            triangulating in the current process.
+        :param executor: An executor to use instead of creating a pool of processes.
+        """
+        if (workers is not None and workers > 1) or executor is not None:
+            faces = [face for primitive in self.primitives for face in getattr(primitive, 'faces', [])]
+            volmdlr.faces.triangulate_faces(faces, workers=workers, executor=executor)
+        mesh = volmdlr.display.DisplayMesh3D.merge_meshes([primitive.triangulation()
+                                                           for primitive in self.primitives])
         stl = mesh.to_stl()
         return stl
 
@@ -1683,6 +2053,166 @@ class VolumeModel(dc.PhysicalObject):
         gmsh.finalize()
 
 
+class PrimitiveInstance:
+    """
+    A placement of a primitive by a frame, without copying its geometry.
+
+    The primitive, and its local triangulation, can be shared between instances. Placed data is computed by
+    mapping the local data with the frame, as frame_mapping(frame, side='old') would.
+
+    :param primitive: The shared primitive, in its local coordinates.
+    :param frame: The frame placing the primitive.
+    :param local_mesh: The triangulation of the primitive, computed when first needed if not given.
+    """
+
+    def __init__(self, primitive: Primitive3D, frame: volmdlr.Frame3D, local_mesh=None):
+        self.primitive = primitive
+        self.frame = frame
+        self._local_mesh = local_mesh
+        # Rows u, v, w of the frame, followed by its origin
+        self._matrix = npy.array([[*frame.u], [*frame.v], [*frame.w], [*frame.origin]])
+        self._vertices = None
+        self._edges = None
+        self._bbox = None
+
+    @property
+    def local_mesh(self):
+        """Triangulation of the primitive in its local coordinates."""
+        if self._local_mesh is None:
+            self._local_mesh = self.primitive.triangulation()
+        return self._local_mesh
+
+    def local_to_global(self, points):
+        """Maps a (n, 3) array of local coordinates to global coordinates."""
+        return npy.asarray(points, dtype=float).reshape(-1, 3) @ self._matrix[:3] + self._matrix[3]
+
+    def global_to_local(self, points):
+        """Maps a (n, 3) array of global coordinates to local coordinates."""
+        return npy.linalg.solve(self._matrix[:3].T, (npy.asarray(points, dtype=float).reshape(-1, 3)
+                                                     - self._matrix[3]).T).T
+
+    @property
+    def vertices(self):
+        """Placed vertices of the local triangulation, as a (n, 3) array."""
+        if self._vertices is None:
+            self._vertices = self.local_to_global(self.local_mesh.vertices)
+        return self._vertices
+
+    def triangulation(self):
+        """Placed triangulation, sharing the faces array of the local one."""
+        return volmdlr.display.DisplayMesh3D.from_arrays(self.vertices, self.local_mesh.faces)
+
+    @property
+    def bounding_box(self):
+        """Bounding box of the placed triangulation."""
+        if self._bbox is None:
+            xmin, ymin, zmin = self.vertices.min(axis=0).tolist()
+            xmax, ymax, zmax = self.vertices.max(axis=0).tolist()
+            self._bbox = BoundingBox(xmin, xmax, ymin, ymax, zmin, zmax)
+        return self._bbox
+
+    def minimum_distance_point(self, point: volmdlr.Point3D):
+        """
+        Gets the point of the placed primitive closest to a point, the point being mapped to the local coordinates.
+
+        """
+        local_point = volmdlr.Point3D(*self.global_to_local([tuple(point)])[0].tolist())
+        local_closest_point = self.primitive.minimum_distance_point(local_point)
+        return volmdlr.Point3D(*self.local_to_global([tuple(local_closest_point)])[0].tolist())
+
+    @property
+    def edges(self):
+        """Unique edges of the local triangulation, as a (n, 2) array of vertices indices."""
+        if self._edges is None:
+            faces = npy.asarray(self.local_mesh.faces, dtype=int)
+            edges = npy.sort(faces[:, [[0, 1], [1, 2], [2, 0]]].reshape(-1, 2), axis=1)
+            self._edges = npy.unique(edges[edges[:, 0] != edges[:, 1]], axis=0)
+        return self._edges
+
+    def edges_arrays(self):
+        """Starts and directions of the placed non degenerated edges, as two (n, 3) arrays."""
+        starts = self.vertices[self.edges[:, 0]]
+        directions = self.vertices[self.edges[:, 1]] - starts
+        not_degenerated = npy.einsum('ij,ij->i', directions, directions) > 0.
+        return starts[not_degenerated], directions[not_degenerated]
+
+    def triangles_points(self):
+        """Placed points of the triangles, as a (n, 3, 3) array."""
+        return self.vertices[npy.asarray(self.local_mesh.faces, dtype=int)]
+
+    def contains_point(self, point):
+        """Whether a point is inside the placed triangulation of a closed shell, by ray parity."""
+        if not isinstance(self.primitive, volmdlr.faces.ClosedShell3D):
+            return False
+        if not self.bounding_box.point_belongs(volmdlr.Point3D(*point.tolist())):
+            return False
+        # Direction not aligned with the axes, to avoid crossing the edges of axis aligned faces
+        direction = npy.array([0.5773502691896258, 0.5773502691896257, 0.5773502691896259]) @ self._matrix[:3]
+        return volmdlr.display.ray_triangles_intersections_number(point, direction,
+                                                                  self.triangles_points()) % 2 == 1
+
+    def minimum_distance(self, other_instance: 'PrimitiveInstance', return_points: bool = False):
+        """
+        Distance between the placed triangulations of two instances, zero if they intersect.
+
+        The distance between triangles is reached either between a vertex and a triangle, or between two edges:
+        vertices distances to the triangles are computed with trimesh, and the pairs of edges closer than this first
+        distance are found with a bounding volume hierarchy. Intersections are the edges of a triangulation crossing
+        triangles of the other. The instances of closed shells are also intersecting when one contains the other.
+        """
+        for instance1, instance2 in ((self, other_instance), (other_instance, self)):
+            starts, directions = instance1.edges_arrays()
+            triangles_points = instance2.triangles_points()
+            hierarchy = BoundingVolumeHierarchy(triangles_points.min(axis=1), triangles_points.max(axis=1))
+            pairs = hierarchy.boxes_query(npy.minimum(starts, starts + directions),
+                                          npy.maximum(starts, starts + directions))
+            intersecting, points = volmdlr.display.segments_triangles_intersections(
+                starts[pairs[:, 0]], directions[pairs[:, 0]], triangles_points[pairs[:, 1]])
+            if intersecting.any():
+                point = points[npy.argmax(intersecting)]
+                return (0., volmdlr.Point3D(*point.tolist()), volmdlr.Point3D(*point.tolist())) \
+                    if return_points else 0.
+
+        for instance1, instance2 in ((self, other_instance), (other_instance, self)):
+            if instance2.contains_point(instance1.vertices[0]):
+                point = volmdlr.Point3D(*instance1.vertices[0].tolist())
+                return (0., point, point.copy()) if return_points else 0.
+
+        distance, point1, point2 = math.inf, None, None
+        for instance1, instance2, reverse in ((self, other_instance, False), (other_instance, self, True)):
+            points, distances, _ = closest_point(Trimesh(instance2.vertices, instance2.local_mesh.faces,
+                                                         process=False), instance1.vertices)
+            argument = int(npy.argmin(distances))
+            if distances[argument] < distance:
+                distance = float(distances[argument])
+                point1, point2 = instance1.vertices[argument], points[argument]
+                if reverse:
+                    point1, point2 = point2, point1
+
+        starts1, directions1 = self.edges_arrays()
+        starts2, directions2 = other_instance.edges_arrays()
+        hierarchy = BoundingVolumeHierarchy(npy.minimum(starts2, starts2 + directions2),
+                                            npy.maximum(starts2, starts2 + directions2))
+        pairs = hierarchy.boxes_query(npy.minimum(starts1, starts1 + directions1),
+                                      npy.maximum(starts1, starts1 + directions1), tol=distance)
+        if len(pairs):
+            edges_points1, edges_points2 = volmdlr.display.segments_closest_points(
+                starts1[pairs[:, 0]], directions1[pairs[:, 0]], starts2[pairs[:, 1]], directions2[pairs[:, 1]])
+            edges_distances = npy.linalg.norm(edges_points2 - edges_points1, axis=1)
+            argument = int(npy.argmin(edges_distances))
+            if edges_distances[argument] < distance:
+                distance = float(edges_distances[argument])
+                point1, point2 = edges_points1[argument], edges_points2[argument]
+
+        if return_points:
+            return distance, volmdlr.Point3D(*point1.tolist()), volmdlr.Point3D(*point2.tolist())
+        return distance
+
+    def to_primitive(self):
+        """Copies the primitive mapped by the frame."""
+        return self.primitive.frame_mapping(self.frame, side='old')
+
+
 class MovingVolumeModel(VolumeModel):
     """
     A volume model with possibility to declare time steps at which the primitives are positioned with frames.
@@ -1692,6 +2222,7 @@ class MovingVolumeModel(VolumeModel):
     def __init__(self, primitives, step_frames, name=''):
         VolumeModel.__init__(self, primitives=primitives, name=name)
         self.step_frames = step_frames
+        self._local_meshes = None
 
         if not self.is_consistent():
             raise dc.ConsistencyError
@@ -1703,24 +2234,46 @@ class MovingVolumeModel(VolumeModel):
                 return False
         return True
 
+    @property
+    def local_meshes(self):
+        """Triangulations of the primitives in their local coordinates, shared by the steps instances."""
+        if self._local_meshes is None:
+            self._local_meshes = [primitive.triangulation() for primitive in self.primitives]
+        return self._local_meshes
+
+    def step_instances(self, istep):
+        """
+        Gets the primitives placed at a step, without copying their geometry. See PrimitiveInstance.
+
+        """
+        return [PrimitiveInstance(primitive, frame, local_mesh)
+                for primitive, frame, local_mesh in zip(self.primitives, self.step_frames[istep], self.local_meshes)]
+
     def step_volume_model(self, istep):
+        """
+        Gets the volume model of a step, copying the primitives. Use step_instances to avoid these copies.
+
+        """
         primitives = []
         for primitive, frame in zip(self.primitives, self.step_frames[istep]):
             primitives.append(
                 primitive.frame_mapping(frame, side='old'))
         return VolumeModel(primitives)
 
-    def babylon_data(self):
+    def babylon_data(self, binary: bool = False, quantize: bool = False, compress: bool = False):
         """
         Get babylonjs data.
 
+        :param binary: whether to encode the meshes as base64 typed arrays, see Primitive3D.babylon_meshes
+        :param quantize: whether to quantize the positions of the binary meshes on 16 bits
+        :param compress: whether to compress the binary meshes with deflate
         :return: Dictionary with babylon data.
         """
         meshes = []
         primitives_to_meshes = []
         for i_prim, primitive in enumerate(self.primitives):
             if hasattr(primitive, 'babylon_meshes'):
-                meshes.extend(primitive.babylon_meshes())
+                meshes.extend(primitive_babylon_meshes(primitive, binary, quantize, compress))
                 primitives_to_meshes.append(i_prim)
 
         bbox = self._bounding_box()
@@ -6,9 +6,11 @@
 Cython functions
 
 """
+import heapq
 import math
 import random
 import warnings
+from fractions import Fraction
 # from __future__ import annotations
 from typing import Any, Dict, List, Text, Tuple
 
@@ -224,6 +226,584 @@ def polygon_point_belongs(point, points, include_edge_points: bool = False):
 # =============================================================================
 
 
+cdef bint c_polygon_point_belongs(double x, double y, double[:, :] polygon, int[:] edges, int first_edge,
+                                  int last_edge, bint include_edge_points):
+    """
+    Classifies a point against some edges of a polygon, the edge i going from the vertex i to the vertex i + 1.
+
+    Same algorithm as polygon_point_belongs, restricted to the edges edges[first_edge:last_edge].
+    """
+    cdef int k, i, n = polygon.shape[0]
+    cdef bint inside = False
+    cdef double p1x, p1y, p2x, p2y, xints
+    for k in range(first_edge, last_edge):
+        i = edges[k]
+        p1x, p1y = polygon[i, 0], polygon[i, 1]
+        p2x, p2y = polygon[(i + 1) % n, 0], polygon[(i + 1) % n, 1]
+        xints = math.inf
+        if min(p1y, p2y) <= y <= max(p1y, p2y) and min(p1x, p2x) <= x <= max(p1x, p2x):
+            if p1y != p2y:
+                xints = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            if p1y == p2y or x == xints:
+                return include_edge_points
+        if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
+            if p1y != p2y:
+                xints = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            if p1x == p2x or x < xints:
+                inside = not inside
+    return inside
+
+
+def polygon_points_belong(double[:, :] points, double[:, :] polygon, bint include_edge_points=False,
+                          int bucket_threshold=64):
+    """
+    Classifies many points against a polygon at once.
+
+    For polygons with at least bucket_threshold vertices, edges are first distributed in horizontal bands of the
+    bounding rectangle, so that each point is only tested against the edges crossing its band.
+
+    :param points: (N, 2) array of points coordinates
+    :param polygon: (n, 2) array of the polygon vertices coordinates
+    :param include_edge_points: whether points on the edges of the polygon belong to it
+    :param bucket_threshold: minimum number of vertices from which edges are distributed in bands
+    :return: (N,) boolean array
+    """
+    cdef int number_points = points.shape[0]
+    cdef int n = polygon.shape[0]
+    cdef int number_bands = 1
+    cdef int ip, i, band, first_band, last_band
+    cdef double y_min = 0., y_max = 0., band_height = 1.
+    result = npy.zeros(number_points, dtype=npy.bool_)
+    if n == 0 or number_points == 0:
+        return result
+    cdef unsigned char[:] result_view = result.view(npy.uint8)
+
+    polygon_y = npy.asarray(polygon)[:, 1]
+    edges_y_min = npy.minimum(polygon_y, npy.roll(polygon_y, -1))
+    edges_y_max = npy.maximum(polygon_y, npy.roll(polygon_y, -1))
+    if n >= bucket_threshold:
+        y_min = polygon_y.min()
+        y_max = polygon_y.max()
+        band_height = (y_max - y_min) / int(math.sqrt(n))
+        if band_height > 0.:
+            number_bands = int(math.sqrt(n))
+    if number_bands == 1:
+        offsets = npy.array([0, n], dtype=npy.intc)
+        edges = npy.arange(n, dtype=npy.intc)
+    else:
+        # An edge belongs to every band that its closed y range intersects
+        first_bands = npy.clip(npy.floor((edges_y_min - y_min) / band_height).astype(npy.intc), 0,
+                               number_bands - 1)
+        last_bands = npy.clip(npy.floor((edges_y_max - y_min) / band_height).astype(npy.intc), 0,
+                              number_bands - 1)
+        counts = last_bands - first_bands + 1
+        edges = npy.repeat(npy.arange(n, dtype=npy.intc), counts)
+        edges_bands = npy.repeat(first_bands, counts) + (npy.arange(counts.sum()) -
+                                                         npy.repeat(npy.cumsum(counts) - counts, counts))
+        order = npy.argsort(edges_bands, kind='stable')
+        edges = npy.ascontiguousarray(edges[order], dtype=npy.intc)
+        offsets = npy.searchsorted(edges_bands[order], npy.arange(number_bands + 1)).astype(npy.intc)
+    cdef int[:] edges_view = edges
+    cdef int[:] offsets_view = offsets
+
+    for ip in range(number_points):
+        band = 0
+        if number_bands > 1:
+            if not y_min <= points[ip, 1] <= y_max:
+                continue
+            band = min(<int> ((points[ip, 1] - y_min) // band_height), number_bands - 1)
+        result_view[ip] = c_polygon_point_belongs(points[ip, 0], points[ip, 1], polygon, edges_view,
+                                                  offsets_view[band], offsets_view[band + 1], include_edge_points)
+    return result
+
+cdef int c_orientation(double ax, double ay, double bx, double by, double cx, double cy):
+    """
+    Exact sign of the cross product (b - a) x (c - a): 1 if c is on the left of the line from a to b, -1 on its right.
+
+    The floating point value is used when it is larger than its error bound, as in Shewchuk's orient2d,
+    and exact rational arithmetic otherwise.
+    """
+    cdef double left, right, value
+    if (cx == ax and cy == ay) or (cx == bx and cy == by):
+        return 0
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    value = left - right
+    if abs(value) >= 3.3306690738754716e-16 * (abs(left) + abs(right)):
+        return (value > 0.) - (value < 0.)
+    exact_value = ((Fraction(bx) - Fraction(ax)) * (Fraction(cy) - Fraction(ay))
+                   - (Fraction(by) - Fraction(ay)) * (Fraction(cx) - Fraction(ax)))
+    return (exact_value > 0) - (exact_value < 0)
+
+
+cdef bint c_collinear_point_on_segment(double ax, double ay, double bx, double by, double px, double py):
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+cdef bint c_polygon_edges_intersect(double[:, :] polygon, int i, int j):
+    """
+    Exact intersection test of edges i < j of a polygon. Consecutive edges only intersect if they overlap.
+
+    """
+    cdef int n = polygon.shape[0]
+    cdef int i2 = (i + 1) % n, j2 = (j + 1) % n
+    cdef double x1 = polygon[i, 0], y1 = polygon[i, 1], x2 = polygon[i2, 0], y2 = polygon[i2, 1]
+    cdef double x3 = polygon[j, 0], y3 = polygon[j, 1], x4 = polygon[j2, 0], y4 = polygon[j2, 1]
+    cdef int d1 = c_orientation(x3, y3, x4, y4, x1, y1)
+    cdef int d2 = c_orientation(x3, y3, x4, y4, x2, y2)
+    cdef int d3 = c_orientation(x1, y1, x2, y2, x3, y3)
+    cdef int d4 = c_orientation(x1, y1, x2, y2, x4, y4)
+    if j == i + 1:
+        # Edges sharing the vertex i2 == j: they overlap if they are collinear and opposite
+        return d4 == 0 and (x2 - x1) * (x4 - x3) + (y2 - y1) * (y4 - y3) < 0.
+    if i == 0 and j == n - 1:
+        # Edges sharing the vertex 0 == j2
+        return d2 == 0 and (x2 - x1) * (x4 - x3) + (y2 - y1) * (y4 - y3) < 0.
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+    return ((d1 == 0 and c_collinear_point_on_segment(x3, y3, x4, y4, x1, y1))
+            or (d2 == 0 and c_collinear_point_on_segment(x3, y3, x4, y4, x2, y2))
+            or (d3 == 0 and c_collinear_point_on_segment(x1, y1, x2, y2, x3, y3))
+            or (d4 == 0 and c_collinear_point_on_segment(x1, y1, x2, y2, x4, y4)))
+
+
+cdef class _SweepLineStatus:
+    """
+    Edges crossing the sweep line, in their order along it.
+
+    The order is kept in a treap, a binary search tree balanced by random priorities, whose nodes are also linked to
+    their predecessor and successor. Each node holds an edge, that can be exchanged with the one of another node.
+    """
+    cdef int root, head, number_free
+    cdef unsigned int seed
+    cdef int[:] left, right, parent, previous, following, edges, nodes, free_nodes
+    cdef unsigned int[:] priorities
+
+    def __init__(self, int number_edges):
+        self.root = -1
+        self.head = -1
+        self.seed = 2463534242
+        self.left = npy.full(number_edges, -1, dtype=npy.intc)
+        self.right = npy.full(number_edges, -1, dtype=npy.intc)
+        self.parent = npy.full(number_edges, -1, dtype=npy.intc)
+        self.previous = npy.full(number_edges, -1, dtype=npy.intc)
+        self.following = npy.full(number_edges, -1, dtype=npy.intc)
+        self.edges = npy.full(number_edges, -1, dtype=npy.intc)
+        self.nodes = npy.full(number_edges, -1, dtype=npy.intc)
+        self.free_nodes = npy.arange(number_edges - 1, -1, -1, dtype=npy.intc)
+        self.number_free = number_edges
+        self.priorities = npy.zeros(number_edges, dtype=npy.uintc)
+
+    cdef void rotate_up(self, int node):
+        cdef int parent = self.parent[node], grandparent = self.parent[parent], child
+        if self.left[parent] == node:
+            child = self.right[node]
+            self.left[parent] = child
+            self.right[node] = parent
+        else:
+            child = self.left[node]
+            self.right[parent] = child
+            self.left[node] = parent
+        if child != -1:
+            self.parent[child] = parent
+        self.parent[parent] = node
+        self.parent[node] = grandparent
+        if grandparent == -1:
+            self.root = node
+        elif self.left[grandparent] == parent:
+            self.left[grandparent] = node
+        else:
+            self.right[grandparent] = node
+
+    cdef int insert_after(self, int node, int edge):
+        """
+        Inserts an edge just after a node, or first if node is -1, and returns the node of the edge.
+
+        """
+        cdef int new_node, predecessor, successor
+        self.number_free -= 1
+        new_node = self.free_nodes[self.number_free]
+        self.edges[new_node] = edge
+        self.nodes[edge] = new_node
+        self.left[new_node] = -1
+        self.right[new_node] = -1
+        # xorshift pseudo random priorities, the tree being a heap on them
+        self.seed ^= self.seed << 13
+        self.seed ^= self.seed >> 17
+        self.seed ^= self.seed << 5
+        self.priorities[new_node] = self.seed
+
+        predecessor = node
+        successor = self.head if node == -1 else self.following[node]
+        self.previous[new_node] = predecessor
+        self.following[new_node] = successor
+        if predecessor == -1:
+            self.head = new_node
+        else:
+            self.following[predecessor] = new_node
+        if successor != -1:
+            self.previous[successor] = new_node
+
+        # Either the predecessor has no right child, or the successor, leftmost node of its right subtree, has no
+        # left child
+        if predecessor == -1 and successor == -1:
+            self.root = new_node
+            self.parent[new_node] = -1
+        elif predecessor != -1 and self.right[predecessor] == -1:
+            self.right[predecessor] = new_node
+            self.parent[new_node] = predecessor
+        else:
+            self.left[successor] = new_node
+            self.parent[new_node] = successor
+        while self.parent[new_node] != -1 and self.priorities[new_node] < self.priorities[self.parent[new_node]]:
+            self.rotate_up(new_node)
+        return new_node
+
+    cdef void remove(self, int node):
+        cdef int child, parent
+        while self.left[node] != -1 and self.right[node] != -1:
+            if self.priorities[self.left[node]] < self.priorities[self.right[node]]:
+                self.rotate_up(self.left[node])
+            else:
+                self.rotate_up(self.right[node])
+        child = self.left[node] if self.left[node] != -1 else self.right[node]
+        parent = self.parent[node]
+        if child != -1:
+            self.parent[child] = parent
+        if parent == -1:
+            self.root = child
+        elif self.left[parent] == node:
+            self.left[parent] = child
+        else:
+            self.right[parent] = child
+
+        if self.previous[node] == -1:
+            self.head = self.following[node]
+        else:
+            self.following[self.previous[node]] = self.following[node]
+        if self.following[node] != -1:
+            self.previous[self.following[node]] = self.previous[node]
+        self.nodes[self.edges[node]] = -1
+        self.edges[node] = -1
+        self.free_nodes[self.number_free] = node
+        self.number_free += 1
+
+    cdef void swap(self, int node1, int node2):
+        cdef int edge1 = self.edges[node1], edge2 = self.edges[node2]
+        self.edges[node1] = edge2
+        self.edges[node2] = edge1
+        self.nodes[edge2] = node1
+        self.nodes[edge1] = node2
+
+
+cdef inline bint c_lexicographic_less(double x1, double y1, double x2, double y2):
+    return x1 < x2 or (x1 == x2 and y1 < y2)
+
+
+cdef class _PolygonSweepLine:
+    """
+    State of the sweep line of polygon_self_intersections.
+
+    Edges are stored with their lexicographically smallest end point as start point.
+    """
+    cdef double[:, :] polygon
+    cdef double[:] start_x, start_y, end_x, end_y
+    cdef _SweepLineStatus status
+    cdef list crossings
+    cdef set intersections
+    cdef bint first_only
+    # Current point of the sweep
+    cdef double x, y
+
+    def __init__(self, double[:, :] polygon, start_x, start_y, end_x, end_y, bint first_only):
+        self.polygon = polygon
+        self.start_x = start_x
+        self.start_y = start_y
+        self.end_x = end_x
+        self.end_y = end_y
+        self.status = _SweepLineStatus(polygon.shape[0])
+        self.crossings = []
+        self.intersections = set()
+        self.first_only = first_only
+        self.x = -npy.inf
+        self.y = -npy.inf
+
+    cdef int orientation(self, int edge, double x, double y):
+        """
+        Side of a point relative to an edge: 1 above, -1 below, 0 on its line.
+
+        """
+        return c_orientation(self.start_x[edge], self.start_y[edge], self.end_x[edge], self.end_y[edge], x, y)
+
+    cdef int last_node_below(self, double x, double y):
+        """
+        Finds the node of the highest edge strictly below a point, -1 if there is none.
+
+        """
+        cdef int node = self.status.root, result = -1
+        while node != -1:
+            if self.orientation(self.status.edges[node], x, y) > 0:
+                result = node
+                node = self.status.right[node]
+            else:
+                node = self.status.left[node]
+        return result
+
+    cdef bint report(self, int edge1, int edge2):
+        """
+        Records a pair of edges if they intersect. Returns True if the sweep can stop.
+
+        """
+        cdef int index1 = min(edge1, edge2), index2 = max(edge1, edge2)
+        if (index1, index2) in self.intersections:
+            return False
+        if c_polygon_edges_intersect(self.polygon, index1, index2):
+            self.intersections.add((index1, index2))
+            return self.first_only
+        return False
+
+    cdef (double, double) crossing_point(self, int edge1, int edge2):
+        """
+        Crossing point of two crossing edges, computed with rational numbers for almost parallel edges.
+
+        """
+        cdef double direction1_x = self.end_x[edge1] - self.start_x[edge1]
+        cdef double direction1_y = self.end_y[edge1] - self.start_y[edge1]
+        cdef double direction2_x = self.end_x[edge2] - self.start_x[edge2]
+        cdef double direction2_y = self.end_y[edge2] - self.start_y[edge2]
+        cdef double denominator = direction1_x * direction2_y - direction1_y * direction2_x, parameter
+        if abs(denominator) > 1e-8 * (abs(direction1_x * direction2_y) + abs(direction1_y * direction2_x)):
+            parameter = (((self.start_x[edge2] - self.start_x[edge1]) * direction2_y
+                          - (self.start_y[edge2] - self.start_y[edge1]) * direction2_x) / denominator)
+        else:
+            start1_x, start1_y = Fraction(self.start_x[edge1]), Fraction(self.start_y[edge1])
+            start2_x, start2_y = Fraction(self.start_x[edge2]), Fraction(self.start_y[edge2])
+            exact_direction1_x = Fraction(self.end_x[edge1]) - start1_x
+            exact_direction1_y = Fraction(self.end_y[edge1]) - start1_y
+            exact_direction2_x = Fraction(self.end_x[edge2]) - start2_x
+            exact_direction2_y = Fraction(self.end_y[edge2]) - start2_y
+            parameter = float(((start2_x - start1_x) * exact_direction2_y - (start2_y - start1_y) * exact_direction2_x)
+                              / (exact_direction1_x * exact_direction2_y - exact_direction1_y * exact_direction2_x))
+        parameter = min(max(parameter, 0.), 1.)
+        return self.start_x[edge1] + parameter * direction1_x, self.start_y[edge1] + parameter * direction1_y
+
+    cdef int crossing_side(self, int edge1, int edge2, double crossing_x, double crossing_y, double x, double y):
+        """
+        Position of the crossing point of two edges relative to a point: -1 before, 0 at this point, 1 after, 2 after
+        with a rounded abscissa far enough from the point for the following crossings to be after it too.
+
+        The rounded crossing point is only trusted far from the point, the exact one is used otherwise.
+        """
+        cdef double tolerance = 1e-7 * (abs(self.start_x[edge1]) + abs(self.end_x[edge1])
+                                        + abs(self.start_x[edge2]) + abs(self.end_x[edge2]))
+        if crossing_x < x - tolerance:
+            return -1
+        if crossing_x > x + tolerance:
+            return 2
+        start1_x, start1_y = Fraction(self.start_x[edge1]), Fraction(self.start_y[edge1])
+        start2_x, start2_y = Fraction(self.start_x[edge2]), Fraction(self.start_y[edge2])
+        direction1_x = Fraction(self.end_x[edge1]) - start1_x
+        direction1_y = Fraction(self.end_y[edge1]) - start1_y
+        direction2_x = Fraction(self.end_x[edge2]) - start2_x
+        direction2_y = Fraction(self.end_y[edge2]) - start2_y
+        parameter = (((start2_x - start1_x) * direction2_y - (start2_y - start1_y) * direction2_x)
+                     / (direction1_x * direction2_y - direction1_y * direction2_x))
+        exact_x = start1_x + parameter * direction1_x
+        exact_y = start1_y + parameter * direction1_y
+        if exact_x != x:
+            return -1 if exact_x < x else 1
+        if exact_y != y:
+            return -1 if exact_y < y else 1
+        return 0
+
+    cdef bint check_neighbours(self, int node_below, int node_above):
+        """
+        Tests two edges becoming neighbours, and schedules their swap at their crossing point if they cross.
+
+        Returns True if the sweep can stop.
+        """
+        cdef int edge1, edge2
+        cdef double x, y
+        if node_below == -1 or node_above == -1:
+            return False
+        edge1 = self.status.edges[node_below]
+        edge2 = self.status.edges[node_above]
+        if self.report(edge1, edge2):
+            return True
+        # The lower edge goes above the upper one at a crossing point ahead of the sweep
+        if (self.orientation(edge1, self.start_x[edge2], self.start_y[edge2])
+                * self.orientation(edge1, self.end_x[edge2], self.end_y[edge2]) < 0
+                and self.orientation(edge2, self.start_x[edge1], self.start_y[edge1]) < 0
+                and self.orientation(edge2, self.end_x[edge1], self.end_y[edge1]) > 0):
+            x, y = self.crossing_point(edge1, edge2)
+            # A rounded crossing point can't be behind the sweep
+            if c_lexicographic_less(x, y, self.x, self.y):
+                x, y = self.x, self.y
+            heapq.heappush(self.crossings, (x, y, edge1, edge2))
+        return False
+
+    cdef bint swap(self, int edge_below, int edge_above):
+        """
+        Swaps two edges at their crossing point if they are still neighbours. Returns True if the sweep can stop.
+
+        """
+        cdef int node1 = self.status.nodes[edge_below], node2 = self.status.nodes[edge_above]
+        if node1 == -1 or node2 == -1 or self.status.following[node1] != node2:
+            return False
+        self.status.swap(node1, node2)
+        return (self.check_neighbours(self.status.previous[node1], node1)
+                or self.check_neighbours(node2, self.status.following[node2]))
+
+    cdef bint process_crossings(self, double x, double y):
+        """
+        Swaps the edges crossing before a point, or at this point. Returns True if the sweep can stop.
+
+        """
+        cdef int edge1, edge2, side
+        cdef double crossing_x, crossing_y
+        cdef list later_crossings = []
+        while self.crossings:
+            crossing_x, crossing_y, edge1, edge2 = self.crossings[0]
+            side = self.crossing_side(edge1, edge2, crossing_x, crossing_y, x, y)
+            if side == 2:
+                break
+            heapq.heappop(self.crossings)
+            if side == 1:
+                # The crossings rounded close to the point are all compared with it
+                later_crossings.append((crossing_x, crossing_y, edge1, edge2))
+                continue
+            if c_lexicographic_less(self.x, self.y, crossing_x, crossing_y):
+                self.x, self.y = crossing_x, crossing_y
+            if self.swap(edge1, edge2):
+                return True
+        for crossing in later_crossings:
+            heapq.heappush(self.crossings, crossing)
+        return False
+
+    cdef bint process_vertex(self, double x, double y, list starting_edges, list ending_edges):
+        """
+        Updates the edges crossing the sweep line at a vertex, or at several vertices at the same point. Returns True if the sweep can stop.
+
+        The edges containing the vertex are next to each other. Those ending at the vertex are removed, the others
+        are inserted again with the edges starting at the vertex, in their order after it.
+        """
+        cdef int node_below, node_above, node, edge, other_edge, i, j, side
+        cdef list vertex_nodes = [], vertex_edges = [], new_edges
+        self.x = x
+        self.y = y
+        node_below = self.last_node_below(x, y)
+        node = self.status.head if node_below == -1 else self.status.following[node_below]
+        while node != -1 and self.orientation(self.status.edges[node], x, y) == 0:
+            vertex_nodes.append(node)
+            vertex_edges.append(self.status.edges[node])
+            node = self.status.following[node]
+        node_above = node
+
+        vertex_edges.extend(starting_edges)
+        for i in range(len(vertex_edges)):
+            for j in range(i):
+                if self.report(vertex_edges[i], vertex_edges[j]):
+                    return True
+
+        for node in vertex_nodes:
+            self.status.remove(node)
+        new_edges = [edge for edge in vertex_edges if self.end_x[edge] != x or self.end_y[edge] != y]
+        # Insertion sort on the directions of the edges after the vertex, collinear ones by index
+        for i in range(1, len(new_edges)):
+            edge = new_edges[i]
+            j = i
+            while j > 0:
+                other_edge = new_edges[j - 1]
+                side = c_orientation(x, y, self.end_x[other_edge], self.end_y[other_edge],
+                                            self.end_x[edge], self.end_y[edge])
+                if side > 0 or (side == 0 and other_edge < edge):
+                    break
+                new_edges[j] = other_edge
+                j -= 1
+            new_edges[j] = edge
+        node = node_below
+        for edge in new_edges:
+            node = self.status.insert_after(node, edge)
+
+        if new_edges:
+            if (self.check_neighbours(node_below, self.status.nodes[new_edges[0]])
+                    or self.check_neighbours(self.status.nodes[new_edges[-1]], node_above)):
+                return True
+        elif self.check_neighbours(node_below, node_above):
+            return True
+
+        # Edges ending at the vertex but missed because of a rounded crossing point are removed here
+        for edge in ending_edges:
+            node = self.status.nodes[edge]
+            if node != -1:
+                node_below = self.status.previous[node]
+                node_above = self.status.following[node]
+                self.status.remove(node)
+                if self.check_neighbours(node_below, node_above):
+                    return True
+        return False
+
+
+def polygon_self_intersections(double[:, :] polygon, bint first_only=False):
+    """
+    Finds the pairs of intersecting edges of a polygon, edge i going from vertex i to vertex i + 1.
+
+    Bentley-Ottmann sweep along x, points being ordered by abscissa then ordinate. The edges crossing the sweep line
+    are kept in their order along it in a balanced binary search tree, and edges are only tested when they become
+    neighbours in this order: when an edge is inserted or removed at a vertex, and when two edges are swapped at
+    their crossing point, scheduled in a priority queue. The edges containing a vertex are found next to each other
+    and tested together, which handles touching vertices, collinear overlaps and vertical edges. Intersections are
+    tested with exact orientation predicates, rounded crossing points only order the swaps, and are compared exactly
+    with the vertices close to them. Edges of zero length are ignored.
+
+    The complexity is O((n + k) log n) for n vertices and k intersecting pairs.
+
+    :param polygon: (n, 2) array of the polygon vertices coordinates
+    :param first_only: stops at the first intersection found
+    :return: the sorted list of (i, j) indices of intersecting edges, with i < j
+    """
+    cdef int n = polygon.shape[0], vertex, previous_edge, k
+    cdef double x, y
+    cdef _PolygonSweepLine sweep
+    cdef list starting_edges, ending_edges
+    if n < 3:
+        return []
+
+    points = npy.asarray(polygon)
+    next_points = npy.roll(points, -1, axis=0)
+    reversed_array = ((next_points[:, 0] < points[:, 0])
+                      | ((next_points[:, 0] == points[:, 0]) & (next_points[:, 1] < points[:, 1])))
+    starts = npy.where(reversed_array[:, None], next_points, points)
+    ends = npy.where(reversed_array[:, None], points, next_points)
+    degenerated_array = (starts == ends).all(axis=1)
+    cdef unsigned char[:] reversed_edges = reversed_array.view(npy.uint8)
+    cdef unsigned char[:] degenerated = degenerated_array.view(npy.uint8)
+    cdef int[:] order = npy.lexsort((points[:, 1], points[:, 0])).astype(npy.intc)
+    sweep = _PolygonSweepLine(polygon, npy.ascontiguousarray(starts[:, 0]), npy.ascontiguousarray(starts[:, 1]),
+                              npy.ascontiguousarray(ends[:, 0]), npy.ascontiguousarray(ends[:, 1]), first_only)
+
+    k = 0
+    while k < n:
+        # Vertices at the same point are processed together
+        x = polygon[order[k], 0]
+        y = polygon[order[k], 1]
+        starting_edges = []
+        ending_edges = []
+        while k < n and polygon[order[k], 0] == x and polygon[order[k], 1] == y:
+            vertex = order[k]
+            previous_edge = (vertex + n - 1) % n
+            if not degenerated[previous_edge]:
+                (starting_edges if reversed_edges[previous_edge] else ending_edges).append(previous_edge)
+            if not degenerated[vertex]:
+                (ending_edges if reversed_edges[vertex] else starting_edges).append(vertex)
+            k += 1
+        if sweep.process_crossings(x, y) or sweep.process_vertex(x, y, starting_edges, ending_edges):
+            break
+    return sorted(sweep.intersections)
+
+# =============================================================================
+
+
 cdef(double, (double, double)) CLineSegment2DPointDistance((double, double) p1,
                                                            (double, double) p2, (double, double) point):
     cdef double t
@@ -4,10 +4,13 @@
 Classes to define mesh for display use. Display mesh do not require good aspect ratios on elements.
 """
 
+import base64
 import math
+import zlib
 from typing import List, Tuple
 
 import dessia_common.core as dc
+import numpy as npy
 
 import volmdlr.edges
 
@@ -53,28 +56,310 @@ class Node3D(volmdlr.Point3D):
         return cls(point3d.x, point3d.y, point3d.z)
 
 
+def weld_vertices(vertices, faces, tolerance: float = 1e-6):
+    """
+    Snaps the vertices on a grid of step tolerance, merges the vertices in the same cell and remaps the faces.
+
+    Vertices are merged when their coordinates round to the same multiples of tolerance: they are then closer than
+    tolerance along each axis, but two close vertices on both sides of a cell boundary are not merged.
+    The order of first appearance of the vertices is kept.
+
+    :param vertices: (n, d) array of vertices coordinates
+    :param faces: (m, 3) array of vertices indices
+    :returns: the welded vertices and the remapped faces arrays
+    """
+    if not vertices.shape[0]:
+        return vertices, faces
+    keys = npy.round(vertices / tolerance).astype(npy.int64)
+    _, index, inverse = npy.unique(keys, axis=0, return_index=True, return_inverse=True)
+    order = npy.argsort(index)
+    rank = npy.empty_like(order)
+    rank[order] = npy.arange(order.shape[0])
+    return vertices[index[order]], rank[inverse.reshape(-1)][faces].astype(npy.int32)
+
+
+def groups_orientation_flips(faces, groups, number_groups: int):
+    """
+    Finds the groups of triangles to flip so that all the groups are oriented consistently with their neighbours.
+
+    Triangles of a group are supposed consistently oriented. Two groups sharing an edge are consistent when they
+    go through it in opposite directions. Groups are oriented as the first group of their connected component.
+
+    :param faces: (m, 3) array of vertices indices, vertices being welded between groups
+    :param groups: (m,) array of the group index of each triangle
+    :param number_groups: the number of groups
+    :returns: the (number_groups,) boolean array of the groups to flip and the (number_groups,) array of the
+        connected component index of each group
+    """
+    edges = npy.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    edges_groups = npy.tile(groups, 3)
+    valid = edges[:, 0] != edges[:, 1]
+    edges, edges_groups = edges[valid], edges_groups[valid]
+    directions = edges[:, 0] < edges[:, 1]
+    edges = npy.sort(edges, axis=1)
+    order = npy.lexsort((edges[:, 1], edges[:, 0]))
+    edges, edges_groups, directions = edges[order], edges_groups[order], directions[order]
+
+    shared = (edges[1:] == edges[:-1]).all(axis=1) & (edges_groups[1:] != edges_groups[:-1])
+    pairs = npy.unique(npy.column_stack((edges_groups[:-1][shared], edges_groups[1:][shared],
+                                         directions[:-1][shared] == directions[1:][shared])), axis=0)
+    neighbours = [[] for _ in range(number_groups)]
+    for group1, group2, same_direction in pairs.tolist():
+        neighbours[group1].append((group2, same_direction))
+        neighbours[group2].append((group1, same_direction))
+
+    flips = npy.zeros(number_groups, dtype=bool)
+    components = npy.full(number_groups, -1)
+    number_components = 0
+    for start in range(number_groups):
+        if components[start] != -1:
+            continue
+        components[start] = number_components
+        stack = [start]
+        while stack:
+            group = stack.pop()
+            for neighbour, same_direction in neighbours[group]:
+                if components[neighbour] == -1:
+                    components[neighbour] = number_components
+                    flips[neighbour] = flips[group] ^ bool(same_direction)
+                    stack.append(neighbour)
+        number_components += 1
+    return flips, components
+
+
+def ray_triangles_intersections_number(origin, direction, triangles_points, tolerance: float = 1e-12):
+    """
+    Counts the triangles crossed by a ray, using the Moller-Trumbore algorithm on all the triangles at once.
+
+    :param origin: (3,) array, the origin of the ray
+    :param direction: (3,) array, the direction of the ray
+    :param triangles_points: The (m, 3, 3) array of the points of the triangles.
+    :returns: the number of triangles crossed at a positive distance of the origin
+    """
+    edges1 = triangles_points[:, 1] - triangles_points[:, 0]
+    edges2 = triangles_points[:, 2] - triangles_points[:, 0]
+    vectors_p = npy.cross(direction, edges2)
+    determinants = npy.einsum('ij,ij->i', edges1, vectors_p)
+    valid = npy.abs(determinants) > tolerance
+    inverse_determinants = npy.zeros_like(determinants)
+    inverse_determinants[valid] = 1. / determinants[valid]
+    vectors_t = origin - triangles_points[:, 0]
+    u_parameters = npy.einsum('ij,ij->i', vectors_t, vectors_p) * inverse_determinants
+    vectors_q = npy.cross(vectors_t, edges1)
+    v_parameters = (vectors_q @ direction) * inverse_determinants
+    distances = npy.einsum('ij,ij->i', edges2, vectors_q) * inverse_determinants
+    return int((valid & (u_parameters >= 0.) & (v_parameters >= 0.) & (u_parameters + v_parameters <= 1.)
+                & (distances > tolerance)).sum())
+
+
+def segments_closest_points(starts1, directions1, starts2, directions2):
+    """
+    Closest points of pairs of segments, for all the pairs at once.
+
+    The segments are defined by their start and their (non zero) direction, going from start to end. For parallel
+    segments the closest points are not unique: one of them is returned.
+
+    :return: The (k, 3) arrays of the closest points on the first and on the second segments.
+    """
+    starts_vectors = starts1 - starts2
+    squared_lengths1 = npy.einsum('ij,ij->i', directions1, directions1)
+    squared_lengths2 = npy.einsum('ij,ij->i', directions2, directions2)
+    dots12 = npy.einsum('ij,ij->i', directions1, directions2)
+    dots1 = npy.einsum('ij,ij->i', directions1, starts_vectors)
+    dots2 = npy.einsum('ij,ij->i', directions2, starts_vectors)
+    denominators = squared_lengths1 * squared_lengths2 - dots12 ** 2
+
+    not_parallel = denominators > 1e-12 * squared_lengths1 * squared_lengths2
+    parameters1 = npy.zeros(len(starts1))
+    parameters1[not_parallel] = npy.clip((dots12 * dots2 - dots1 * squared_lengths2)[not_parallel]
+                                         / denominators[not_parallel], 0., 1.)
+    parameters2 = (dots12 * parameters1 + dots2) / squared_lengths2
+    below, above = parameters2 < 0., parameters2 > 1.
+    parameters2 = npy.clip(parameters2, 0., 1.)
+    parameters1 = npy.where(below, npy.clip(-dots1 / squared_lengths1, 0., 1.), parameters1)
+    parameters1 = npy.where(above, npy.clip((dots12 - dots1) / squared_lengths1, 0., 1.), parameters1)
+    return starts1 + parameters1[:, None] * directions1, starts2 + parameters2[:, None] * directions2
+
+
+def segments_triangles_intersections(starts, directions, triangles_points, tolerance: float = 1e-12):
+    """
+    Intersections of pairs of segment and triangle, using the Moller-Trumbore algorithm on all the pairs at once.
+
+    Segments lying in the plane of their triangle are not considered intersecting.
+
+    :param starts: The (k, 3) array of the starts of the segments.
+    :param directions: The (k, 3) array of the directions of the segments, going from start to end.
+    :param triangles_points: The (k, 3, 3) array of the points of the triangles.
+    :returns: The (k,) boolean array of the intersecting pairs, and the (k, 3) array of the intersection points,
+        only meaningful for the intersecting pairs.
+    """
+    edges1 = triangles_points[:, 1] - triangles_points[:, 0]
+    edges2 = triangles_points[:, 2] - triangles_points[:, 0]
+    vectors_p = npy.cross(directions, edges2)
+    determinants = npy.einsum('ij,ij->i', edges1, vectors_p)
+    scales = (npy.linalg.norm(edges1, axis=1) * npy.linalg.norm(edges2, axis=1)
+              * npy.linalg.norm(directions, axis=1))
+    valid = npy.abs(determinants) > tolerance * scales
+    inverse_determinants = npy.zeros_like(determinants)
+    inverse_determinants[valid] = 1. / determinants[valid]
+    vectors_t = starts - triangles_points[:, 0]
+    u_parameters = npy.einsum('ij,ij->i', vectors_t, vectors_p) * inverse_determinants
+    vectors_q = npy.cross(vectors_t, edges1)
+    v_parameters = npy.einsum('ij,ij->i', directions, vectors_q) * inverse_determinants
+    parameters = npy.einsum('ij,ij->i', edges2, vectors_q) * inverse_determinants
+    intersecting = (valid & (u_parameters >= 0.) & (v_parameters >= 0.) & (u_parameters + v_parameters <= 1.)
+                    & (parameters >= 0.) & (parameters <= 1.))
+    return intersecting, starts + parameters[:, None] * directions
+
+
+def triangles_mass_properties(triangles_points):
+    """
+    Computes the mass properties of the solid bounded by triangles, using the divergence theorem.
+
+    Each triangle defines a signed tetrahedron with the origin, their sum giving the solid properties in one pass.
+    The triangles do not have to share their vertices, but they should be consistently oriented.
+
+    :param triangles_points: The (m, 3, 3) array of the points of the triangles.
+    :return: The volume, the area, the center of mass as a (3,) array and the (3, 3) inertia tensor at the center
+        of mass for a unit density.
+    """
+    triangles_points = npy.asarray(triangles_points, dtype=npy.float64).reshape(-1, 3, 3)
+    points1, points2, points3 = triangles_points[:, 0], triangles_points[:, 1], triangles_points[:, 2]
+    cross_products = npy.cross(points2 - points1, points3 - points1)
+    area = 0.5 * float(npy.sqrt(npy.einsum('ij,ij->i', cross_products, cross_products)).sum())
+
+    # Signed volumes of the tetrahedrons (origin, point1, point2, point3)
+    volumes = npy.einsum('ij,ij->i', points1, npy.cross(points2, points3)) / 6.
+    volume = float(volumes.sum())
+    if volume == 0.:
+        return 0., area, npy.zeros(3), npy.zeros((3, 3))
+    sums = points1 + points2 + points3
+    center_of_mass = (volumes @ sums) / (4. * volume)
+
+    # Second moments at the origin: V/20 * (p1 p1^T + p2 p2^T + p3 p3^T + s s^T) for each tetrahedron
+    second_moments = npy.einsum('i,ijk,ijl->kl', volumes, triangles_points, triangles_points)
+    second_moments += npy.einsum('i,ik,il->kl', volumes, sums, sums)
+    second_moments /= 20.
+    second_moments -= volume * npy.outer(center_of_mass, center_of_mass)
+    if volume < 0.:
+        # Triangles oriented inward
+        volume = -volume
+        second_moments = -second_moments
+    inertia_tensor = npy.trace(second_moments) * npy.identity(3) - second_moments
+    return volume, area, center_of_mass, inertia_tensor
+
+
+def babylon_binary_data(vertices, faces, quantize: bool = False, compress: bool = False):
+    """
+    Encodes a mesh for babylonjs as base64 little-endian typed arrays, instead of JSON lists of numbers.
+
+    Positions are Float32, or Uint16 on the bounding box of the vertices if quantized. Indices are Uint32.
+
+    :param vertices: (n, 3) array of vertices coordinates
+    :param faces: (m, 3) array of vertices indices
+    :param quantize: whether to quantize the positions on 16 bits
+    :param compress: whether to compress the arrays with deflate (zlib format)
+    :returns: the dictionary of the encoded arrays and the parameters needed to decode them
+    """
+    vertices = npy.asarray(vertices, dtype=npy.float64).reshape(-1, 3)
+    binary_data = {}
+    if quantize and vertices.shape[0]:
+        minimum = vertices.min(axis=0)
+        extent = vertices.max(axis=0) - minimum
+        step = npy.where(extent > 0., extent / 65535., 1.)
+        positions = npy.round((vertices - minimum) / step).astype('<u2')
+        binary_data['quantization'] = {'min': minimum.tolist(), 'step': step.tolist()}
+    else:
+        positions = vertices.astype('<f4')
+    arrays = [positions.tobytes(), npy.asarray(faces).astype('<u4').tobytes()]
+    if compress:
+        arrays = [zlib.compress(array) for array in arrays]
+        binary_data['compression'] = 'deflate'
+    binary_data['positions'], binary_data['indices'] = [base64.b64encode(array).decode('ascii')
+                                                        for array in arrays]
+    return binary_data
+
+
 class DisplayMesh(dc.DessiaObject):
     """
     A DisplayMesh is a list of points linked by triangles.
     This is an abstract class for 2D & 3D.
+
+    The mesh can also be array-backed (see from_arrays): points and triangles are then lazy views built from the
+    vertices & faces arrays on first access.
     """
     _linesegment_class = volmdlr.edges.LineSegment
+    _node_class = None
+    _dimension = None
 
     def __init__(self, points, triangles, name=''):
 
-        self.points = points
-        self.triangles = triangles
+        self._points = points
+        self._triangles = triangles
+        self._vertices = None
+        self._faces = None
         # Avoiding calling dessia object init because its inefficiency
         # dc.DessiaObject.__init__(self, name=name)
         self.name = name
         self._point_index = None
 
+    @classmethod
+    def from_arrays(cls, vertices, faces, name: str = ''):
+        """
+        Defines a mesh stored as arrays.
+
+        :param vertices: (n, d) float array of vertices coordinates
+        :param faces: (m, 3) int array of vertices indices of each triangle
+        """
+        mesh = cls(None, None, name=name)
+        mesh._vertices = npy.asarray(vertices, dtype=npy.float64).reshape(-1, cls._dimension)
+        mesh._faces = npy.asarray(faces, dtype=npy.int32).reshape(-1, 3)
+        return mesh
+
+    @property
+    def points(self):
+        if self._points is None:
+            self._points = [self._node_class(*vertex) for vertex in self._vertices.tolist()]
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self._vertices = None
+        self._point_index = None
+
+    @property
+    def triangles(self):
+        if self._triangles is None:
+            self._triangles = [tuple(face) for face in self._faces.tolist()]
+        return self._triangles
+
+    @triangles.setter
+    def triangles(self, triangles):
+        self._triangles = triangles
+        self._faces = None
+
+    @property
+    def vertices(self):
+        """
+        Coordinates of the points as a (n, d) float64 array.
+        """
+        if self._vertices is not None:
+            return self._vertices
+        return npy.array([[*point] for point in self._points], dtype=npy.float64).reshape(-1, self._dimension)
+
+    @property
+    def faces(self):
+        """
+        Triangles as a (m, 3) int32 array.
+        """
+        if self._faces is not None:
+            return self._faces
+        return npy.array(self._triangles, dtype=npy.int32).reshape(-1, 3)
+
     def check(self):
-        npoints = len(self.points)
-        for triangle in self.triangles:
-            if max(triangle) >= npoints:
-                return False
-        return True
+        faces = self.faces
+        return not faces.shape[0] or faces.max() < self.vertices.shape[0]
 
     @property
     def point_index(self):
@@ -83,83 +368,38 @@ class DisplayMesh(dc.DessiaObject):
         return self._point_index
 
     @classmethod
-    def merge_meshes(cls, meshes: List['DisplayMesh']):
+    def merge_meshes(cls, meshes: List['DisplayMesh'], tolerance: float = 1e-6):
         """
         Merge several meshes into one.
+
+        Concatenation is done in one pass on arrays, then vertices are welded on a grid of step tolerance (see
+        weld_vertices).
         """
-        # Collect points
-        ip = 0
-        point_index = {}
-        points = []
+        if not meshes:
+            return cls([], [])
         if len(meshes) == 1:
-            return cls(meshes[0].points, meshes[0].triangles)
-        for mesh in meshes:
-            for point in mesh.points:
-                if point not in point_index:
-                    point_index[point] = ip
-                    ip += 1
-                    points.append(point)
-
-        triangles = []
-        for mesh in meshes:
-            for i1, i2, i3 in mesh.triangles:
-                p1 = mesh.points[i1]
-                p2 = mesh.points[i2]
-                p3 = mesh.points[i3]
-                triangles.append((point_index[p1],
-                                  point_index[p2],
-                                  point_index[p3]))
-        return cls(points, triangles)
-
-    def merge_mesh(self, other_mesh):
-        # new_points = self.points[:]
-        # new_point_index = self.point_index.copy()
-        ip = len(self.points)
-        # point_index
-        # t1 = time.time()
-        for point in other_mesh.points:
-            if point not in self.point_index:
-                self.point_index[point] = ip
-                ip += 1
-                self.points.append(point)
-
-        # new_triangles = self.triangles[:]
-        # t2 = time.time()
-        for i1, i2, i3 in other_mesh.triangles:
-            p1 = other_mesh.points[i1]
-            p2 = other_mesh.points[i2]
-            p3 = other_mesh.points[i3]
-            self.triangles.append((self._point_index[p1],
-                                   self._point_index[p2],
-                                   self._point_index[p3]))
-
-        # t3 = time.time()
-        # print('t', t2-t1, t3-t2)
-        # self._point_index = new_point_index
+            return cls.from_arrays(meshes[0].vertices, meshes[0].faces)
+        vertices = [mesh.vertices for mesh in meshes]
+        offsets = npy.cumsum([0] + [mesh_vertices.shape[0] for mesh_vertices in vertices[:-1]])
+        faces = npy.concatenate([mesh.faces + offset for mesh, offset in zip(meshes, offsets)])
+        return cls.from_arrays(*weld_vertices(npy.concatenate(vertices), faces, tolerance))
+
+    def merge_mesh(self, other_mesh, tolerance: float = 1e-6):
+        """
+        Merge other mesh into this one (inplace).
+        """
+        merged_mesh = self.merge_meshes([self, other_mesh], tolerance=tolerance)
+        self._vertices = merged_mesh.vertices
+        self._faces = merged_mesh.faces
+        self._points = None
+        self._triangles = None
+        self._point_index = None
 
     def __add__(self, other_mesh):
         """
         Defines how to add two meshes.
         """
-        new_points = self.points[:]
-        new_point_index = self.point_index.copy()
-        ip = len(new_points)
-        for point in other_mesh.points:
-            if point not in new_point_index:
-                new_point_index[point] = ip
-                ip += 1
-                new_points.append(point)
-
-        new_triangles = self.triangles[:]
-        for i1, i2, i3 in other_mesh.triangles:
-            p1 = other_mesh.points[i1]
-            p2 = other_mesh.points[i2]
-            p3 = other_mesh.points[i3]
-            new_triangles.append((new_point_index[p1],
-                                  new_point_index[p2],
-                                  new_point_index[p3]))
-
-        return self.__class__(new_points, new_triangles)
+        return self.merge_meshes([self, other_mesh])
 
     def plot(self, ax=None, numbering=False):
         """Plots the mesh with matplotlib."""
@@ -191,6 +431,8 @@ class DisplayMesh2D(DisplayMesh):
 
     _linesegment_class = volmdlr.edges.LineSegment2D
     _point_class = volmdlr.Point2D
+    _node_class = Node2D
+    _dimension = 2
 
     def __init__(self, points: List[volmdlr.Point2D],
                  triangles: List[Tuple[int, int, int]],
@@ -202,13 +444,10 @@ class DisplayMesh2D(DisplayMesh):
         """
         Return the area as the sum of areas of triangles.
         """
-        area = 0.
-        for (n1, n2, n3) in self.triangles:
-            p1 = self.points[n1]
-            p2 = self.points[n2]
-            p3 = self.points[n3]
-            area += 0.5 * abs((p2 - p1).cross(p3 - p1))
-        return area
+        triangles_points = self.vertices[self.faces]
+        vectors1 = triangles_points[:, 1] - triangles_points[:, 0]
+        vectors2 = triangles_points[:, 2] - triangles_points[:, 0]
+        return 0.5 * float(npy.abs(vectors1[:, 0] * vectors2[:, 1] - vectors1[:, 1] * vectors2[:, 0]).sum())
 
 
 class DisplayMesh3D(DisplayMesh):
@@ -219,27 +458,39 @@ class DisplayMesh3D(DisplayMesh):
 
     _linesegment_class = volmdlr.edges.LineSegment3D
     _point_class = volmdlr.Point3D
+    _node_class = Node3D
+    _dimension = 3
 
     def __init__(self, points: List[volmdlr.Point3D],
                  triangles: List[Tuple[int, int, int]], name=''):
         DisplayMesh.__init__(self, points, triangles, name=name)
 
+    def mass_properties(self):
+        """
+        Computes the mass properties of the solid bounded by the mesh, see triangles_mass_properties.
+
+        :return: The volume, the area, the center of mass and the (3, 3) inertia tensor at the center of mass for a
+            unit density.
+        :rtype: Tuple[float, float, volmdlr.Point3D, numpy.ndarray]
+        """
+        volume, area, center_of_mass, inertia_tensor = triangles_mass_properties(self.vertices[self.faces])
+        return volume, area, volmdlr.Point3D(*center_of_mass.tolist()), inertia_tensor
+
     def to_babylon(self):
         """
         Returns mesh in babylon format.
 
         https://doc.babylonjs.com/how_to/custom
         """
-        positions = []
-        for p in self.points:
-            # positions.extend(list(round(p, 6)))
-            # Not using round for performance
-            positions.extend([int(1e6 * p.x) / 1e6, int(1e6 * p.y) / 1e6, int(1e6 * p.z) / 1e6])
+        # Truncating instead of rounding for performance
+        positions = npy.trunc(1e6 * self.vertices) / 1e6
+        return positions.ravel().tolist(), self.faces.ravel().tolist()
 
-        flatten_indices = []
-        for i in self.triangles:
-            flatten_indices.extend(i)
-        return positions, flatten_indices
+    def to_babylon_binary(self, quantize: bool = False, compress: bool = False):
+        """
+        Returns mesh in babylon format, as base64 encoded typed arrays. See babylon_binary_data.
+        """
+        return babylon_binary_data(self.vertices, self.faces, quantize=quantize, compress=compress)
 
     def to_stl(self):
         """
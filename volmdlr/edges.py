@@ -18,16 +18,20 @@ import scipy as scp
 import scipy.integrate as scipy_integrate
 import scipy.optimize
 from geomdl import NURBS, BSpline, fitting, operations, utilities
-from geomdl.operations import length_curve, split_curve
+from geomdl.operations import split_curve
 from matplotlib import __version__ as _mpl_version
 from mpl_toolkits.mplot3d import Axes3D
 from packaging import version
 
+import volmdlr.bspline_compiled
 import volmdlr.core
 import volmdlr.core_compiled
 import volmdlr.geometry
 import volmdlr.utils.intersections as vm_utils_intersections
 
+ABSCISSA_TABLE_SIZE = 200
+GAUSS_LEGENDRE_NODES, GAUSS_LEGENDRE_WEIGHTS = npy.polynomial.legendre.leggauss(5)
+
 
 def standardize_knot_vector(knot_vector):
     """
@@ -561,31 +565,188 @@ class BSplineCurve(Edge):
         self.weights = weights
         self.periodic = periodic
 
-        points = [[*point] for point in control_points]
-        if weights is None:
-            curve = BSpline.Curve()
-            curve.degree = degree
-            curve.ctrlpts = points
-        else:
-            curve = NURBS.Curve()
-            curve.degree = degree
-            curve.ctrlpts = points
-            curve.weights = weights
+        self._curve = None
+        self._points = None
+        self._length = None
+        self._evaluation_data = None
+        self._abscissa_table = None
 
-        knot_vector = []
-        for i, knot in enumerate(knots):
-            knot_vector.extend([knot] * knot_multiplicities[i])
-        curve.knotvector = knot_vector
-        curve.delta = 0.01
-        curve_points = curve.evalpts
-        self.curve = curve
+        start, end = self.evaluate(npy.array(self.domain))[0]
+        point_class = getattr(volmdlr, f'Point{self.__class__.__name__[-2::]}')
+        Edge.__init__(self, point_class(*start), point_class(*end), name=name)
 
+    @property
+    def knotvector(self):
+        """
+        Gets the knot vector with each knot repeated according to its multiplicity.
+
+        :return: The expanded knot vector.
+        :rtype: List[float]
+        """
+        return [knot for knot, multiplicity in zip(self.knots, self.knot_multiplicities)
+                for _ in range(multiplicity)]
+
+    @property
+    def domain(self):
+        """
+        Gets the parametric domain of the curve.
+
+        :return: The first and last valid parameters.
+        :rtype: Tuple[float, float]
+        """
+        knotvector = self.knotvector
+        return knotvector[self.degree], knotvector[-(self.degree + 1)]
+
+    @property
+    def curve(self):
+        """
+        Gets the geomdl curve equivalent to the B-spline curve, built only when first needed.
+
+        :return: A geomdl BSpline or NURBS curve.
+        """
+        if self._curve is None:
+            points = [[*point] for point in self.control_points]
+            if self.weights is None:
+                curve = BSpline.Curve()
+                curve.degree = self.degree
+                curve.ctrlpts = points
+            else:
+                curve = NURBS.Curve()
+                curve.degree = self.degree
+                curve.ctrlpts = points
+                curve.weights = self.weights
+            curve.knotvector = self.knotvector
+            curve.delta = 0.01
+            self._curve = curve
+        return self._curve
+
+    @curve.setter
+    def curve(self, curve):
+        self._curve = curve
+        self._points = None
         self._length = None
-        self.points = [getattr(volmdlr,
-                               f'Point{self.__class__.__name__[-2::]}')(*p)
-                       for p in curve_points]
+        self._evaluation_data = None
+        self._abscissa_table = None
 
-        Edge.__init__(self, self.points[0], self.points[-1], name=name)
+    @property
+    def points(self):
+        """
+        Gets 100 points evenly spaced in the parametric domain of the curve, computed only when first needed.
+
+        :return: The sample points of the curve.
+        :rtype: Union[List[:class:`volmdlr.Point2D`], List[:class:`volmdlr.Point3D`]]
+        """
+        if self._points is None:
+            point_class = getattr(volmdlr, f'Point{self.__class__.__name__[-2::]}')
+            self._points = [point_class(*point) for point in self.evaluate(npy.linspace(*self.domain, 100))[0]]
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+
+    def _get_evaluation_data(self):
+        """
+        Gets the arrays used by the compiled evaluation, computed once per curve.
+
+        Rational curves are evaluated in homogeneous coordinates: the control points are multiplied by their
+        weights and the weights are appended as the last coordinate.
+        """
+        if self._evaluation_data is None:
+            knotvector = npy.array(self.knotvector, dtype=npy.float64)
+            control_points = npy.array([[*point] for point in self.control_points], dtype=npy.float64)
+            if self.weights is not None:
+                weights = npy.array(self.weights, dtype=npy.float64)
+                control_points = npy.hstack((control_points * weights[:, None], weights[:, None]))
+            self._evaluation_data = (knotvector, control_points)
+        return self._evaluation_data
+
+    def evaluate(self, parameters, derivative_order: int = 0):
+        """
+        Evaluates the curve and its derivatives at many parameters at once.
+
+        :param parameters: The parameters at which the curve is evaluated.
+        :type parameters: numpy.ndarray
+        :param derivative_order: The highest derivative order to compute. Default value is 0.
+        :type derivative_order: int, optional
+        :return: An array of shape (derivative_order + 1, number of parameters, dimension). Its first item holds
+            the points of the curve, the following ones its successive derivatives.
+        :rtype: numpy.ndarray
+        """
+        knotvector, control_points = self._get_evaluation_data()
+        parameters = npy.ascontiguousarray(parameters, dtype=npy.float64)
+        derivatives = volmdlr.bspline_compiled.curve_derivatives(self.degree, knotvector, control_points,
+                                                                 parameters, derivative_order)
+        if self.weights is None:
+            return derivatives
+        # Quotient rule on homogeneous coordinates (NURBS Book, eq. 4.8)
+        weighted_derivatives = derivatives[:, :, :-1]
+        weights_derivatives = derivatives[:, :, -1:]
+        rational_derivatives = npy.empty_like(weighted_derivatives)
+        for k in range(derivative_order + 1):
+            value = weighted_derivatives[k].copy()
+            for i in range(1, k + 1):
+                value -= math.comb(k, i) * weights_derivatives[i] * rational_derivatives[k - i]
+            rational_derivatives[k] = value / weights_derivatives[0]
+        return rational_derivatives
+
+    def _get_abscissa_table(self):
+        """
+        Gets the table of equivalence between parameters and curvilinear abscissas, computed once per curve.
+
+        The length of each interval of the table is integrated with a Gauss-Legendre quadrature of the speed.
+
+        :return: The parameters and their cumulated abscissas from the start of the curve.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        if self._abscissa_table is None:
+            parameters = npy.linspace(*self.domain, ABSCISSA_TABLE_SIZE + 1)
+            lengths = self._integrate_speed(parameters[:-1], parameters[1:])
+            self._abscissa_table = (parameters, npy.concatenate(([0.], npy.cumsum(lengths))))
+        return self._abscissa_table
+
+    def _integrate_speed(self, start_parameters, end_parameters):
+        """Computes the lengths of the curve between arrays of parameters with a Gauss-Legendre quadrature."""
+        half_widths = 0.5 * (end_parameters - start_parameters)
+        middles = 0.5 * (end_parameters + start_parameters)
+        gauss_parameters = middles[:, None] + half_widths[:, None] * GAUSS_LEGENDRE_NODES[None, :]
+        speeds = npy.linalg.norm(self.evaluate(gauss_parameters.ravel(), 1)[1], axis=1)
+        return half_widths * (speeds.reshape(gauss_parameters.shape) @ GAUSS_LEGENDRE_WEIGHTS)
+
+    def abscissas_to_parameters(self, abscissas, tol: float = 1e-10, max_iterations: int = 10):
+        """
+        Computes the parameters of the curve at many curvilinear abscissas at once.
+
+        The cached abscissa table gives the interval of each abscissa by binary search, the parameter is then
+        refined with Newton iterations.
+
+        :param abscissas: The distances on the curve from its start.
+        :type abscissas: numpy.ndarray
+        :param tol: The precision in terms of distance. Default value is 1e-10.
+        :type tol: float, optional
+        :param max_iterations: The maximum number of Newton iterations. Default value is 10.
+        :type max_iterations: int, optional
+        :return: The parameters of the curve.
+        :rtype: numpy.ndarray
+        """
+        table_parameters, table_abscissas = self._get_abscissa_table()
+        abscissas = npy.clip(npy.asarray(abscissas, dtype=npy.float64).ravel(), 0., table_abscissas[-1])
+        indices = npy.clip(npy.searchsorted(table_abscissas, abscissas, side='right') - 1,
+                           0, len(table_parameters) - 2)
+        start_parameters, end_parameters = table_parameters[indices], table_parameters[indices + 1]
+        start_abscissas, end_abscissas = table_abscissas[indices], table_abscissas[indices + 1]
+        interval_lengths = end_abscissas - start_abscissas
+        ratios = npy.divide(abscissas - start_abscissas, interval_lengths,
+                            out=npy.zeros_like(abscissas), where=interval_lengths > 0)
+        parameters = start_parameters + ratios * (end_parameters - start_parameters)
+        for _ in range(max_iterations):
+            errors = start_abscissas + self._integrate_speed(start_parameters, parameters) - abscissas
+            if not errors.size or npy.abs(errors).max() < tol:
+                break
+            speeds = npy.linalg.norm(self.evaluate(parameters, 1)[1], axis=1)
+            steps = npy.divide(errors, speeds, out=npy.zeros_like(errors), where=speeds > 0)
+            parameters = npy.clip(parameters - steps, start_parameters, end_parameters)
+        return parameters
 
     def to_dict(self, *args, **kwargs):
         """Avoids storing points in memo that makes serialization slow."""
@@ -638,11 +799,13 @@ class BSplineCurve(Edge):
         """
         Returns the length of the B-spline curve.
 
+        It is the last abscissa of the abscissa table, so that all the abscissas up to the length are valid.
+
         :return: The length of the B-spline curve.
         :rtype: float
         """
         if not self._length:
-            self._length = length_curve(self.curve)
+            self._length = float(self._get_abscissa_table()[1][-1])
         return self._length
 
     def unit_direction_vector(self, abscissa: float):
@@ -4432,13 +4595,12 @@ class BSplineCurve3D(BSplineCurve):
         """
         Returns the 3 dimensional point at a given curvilinear abscissa.
 
-        This is an approximation. Resolution parameter can be increased
-        for more accurate result.
+        The parameter is searched in the cached abscissa table of the curve and refined with Newton iterations.
 
         :param abscissa: The distance on the BSplineCurve3D from its start
         :type abscissa: float
-        :param resolution: The precision of the approximation. Default value
-            set to 1000
+        :param resolution: Deprecated, kept for compatibility. The precision
+            no longer depends on it
         :type resolution: int, optional
         :return: The Point3D at the given curvilinear abscissa.
         :rtype: :class:`volmdlr.Point3D`
@@ -4447,19 +4609,22 @@ class BSplineCurve3D(BSplineCurve):
             return self.start
         if math.isclose(abscissa, self.length(), abs_tol=1e-10):
             return self.end
-        lut = self.look_up_table(resolution=resolution)
         if 0 < abscissa < self.length():
-            last_param = 0
-            for t, dist in lut:
-                if abscissa < dist:
-                    t1 = last_param
-                    t2 = t
-                    return volmdlr.Point3D(
-                        *self.curve.evaluate_single((t1 + t2) / 2))
-                last_param = t
+            return volmdlr.Point3D(*self.points_at_abscissas(npy.array([abscissa]))[0])
         raise ValueError('Curvilinear abscissa is bigger than length,'
                          ' or negative')
 
+    def points_at_abscissas(self, abscissas):
+        """
+        Computes the points of the curve at many curvilinear abscissas at once.
+
+        :param abscissas: The distances on the BSplineCurve3D from its start.
+        :type abscissas: numpy.ndarray
+        :return: An array of shape (number of abscissas, 3) with the points coordinates.
+        :rtype: numpy.ndarray
+        """
+        return self.evaluate(self.abscissas_to_parameters(abscissas))[0]
+
     def normal(self, position: float = 0.0):
         _, normal = operations.normal(self.curve, position, normalize=True)
         normal = volmdlr.Point3D(normal[0], normal[1], normal[2])
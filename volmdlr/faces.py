@@ -3,7 +3,10 @@ Surfaces & faces
 """
 
 import math
+import os
 import warnings
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from itertools import chain, product
 from typing import List, Tuple, Union
 
@@ -13,6 +16,7 @@ import numpy as npy
 import scipy as scp
 import scipy.optimize as opt
 import triangle as triangle_lib
+from scipy.spatial import cKDTree
 
 from geomdl import NURBS, BSpline, utilities
 from geomdl.construct import extract_curves
@@ -31,7 +35,6 @@ import volmdlr.geometry
 import volmdlr.grid
 import volmdlr.utils.parametric as vm_parametric
 import volmdlr.wires
-from volmdlr.utils.parametric import array_range_search
 
 
 def knots_vector_inv(knots_vector):
@@ -169,8 +172,8 @@ class Surface2D(volmdlr.core.Primitive2D):
         if not self.inner_contours and not triangulates_with_grid:
             return outer_polygon.triangulation()
 
-        points_grid, x, y, grid_point_index = outer_polygon.grid_triangulation_points(number_points_x=number_points_x,
-                                                                                      number_points_y=number_points_y)
+        vertices_grid, _, _, _ = outer_polygon.grid_triangulation_vertices(number_points_x=number_points_x,
+                                                                           number_points_y=number_points_y)
         points = [vmd.Node2D(*p) for p in outer_polygon.points]
         vertices = [(p.x, p.y) for p in points]
         n = len(points)
@@ -178,8 +181,7 @@ class Surface2D(volmdlr.core.Primitive2D):
         segments.append((n - 1, 0))
 
         if not self.inner_contours:  # No holes
-            vertices_grid = [(p.x, p.y) for p in points_grid]
-            vertices.extend(vertices_grid)
+            vertices.extend(vertices_grid.tolist())
             tri = {'vertices': npy.array(vertices).reshape((-1, 2)),
                    'segments': npy.array(segments).reshape((-1, 2)),
                    }
@@ -191,6 +193,7 @@ class Surface2D(volmdlr.core.Primitive2D):
 
         point_index = {p: i for i, p in enumerate(points)}
         holes = []
+        grid_vertices_kept = npy.ones(len(vertices_grid), dtype=bool)
         for inner_contour in self.inner_contours:
             inner_polygon = inner_contour.to_polygon(angle_resolution=10, discretize_line=triangulates_with_grid)
             inner_polygon_nodes = [vmd.Node2D.from_point(p) for p in inner_polygon.points]
@@ -213,20 +216,13 @@ class Surface2D(volmdlr.core.Primitive2D):
             if triangulates_with_grid:
                 # removes with a region search the grid points that are in the inner contour
                 xmin, xmax, ymin, ymax = inner_polygon.bounding_rectangle.bounds()
-                x_grid_range = array_range_search(x, xmin, xmax)
-                y_grid_range = array_range_search(y, ymin, ymax)
-                for i in x_grid_range:
-                    for j in y_grid_range:
-                        point = grid_point_index.get((i, j))
-                        if not point:
-                            continue
-                        if inner_polygon.point_belongs(point):
-                            points_grid.remove(point)
-                            grid_point_index.pop((i, j))
+                candidates = npy.flatnonzero(grid_vertices_kept &
+                                             (vertices_grid[:, 0] >= xmin) & (vertices_grid[:, 0] <= xmax) &
+                                             (vertices_grid[:, 1] >= ymin) & (vertices_grid[:, 1] <= ymax))
+                grid_vertices_kept[candidates[inner_polygon.points_belong(vertices_grid[candidates])]] = False
 
         if triangulates_with_grid:
-            vertices_grid = [(p.x, p.y) for p in points_grid]
-            vertices.extend(vertices_grid)
+            vertices.extend(vertices_grid[grid_vertices_kept].tolist())
 
         tri = {'vertices': npy.array(vertices).reshape((-1, 2)),
                'segments': npy.array(segments).reshape((-1, 2)),
@@ -921,6 +917,19 @@ class Surface3D(DessiaObject):
     def point2d_to_3d(self, point2d):
         raise NotImplementedError(f'point2d_to_3d is abstract and should be implemented in {self.__class__.__name__}')
 
+    def points2d_to_3d(self, points2d):
+        """
+        Computes the 3D points of the surface at many parametric points.
+
+        Surfaces with a vectorized evaluation override this method.
+
+        :param points2d: An array of shape (N, 2) of parametric coordinates, or a list of Point2D.
+        :return: An array of shape (N, 3) with the points coordinates.
+        :rtype: numpy.ndarray
+        """
+        points3d = [[*self.point2d_to_3d(volmdlr.Point2D(*point2d))] for point2d in points2d]
+        return npy.array(points3d, dtype=npy.float64).reshape(-1, 3)
+
     def point3d_to_2d(self, point3d):
         """
         Abstract method. Convert a 3D point to a 2D parametric point.
@@ -3578,6 +3587,8 @@ class BSplineSurface3D(Surface3D):
         self._grids2d = None
         self._grids2d_deformed = None
         self._bbox = None
+        self._evaluation_data = None
+        self._inversion_grid = None
 
         self._x_periodicity = False  # Use False instead of None because None is a possible value of x_periodicity
         self._y_periodicity = False
@@ -3766,6 +3777,90 @@ class BSplineSurface3D(Surface3D):
         return volmdlr.Point3D(*self.derivatives(x, y, 0)[0][0])
         # return volmdlr.Point3D(*self.surface.evaluate_single((x, y)))
 
+    def _get_evaluation_data(self):
+        """
+        Gets the arrays used by the compiled evaluation, computed once per surface.
+
+        Rational surfaces are evaluated in homogeneous coordinates: the control points are multiplied by their
+        weights and the weights are appended as the last coordinate.
+        """
+        if self._evaluation_data is None:
+            knot_vector_u = npy.repeat(npy.array(self.u_knots, dtype=npy.float64), self.u_multiplicities)
+            knot_vector_v = npy.repeat(npy.array(self.v_knots, dtype=npy.float64), self.v_multiplicities)
+            control_points = npy.array([[*point] for point in self.control_points], dtype=npy.float64)
+            if self.weights is not None:
+                weights = npy.array(self.weights, dtype=npy.float64)
+                control_points = npy.hstack((control_points * weights[:, None], weights[:, None]))
+            self._evaluation_data = (knot_vector_u, knot_vector_v,
+                                     control_points.reshape(self.nb_u, self.nb_v, -1))
+        return self._evaluation_data
+
+    def evaluate(self, points2d, derivative_order: int = 0):
+        """
+        Evaluates the surface and its derivatives at many (u, v) parameters at once.
+
+        :param points2d: An array of shape (N, 2) of (u, v) parameters, or a list of Point2D.
+        :param derivative_order: The highest derivative order to compute. Default value is 0.
+        :type derivative_order: int, optional
+        :return: An array of shape (derivative_order + 1, derivative_order + 1, N, 3) where the item [k, l] holds
+            the derivatives of the surface k times with respect to u and l times with respect to v.
+        :rtype: numpy.ndarray
+        """
+        knot_vector_u, knot_vector_v, control_points = self._get_evaluation_data()
+        parameters = npy.array([[*point2d] for point2d in points2d] if isinstance(points2d, list) else points2d,
+                               dtype=npy.float64).reshape(-1, 2)
+        derivatives = volmdlr.bspline_compiled.surface_derivatives(
+            self.degree_u, self.degree_v, knot_vector_u, knot_vector_v, control_points,
+            npy.ascontiguousarray(parameters[:, 0]), npy.ascontiguousarray(parameters[:, 1]), derivative_order)
+        if self.weights is None:
+            return derivatives
+        # Algorithm A4.4 of the NURBS Book on homogeneous coordinates
+        weighted_derivatives = derivatives[:, :, :, :-1]
+        weights_derivatives = derivatives[:, :, :, -1:]
+        rational_derivatives = npy.empty_like(weighted_derivatives)
+        for k in range(derivative_order + 1):
+            for l in range(derivative_order + 1):
+                value = weighted_derivatives[k, l].copy()
+                for j in range(1, l + 1):
+                    value -= math.comb(l, j) * weights_derivatives[0, j] * rational_derivatives[k, l - j]
+                for i in range(1, k + 1):
+                    value -= math.comb(k, i) * weights_derivatives[i, 0] * rational_derivatives[k - i, l]
+                    for j in range(1, l + 1):
+                        value -= math.comb(k, i) * math.comb(l, j) * weights_derivatives[i, j] * \
+                            rational_derivatives[k - i, l - j]
+                rational_derivatives[k, l] = value / weights_derivatives[0, 0]
+        return rational_derivatives
+
+    def points2d_to_3d(self, points2d):
+        """
+        Computes the 3D points of the surface at many (u, v) parameters at once.
+
+        Like point2d_to_3d, parameters are clipped to the domain [0, 1] x [0, 1].
+
+        :param points2d: An array of shape (N, 2) of (u, v) parameters, or a list of Point2D.
+        :return: An array of shape (N, 3) with the points coordinates.
+        :rtype: numpy.ndarray
+        """
+        if isinstance(points2d, list):
+            points2d = [[*point2d] for point2d in points2d]
+        parameters = npy.clip(npy.array(points2d, dtype=npy.float64).reshape(-1, 2), 0., 1.)
+        return self.evaluate(parameters)[0, 0]
+
+    def evaluate_grid(self, u_parameters, v_parameters):
+        """
+        Computes the 3D points of the surface on the grid made by u and v parameters.
+
+        :param u_parameters: The u parameters of the grid.
+        :type u_parameters: numpy.ndarray
+        :param v_parameters: The v parameters of the grid.
+        :type v_parameters: numpy.ndarray
+        :return: An array of shape (len(u_parameters) * len(v_parameters), 3), v varying first.
+        :rtype: numpy.ndarray
+        """
+        u_grid, v_grid = npy.meshgrid(npy.asarray(u_parameters, dtype=npy.float64),
+                                      npy.asarray(v_parameters, dtype=npy.float64), indexing='ij')
+        return self.points2d_to_3d(npy.column_stack((u_grid.ravel(), v_grid.ravel())))
+
     def point3d_to_2d(self, point3d: volmdlr.Point3D, tol=1e-5):
         """
         Evaluates the parametric coordinates (u, v) of a 3D point (x, y, z).
@@ -3777,6 +3872,86 @@ class BSplineSurface3D(Surface3D):
         :return: The parametric coordinates (u, v) of the point.
         :rtype: :class:`volmdlr.Point2D`
         """
+        return volmdlr.Point2D(*self.points3d_to_2d([point3d], tol)[0])
+
+    def _get_inversion_grid(self):
+        """
+        Gets a KD-tree of points sampled on the surface, with their parameters, computed once per surface.
+
+        The grid has about three samples per control point in each direction.
+        """
+        if self._inversion_grid is None:
+            (min_bound_x, max_bound_x), (min_bound_y, max_bound_y) = self.surface.domain
+            u_parameters = npy.linspace(min_bound_x, max_bound_x, min(max(10, 3 * self.nb_u), 100))
+            v_parameters = npy.linspace(min_bound_y, max_bound_y, min(max(10, 3 * self.nb_v), 100))
+            u_grid, v_grid = npy.meshgrid(u_parameters, v_parameters, indexing='ij')
+            parameters = npy.column_stack((u_grid.ravel(), v_grid.ravel()))
+            self._inversion_grid = (cKDTree(self.evaluate(parameters)[0, 0]), parameters)
+        return self._inversion_grid
+
+    def points3d_to_2d(self, points3d, tol=1e-5, max_iterations: int = 20):
+        """
+        Evaluates the parametric coordinates (u, v) of many 3D points at once.
+
+        Initial guesses are the parameters of the closest points of a sample grid of the surface. They are refined
+        with Newton-Raphson iterations on the closest point equations, all points at once. Points farther than tol
+        from the surface after these iterations are solved one by one with an optimizer.
+
+        :param points3d: An array of shape (N, 3), or a list of Point3D.
+        :param tol: Tolerance to accept the results.
+        :type tol: float
+        :param max_iterations: The maximum number of Newton-Raphson iterations. Default value is 20.
+        :type max_iterations: int, optional
+        :return: An array of shape (N, 2) with the parametric coordinates of the points.
+        :rtype: numpy.ndarray
+        """
+        if isinstance(points3d, list):
+            points3d = [[*point3d] for point3d in points3d]
+        points = npy.array(points3d, dtype=npy.float64).reshape(-1, 3)
+        (min_bound_x, max_bound_x), (min_bound_y, max_bound_y) = self.surface.domain
+        tree, grid_parameters = self._get_inversion_grid()
+        parameters = grid_parameters[tree.query(points)[1]]
+
+        active = npy.arange(len(points))
+        for _ in range(max_iterations):
+            if not active.size:
+                break
+            derivatives = self.evaluate(parameters[active], 2)
+            residuals = derivatives[0, 0] - points[active]
+            s_u, s_v = derivatives[1, 0], derivatives[0, 1]
+            function_u = npy.einsum('ij,ij->i', residuals, s_u)
+            function_v = npy.einsum('ij,ij->i', residuals, s_v)
+            jacobian_uu = npy.einsum('ij,ij->i', s_u, s_u) + npy.einsum('ij,ij->i', residuals, derivatives[2, 0])
+            jacobian_uv = npy.einsum('ij,ij->i', s_u, s_v) + npy.einsum('ij,ij->i', residuals, derivatives[1, 1])
+            jacobian_vv = npy.einsum('ij,ij->i', s_v, s_v) + npy.einsum('ij,ij->i', residuals, derivatives[0, 2])
+            determinant = jacobian_uu * jacobian_vv - jacobian_uv ** 2
+            regular = npy.abs(determinant) > 1e-30
+            determinant[~regular] = 1.
+            delta_u = npy.where(regular, (jacobian_vv * function_u - jacobian_uv * function_v) / determinant, 0.)
+            delta_v = npy.where(regular, (jacobian_uu * function_v - jacobian_uv * function_u) / determinant, 0.)
+            new_parameters = npy.column_stack((npy.clip(parameters[active, 0] - delta_u, min_bound_x, max_bound_x),
+                                               npy.clip(parameters[active, 1] - delta_v, min_bound_y, max_bound_y)))
+            steps = npy.abs(new_parameters - parameters[active]).max(axis=1)
+            parameters[active] = new_parameters
+            active = active[steps > 1e-12]
+
+        distances = npy.linalg.norm(self.evaluate(parameters)[0, 0] - points, axis=1)
+        for i in npy.flatnonzero(distances > tol):
+            parameters[i] = self._point3d_to_2d_minimize(volmdlr.Point3D(*points[i]), tol, parameters[i])
+        return parameters
+
+    def _point3d_to_2d_minimize(self, point3d: volmdlr.Point3D, tol, initial_parameters):
+        """
+        Evaluates the parametric coordinates (u, v) of a 3D point with an optimizer started from several guesses.
+
+        :param point3d: A 3D point to be evaluated.
+        :type point3d: :class:`volmdlr.Point3D`
+        :param tol: Tolerance to accept the results.
+        :type tol: float
+        :param initial_parameters: The best known parameters, tried first.
+        :return: The parametric coordinates (u, v) of the point.
+        :rtype: numpy.ndarray
+        """
 
         def f(x):
             return point3d.point_distance(self.point2d_to_3d(volmdlr.Point2D(x[0], x[1])))
@@ -3801,19 +3976,20 @@ class BSplineSurface3D(Surface3D):
 
         # Sort the initial conditions
         x0s.sort(key=f)
+        x0s.insert(0, tuple(initial_parameters))
 
         # Find the parametric coordinates of the point
-        results = []
+        results = [(npy.array(initial_parameters), f(initial_parameters))]
         for x0 in x0s:
             res = scp.optimize.minimize(fun, x0=npy.array(x0), jac=True,
                                         bounds=[(min_bound_x, max_bound_x),
                                                 (min_bound_y, max_bound_y)])
             if res.fun <= tol:
-                return volmdlr.Point2D(*res.x)
+                return res.x
 
             results.append((res.x, res.fun))
 
-        return volmdlr.Point2D(*min(results, key=lambda r: r[1])[0])
+        return min(results, key=lambda r: r[1])[0]
 
     def linesegment2d_to_3d(self, linesegment2d):
         # TODO: this is a non exact method!
@@ -4003,7 +4179,8 @@ class BSplineSurface3D(Surface3D):
             # lth = bspline_curve3d.start.point_distance(bspline_curve3d.end)
             if lth > 1e-5:
                 n = len(bspline_curve3d.control_points)
-                points = [self.point3d_to_2d(p) for p in bspline_curve3d.discretization_points(number_points=n)]
+                points = [volmdlr.Point2D(*point2d) for point2d in self.points3d_to_2d(
+                    bspline_curve3d.discretization_points(number_points=n))]
                 if points[0] != points[-1]:
                     linesegment = vme.LineSegment2D(points[0], points[-1])
                     flag_line = True
@@ -4152,6 +4329,8 @@ class BSplineSurface3D(Surface3D):
         new_bsplinesurface3d = self.rotation(center, axis, angle)
         self.control_points = new_bsplinesurface3d.control_points
         self.surface = new_bsplinesurface3d.surface
+        self._evaluation_data = None
+        self._inversion_grid = None
 
     def translation(self, offset: volmdlr.Vector3D):
         """
@@ -4183,6 +4362,8 @@ class BSplineSurface3D(Surface3D):
         new_bsplinesurface3d = self.translation(offset)
         self.control_points = new_bsplinesurface3d.control_points
         self.surface = new_bsplinesurface3d.surface
+        self._evaluation_data = None
+        self._inversion_grid = None
 
     def frame_mapping(self, frame: volmdlr.Frame3D, side: str):
         """
@@ -4212,6 +4393,8 @@ class BSplineSurface3D(Surface3D):
         new_bsplinesurface3d = self.frame_mapping(frame, side)
         self.control_points = new_bsplinesurface3d.control_points
         self.surface = new_bsplinesurface3d.surface
+        self._evaluation_data = None
+        self._inversion_grid = None
 
     def plot(self, ax=None, color='grey', alpha=0.5):
         u_curves = [vme.BSplineCurve3D.from_geomdl_curve(u) for u in self.curves['u']]
@@ -5646,6 +5829,7 @@ class Face3D(volmdlr.core.Primitive3D):
         self.surface2d = surface2d
         self._outer_contour3d = None
         self._inner_contours3d = None
+        self._triangulation = None
         # self.bounding_box = self._bounding_box()
 
         volmdlr.core.Primitive3D.__init__(self, name=name)
@@ -5824,11 +6008,77 @@ class Face3D(volmdlr.core.Primitive3D):
         """
         return [0, 0]
 
+    def triangulation_key(self):
+        """
+        Gets the key identifying a triangulation of the face: its hash and the size of the discretization grid.
+        """
+        return (hash(self), *self.grid_size())
+
+    def cached_triangulation(self, key=None):
+        """
+        Gets the arrays of the cached triangulation of the face.
+
+        :param key: The key the cached triangulation must have. Default is the current triangulation key of the face.
+        :return: The (vertices, faces) arrays of the cached triangulation, or None if there is none for this key.
+        """
+        if self._triangulation is None:
+            return None
+        if key is None:
+            key = self.triangulation_key()
+        cached_key, vertices, faces = self._triangulation
+        if cached_key != key:
+            return None
+        return vertices, faces
+
+    def set_cached_triangulation(self, vertices, faces, key=None):
+        """
+        Caches the arrays of a triangulation. They are made read only as they are shared by the returned meshes.
+
+        :param vertices: The (n, 3) array of the vertices of the triangulation.
+        :param faces: The (m, 3) array of the vertices indices of the triangles.
+        :param key: The key of the triangulation. Default is the current triangulation key of the face.
+        """
+        if key is None:
+            key = self.triangulation_key()
+        vertices.setflags(write=False)
+        faces.setflags(write=False)
+        self._triangulation = (key, vertices, faces)
+
     def triangulation(self):
-        number_points_x, number_points_y = self.grid_size()
-        mesh2d = self.surface2d.triangulation(number_points_x, number_points_y)
-        return vmd.DisplayMesh3D([vmd.Node3D(*self.surface3d.point2d_to_3d(p)) for p in mesh2d.points],
-                                 mesh2d.triangles)
+        """
+        Triangulates the face.
+
+        The triangulation is cached until the face is transformed inplace or its hash or grid size change.
+
+        :return: The triangulated face as a display mesh.
+        :rtype: :class:`volmdlr.display.DisplayMesh3D`
+        """
+        key = self.triangulation_key()
+        arrays = self.cached_triangulation(key)
+        if arrays is None:
+            number_points_x, number_points_y = key[1:]
+            mesh2d = self.surface2d.triangulation(number_points_x, number_points_y)
+            arrays = (self.surface3d.points2d_to_3d(mesh2d.vertices),
+                      npy.array(mesh2d.faces, dtype=npy.int32).reshape(-1, 3))
+            self.set_cached_triangulation(*arrays, key=key)
+        return vmd.DisplayMesh3D.from_arrays(*arrays)
+
+    def _transfer_triangulation(self, new_face, point_transformation):
+        """
+        Gives the cached triangulation of the face, if any, to a transformed copy of it.
+
+        :param new_face: The transformed copy of the face.
+        :param point_transformation: The affine transformation applied to the face, as a function of a Point3D.
+        :return: new_face
+        """
+        arrays = self.cached_triangulation()
+        if arrays is not None:
+            vertices, faces = arrays
+            origin = point_transformation(volmdlr.O3D)
+            matrix = npy.array([[*(point_transformation(point) - origin)]
+                                for point in (volmdlr.X3D, volmdlr.Y3D, volmdlr.Z3D)])
+            new_face.set_cached_triangulation(vertices @ matrix + npy.array([*origin]), faces)
+        return new_face
 
     def plot2d(self, ax=None, color='k', alpha=1):
         if ax is None:
@@ -5847,7 +6097,8 @@ class Face3D(volmdlr.core.Primitive3D):
         """
         new_surface = self.surface3d.rotation(center=center, axis=axis,
                                               angle=angle)
-        return self.__class__(new_surface, self.surface2d)
+        return self._transfer_triangulation(self.__class__(new_surface, self.surface2d),
+                                            lambda point: point.rotation(center, axis, angle))
 
     def rotation_inplace(self, center: volmdlr.Point3D,
                          axis: volmdlr.Vector3D, angle: float):
@@ -5867,6 +6118,7 @@ class Face3D(volmdlr.core.Primitive3D):
         self.surface3d.rotation_inplace(center=center, axis=axis, angle=angle)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._triangulation = None
 
     def translation(self, offset: volmdlr.Vector3D):
         """
@@ -5877,7 +6129,8 @@ class Face3D(volmdlr.core.Primitive3D):
         :return: A new translated Face3D
         """
         new_surface3d = self.surface3d.translation(offset=offset)
-        return self.__class__(new_surface3d, self.surface2d)
+        return self._transfer_triangulation(self.__class__(new_surface3d, self.surface2d),
+                                            lambda point: point.translation(offset))
 
     def translation_inplace(self, offset: volmdlr.Vector3D):
         """
@@ -5890,6 +6143,7 @@ class Face3D(volmdlr.core.Primitive3D):
         self.surface3d.translation_inplace(offset=offset)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._triangulation = None
 
     def frame_mapping(self, frame: volmdlr.Frame3D, side: str):
         """
@@ -5898,8 +6152,8 @@ class Face3D(volmdlr.core.Primitive3D):
         side = 'old' or 'new'
         """
         new_surface3d = self.surface3d.frame_mapping(frame, side)
-        return self.__class__(new_surface3d, self.surface2d.copy(),
-                              self.name)
+        return self._transfer_triangulation(self.__class__(new_surface3d, self.surface2d.copy(), self.name),
+                                            lambda point: point.frame_mapping(frame, side))
 
     def frame_mapping_inplace(self, frame: volmdlr.Frame3D, side: str):
         """
@@ -5912,6 +6166,7 @@ class Face3D(volmdlr.core.Primitive3D):
         self.surface3d.frame_mapping_inplace(frame, side)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._triangulation = None
 
     def copy(self, deep=True, memo=None):
         return self.__class__(self.surface3d.copy(deep, memo), self.surface2d.copy(),
@@ -8712,6 +8967,78 @@ class BSplineFace3D(Face3D):
         return merged_face
 
 
+def points_triangles_distances(points, triangles):
+    """
+    Computes the distances of points to triangles, pairwise.
+
+    :param points: The points, as a (n, 3) array.
+    :param triangles: The vertices of the triangles, as a (n, 3, 3) array.
+    :return: The distance of each point to its triangle, as a (n,) array.
+    :rtype: numpy.ndarray
+    """
+    edges = [(triangles[:, 0], triangles[:, 1]), (triangles[:, 1], triangles[:, 2]), (triangles[:, 2], triangles[:, 0])]
+    normals = npy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    normals_norms = npy.linalg.norm(normals, axis=1)
+    distances = npy.full(len(points), npy.inf)
+    projection_inside = normals_norms > 0.
+    for start, end in edges:
+        direction = end - start
+        squared_length = npy.einsum('ij,ij->i', direction, direction)
+        parameters = npy.clip(npy.einsum('ij,ij->i', points - start, direction)
+                              / npy.where(squared_length > 0., squared_length, 1.), 0., 1.)
+        distances = npy.minimum(distances, npy.linalg.norm(points - start - parameters[:, None] * direction, axis=1))
+        projection_inside &= npy.einsum('ij,ij->i', npy.cross(direction, points - start), normals) >= 0.
+    planes_distances = (npy.abs(npy.einsum('ij,ij->i', points - triangles[:, 0], normals))
+                        / npy.where(projection_inside, normals_norms, 1.))
+    return npy.where(projection_inside, npy.minimum(planes_distances, distances), distances)
+
+
+def faces_triangulation_arrays(faces):
+    """
+    Triangulates faces and returns the arrays of their meshes.
+
+    Used to triangulate faces in a worker process, arrays being much lighter to send back than nodes.
+
+    :param faces: The faces to triangulate.
+    :return: A list of (vertices, triangles) arrays, one per face.
+    """
+    return [(mesh.vertices, mesh.faces) for mesh in (face.triangulation() for face in faces)]
+
+
+def triangulate_faces(faces, workers: int = None, executor=None):
+    """
+    Triangulates faces, in a pool of processes if workers > 1 or an executor is given.
+
+    Faces are sent to the workers by chunks. The arrays of the meshes they send back are stored in the triangulation
+    cache of the faces, so that the next calls of their triangulation method return immediately.
+
+    :param faces: The faces to triangulate.
+    :param workers: The number of processes of the pool. Default is None, triangulating in the current process.
+    :param executor: An executor to use instead of creating a pool, for instance to share it between calls.
+    :return: The list of the triangulations of the faces.
+    :rtype: List[:class:`volmdlr.display.DisplayMesh3D`]
+    """
+    if (workers is not None and workers > 1) or executor is not None:
+        # Only faces using the cached triangulation of Face3D benefit from triangulating in other processes
+        faces_to_triangulate = [face for face in faces
+                                if face.__class__.triangulation is Face3D.triangulation
+                                and face.cached_triangulation() is None]
+        if faces_to_triangulate:
+            number_chunks = 4 * (workers or os.cpu_count() or 1)
+            chunk_size = max(1, -(-len(faces_to_triangulate) // number_chunks))
+            chunks = [faces_to_triangulate[i:i + chunk_size]
+                      for i in range(0, len(faces_to_triangulate), chunk_size)]
+            if executor is None:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(faces_triangulation_arrays, chunks))
+            else:
+                results = list(executor.map(faces_triangulation_arrays, chunks))
+            for chunk, arrays in zip(chunks, results):
+                for face, (vertices, triangles) in zip(chunk, arrays):
+                    face.set_cached_triangulation(vertices, triangles)
+    return [face.triangulation() for face in faces]
+
+
 class OpenShell3D(volmdlr.core.CompositePrimitive3D):
     """
     A 3D open shell composed of multiple faces.
@@ -8756,7 +9083,8 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
         else:
             self._bbox = None
 
-        self._faces_graph = None
+        # Faces graph and bounding volume hierarchies, computed when first needed
+        self._faces_caches = {}
 
         volmdlr.core.CompositePrimitive3D.__init__(self,
                                                    primitives=faces, color=color, alpha=alpha,
@@ -8776,13 +9104,53 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
 
     @property
     def faces_graph(self):
-        if not self._faces_graph:
+        if not self._faces_caches.get('graph'):
             faces_graph = nx.Graph()
             for face in self.faces:
                 for edge in face.outer_contour3d.primitives:
                     faces_graph.add_edge(edge.start, edge.end, edge=edge)
-            self._faces_graph = faces_graph
-        return self._faces_graph
+            self._faces_caches['graph'] = faces_graph
+        return self._faces_caches['graph']
+
+    @property
+    def faces(self):
+        """The faces of the shell."""
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        """Sets the faces of the shell, resetting the caches computed from them."""
+        self._faces = faces
+        self._faces_caches = {}
+
+    @property
+    def faces_bvh(self):
+        """
+        Bounding volume hierarchy over the bounding boxes of the faces, the objects indices are the faces indices.
+
+        The hierarchy is reset when the faces are set, and rebuilt when faces are added or removed in place.
+        """
+        faces_bvh = self._faces_caches.get('faces_bvh')
+        if faces_bvh is None or len(faces_bvh) != len(self.faces):
+            faces_bvh = volmdlr.core.BoundingVolumeHierarchy.from_bounding_boxes(
+                [face.bounding_box for face in self.faces])
+            self._faces_caches['faces_bvh'] = faces_bvh
+        return faces_bvh
+
+    def _get_triangulation_bvh(self):
+        """
+        Gets the shell triangulation as arrays, with a bounding volume hierarchy over its triangles.
+
+        :return: The (m, 3) vertices indices of the triangles, the (n, 3) vertices and the hierarchy.
+        """
+        if 'triangulation_bvh' not in self._faces_caches:
+            mesh = self.triangulation()
+            triangles_points = mesh.vertices[mesh.faces]
+            self._faces_caches['triangulation_bvh'] = (
+                mesh.faces, mesh.vertices, volmdlr.core.BoundingVolumeHierarchy(triangles_points.min(axis=1),
+                                                                                triangles_points.max(axis=1),
+                                                                                leaf_size=8))
+        return self._faces_caches['triangulation_bvh']
 
     def to_dict(self, use_pointers: bool = False, memo=None, path: str = '#'):
         """
@@ -8925,6 +9293,7 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
             face.rotation_inplace(center, axis, angle)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._faces_caches = {}
 
     def translation(self, offset: volmdlr.Vector3D):
         """
@@ -8952,6 +9321,7 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
             face.translation_inplace(offset)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._faces_caches = {}
 
     def frame_mapping(self, frame: volmdlr.Frame3D, side: str):
         """
@@ -8973,6 +9343,7 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
             face.frame_mapping_inplace(frame, side)
         new_bounding_box = self.get_bounding_box()
         self.bounding_box = new_bounding_box
+        self._faces_caches = {}
 
     def copy(self, deep=True, memo=None):
         new_faces = [face.copy(deep=deep, memo=memo) for face in self.faces]
@@ -8985,29 +9356,65 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
         new_color = self.color
         return self.__class__(new_faces, name=new_name, color=new_color)
 
+    def _triangulation_arrays(self):
+        """
+        Gets the triangulations of the faces as concatenated arrays, oriented consistently between faces.
+
+        The cached triangulations of the faces are reused.
+
+        :return: The (n, 3) welded vertices and the (m, 3) vertices indices of the triangles.
+        """
+        meshes = triangulate_faces(self.faces)
+        if not meshes:
+            return npy.zeros((0, 3)), npy.zeros((0, 3), dtype=npy.int32)
+        vertices = [mesh.vertices for mesh in meshes]
+        faces = [mesh.faces for mesh in meshes]
+        offsets = npy.cumsum([0] + [len(mesh_vertices) for mesh_vertices in vertices[:-1]])
+        triangles_faces = npy.repeat(npy.arange(len(meshes)), [len(mesh_faces) for mesh_faces in faces])
+        vertices, faces = vmd.weld_vertices(npy.concatenate(vertices),
+                                            npy.concatenate([mesh_faces + offset
+                                                             for mesh_faces, offset in zip(faces, offsets)]))
+        flips, components = vmd.groups_orientation_flips(faces, triangles_faces, len(meshes))
+        faces[flips[triangles_faces]] = faces[flips[triangles_faces]][:, ::-1]
+
+        # Each connected set of faces is turned outward: a ray from one of its triangles, along its normal,
+        # crosses the shell an even number of times.
+        triangles_points = vertices[faces]
+        normals = npy.cross(triangles_points[:, 1] - triangles_points[:, 0],
+                            triangles_points[:, 2] - triangles_points[:, 0])
+        normals_norms = npy.linalg.norm(normals, axis=1)
+        triangles_components = components[triangles_faces]
+        for component in range(components.max() + 1):
+            triangle_index = npy.argmax(npy.where(triangles_components == component, normals_norms, -1.))
+            direction = normals[triangle_index] / normals_norms[triangle_index]
+            # Tilted to avoid crossing the shell through the edges of the triangles
+            direction = direction + 1e-3 * npy.array([math.sqrt(2), math.sqrt(3), math.sqrt(5)])
+            if vmd.ray_triangles_intersections_number(triangles_points[triangle_index].mean(axis=0),
+                                                      direction, triangles_points) % 2:
+                component_triangles = triangles_components == component
+                faces[component_triangles] = faces[component_triangles][:, ::-1]
+        return vertices, faces
+
+    def mass_properties(self):
+        """
+        Computes the mass properties of the shell in one pass on its triangulation, using the divergence theorem.
+
+        :return: The volume, the area, the center of mass and the (3, 3) inertia tensor at the center of mass for a
+            unit density.
+        :rtype: Tuple[float, float, volmdlr.Point3D, numpy.ndarray]
+        """
+        vertices, faces = self._triangulation_arrays()
+        volume, area, center_of_mass, inertia_tensor = vmd.triangles_mass_properties(vertices[faces])
+        return volume, area, volmdlr.Point3D(*center_of_mass.tolist()), inertia_tensor
+
     def volume(self):
         """
         Does not consider holes
         """
-        volume = 0
-        for face in self.faces:
-            display3d = face.triangulation()
-            for triangle_index in display3d.triangles:
-                point1 = display3d.points[triangle_index[0]]
-                point2 = display3d.points[triangle_index[1]]
-                point3 = display3d.points[triangle_index[2]]
-
-                v321 = point3[0] * point2[1] * point1[2]
-                v231 = point2[0] * point3[1] * point1[2]
-                v312 = point3[0] * point1[1] * point2[2]
-                v132 = point1[0] * point3[1] * point2[2]
-                v213 = point2[0] * point1[1] * point3[2]
-                v123 = point1[0] * point2[1] * point3[2]
-                volume_tetraedre = 1 / 6 * (-v321 + v231 + v312 - v132 - v213 + v123)
-
-                volume += volume_tetraedre
-
-        return abs(volume)
+        vertices, faces = self._triangulation_arrays()
+        triangles_points = vertices[faces]
+        return abs(float(npy.einsum('ij,ij->', triangles_points[:, 0],
+                                    npy.cross(triangles_points[:, 1], triangles_points[:, 2])))) / 6.
 
     @property
     def bounding_box(self):
@@ -9059,7 +9466,8 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
                                   linesegment3d: vme.LineSegment3D) \
             -> List[Tuple[Face3D, List[volmdlr.Point3D]]]:
         intersections = []
-        for face in self.faces:
+        for index in self.faces_bvh.segment_query(linesegment3d.start, linesegment3d.end, tol=1e-6):
+            face = self.faces[index]
             face_intersections = face.linesegment_intersections(linesegment3d)
             if face_intersections:
                 intersections.append((face, face_intersections))
@@ -9069,7 +9477,8 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
                            line3d: vme.Line3D) \
             -> List[Tuple[Face3D, List[volmdlr.Point3D]]]:
         intersections = []
-        for face in self.faces:
+        for index in self.faces_bvh.segment_query(line3d.point1, line3d.point2, tol=1e-6, infinite=True):
+            face = self.faces[index]
             face_intersections = face.line_intersections(line3d)
             if face_intersections:
                 intersections.append((face, face_intersections))
@@ -9083,24 +9492,13 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
         if shell2_inter is not None and shell2_inter != 1:
             return None
 
-        # distance_min, point1_min, point2_min = self.faces[0].distance_to_face(shell2.faces[0], return_points=True)
-        distance_min, point1_min, point2_min = self.faces[0].minimum_distance(
-            shell2.faces[0], return_points=True)
-        for face1 in self.faces:
-            bbox1 = face1.bounding_box
-            for face2 in shell2.faces:
-                bbox2 = face2.bounding_box
-                bbox_distance = bbox1.distance_to_bbox(bbox2)
-
-                if bbox_distance < distance_min:
-                    # distance, point1, point2 = face1.distance_to_face(face2, return_points=True)
-                    distance, point1, point2 = face1.minimum_distance(face2,
-                                                                      return_points=True)
-                    if distance == 0:
-                        return None
-                    if distance < distance_min:
-                        distance_min, point1_min, point2_min = distance, point1, point2
+        def faces_distance(index1, index2):
+            return self.faces[index1].minimum_distance(shell2.faces[index2], return_points=True)
 
+        _, _, (distance_min, point1_min, point2_min) = self.faces_bvh.nearest_pair(shell2.faces_bvh,
+                                                                                   faces_distance)
+        if distance_min == 0:
+            return None
         return point1_min, point2_min
 
     def distance_to_shell(self, other_shell: 'OpenShell3D', resolution: float):
@@ -9116,16 +9514,10 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
         Computes the distance of a point to a Shell3D, whether it is inside or outside the Shell3D.
 
         """
-        distance_min, point1_min = self.faces[0].distance_to_point(point,
-                                                                   return_other_point=True)
-        for face in self.faces[1:]:
-            bbox_distance = self.bounding_box.distance_to_point(point)
-            if bbox_distance < distance_min:
-                distance, point1 = face.distance_to_point(point,
-                                                          return_other_point=True)
-                if distance < distance_min:
-                    distance_min, point1_min = distance, point1
+        def face_distance(index):
+            return self.faces[index].distance_to_point(point, return_other_point=True)
 
+        _, (_, point1_min) = self.faces_bvh.nearest(point, face_distance)
         return point1_min
 
     def intersection_internal_aabb_volume(self, shell2: 'OpenShell3D',
@@ -9143,11 +9535,11 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
                         intersection_points[0].primitives[0].end]
                     intersections_points.extend(intersection_points)
 
-        shell1_points_inside_shell2 = []
-        for face in self.faces:
-            for point in face.outer_contour3d.discretization_points(angle_resolution=resolution):
-                if shell2.point_belongs(point):
-                    shell1_points_inside_shell2.append(point)
+        shell1_points = [point for face in self.faces
+                         for point in face.outer_contour3d.discretization_points(angle_resolution=resolution)]
+        shell1_points_inside_shell2 = [point for point, inside in zip(shell1_points,
+                                                                      shell2.points_belong(shell1_points))
+                                       if inside]
 
         if len(intersections_points + shell1_points_inside_shell2) == 0:
             return 0
@@ -9170,12 +9562,11 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
                         intersection_points[0].primitives[0].end]
                     intersections_points.extend(intersection_points)
 
-        shell1_points_outside_shell2 = []
-        for face in self.faces:
-            for point in face.outer_contour3d.discretization_points(
-                    angle_resolution=resolution):
-                if not shell2.point_belongs(point):
-                    shell1_points_outside_shell2.append(point)
+        shell1_points = [point for face in self.faces
+                         for point in face.outer_contour3d.discretization_points(angle_resolution=resolution)]
+        shell1_points_outside_shell2 = [point for point, inside in zip(shell1_points,
+                                                                       shell2.points_belong(shell1_points))
+                                        if not inside]
 
         if len(intersections_points + shell1_points_outside_shell2) == 0:
             return 0
@@ -9203,12 +9594,17 @@ class OpenShell3D(volmdlr.core.CompositePrimitive3D):
                       DeprecationWarning)
         return self.point_on_shell(point)
 
-    def triangulation(self):
-        meshes = []
-        for face in self.faces:
-            face_mesh = face.triangulation()
-            meshes.append(face_mesh)
-        return vmd.DisplayMesh3D.merge_meshes(meshes)
+    def triangulation(self, workers: int = None, executor=None):
+        """
+        Triangulates the shell by merging the triangulations of its faces.
+
+        :param workers: The number of processes triangulating the faces. Default is None, triangulating in the
+            current process.
+        :param executor: An executor to use instead of creating a pool of processes.
+        :return: The triangulated shell as a display mesh.
+        :rtype: :class:`volmdlr.display.DisplayMesh3D`
+        """
+        return vmd.DisplayMesh3D.merge_meshes(triangulate_faces(self.faces, workers=workers, executor=executor))
 
     def plot(self, ax=None, color: str = 'k', alpha: float = 1.0):
         if ax is None:
@@ -9414,10 +9810,9 @@ class ClosedShell3D(OpenShell3D):
     STEP_FUNCTION = 'CLOSED_SHELL'
 
     def is_face_inside(self, face: Face3D):
-        for point in face.outer_contour3d.discretization_points(angle_resolution=0.1):
-            point_inside_shell = self.point_belongs(point)
-            point_in_shells_faces = self.point_on_shell(point)
-            if (not point_inside_shell) and (not point_in_shells_faces):
+        points = face.outer_contour3d.discretization_points(angle_resolution=0.1)
+        for point, point_inside_shell in zip(points, self.points_belong(points)):
+            if (not point_inside_shell) and (not self.point_on_shell(point)):
                 return False
         return True
 
@@ -9452,14 +9847,8 @@ class ClosedShell3D(OpenShell3D):
 
         nb_pts1 = len(points1)
         nb_pts2 = len(points2)
-        compteur1 = 0
-        compteur2 = 0
-        for point1 in points1:
-            if shell2.point_belongs(point1):
-                compteur1 += 1
-        for point2 in points2:
-            if self.point_belongs(point2):
-                compteur2 += 1
+        compteur1 = npy.count_nonzero(shell2.points_belong(points1))
+        compteur2 = npy.count_nonzero(self.points_belong(points2))
 
         inter1 = compteur1 / nb_pts1
         inter2 = compteur2 / nb_pts2
@@ -9476,50 +9865,72 @@ class ClosedShell3D(OpenShell3D):
 
     def point_belongs(self, point3d: volmdlr.Point3D, **kwargs):
         """
-        Ray Casting algorithm
-        Returns True if the point is inside the Shell, False otherwise
+        Returns True if the point is inside the Shell, False otherwise.
+
+        See points_belong, the nb_rays keyword argument is no longer used.
         """
-        nb_rays = kwargs.get("nb_rays", 1)  # TODO: remove nb_rays argument in the future as it shouldn't be necessary
+        return bool(self.points_belong([point3d])[0])
 
-        bbox = self.bounding_box
-        if not bbox.point_belongs(point3d):
-            return False
+    def points_belong(self, points, tol: float = 1e-6):
+        """
+        Ray casting classification of points, on the cached triangulation of the shell.
 
-        min_ray_length = 2 * max((bbox.xmax - bbox.xmin,
-                                  bbox.ymax - bbox.ymin,
-                                  bbox.zmax - bbox.zmin))
-        two_min_ray_length = 2 * min_ray_length
-
-        rays = []
-        for _ in range(0, nb_rays):
-            rays.append(vme.LineSegment3D(
-                point3d,
-                point3d + volmdlr.Point3D.random(min_ray_length,
-                                                 two_min_ray_length,
-                                                 min_ray_length,
-                                                 two_min_ray_length,
-                                                 min_ray_length,
-                                                 two_min_ray_length)))
-        rays = sorted(rays, key=lambda ray: ray.length())
-        rays_intersections = []
-        tests = []
-
-        # for ray in rays[:3]:
-        for ray in rays[:nb_rays]:
-            #
-            count = 0
-            ray_intersection = []
-            is_inside = True
-            for face, point_inters in self.linesegment_intersections(ray):
-                count += len(point_inters)
-            if count % 2 == 0:
-                is_inside = False
-            tests.append(is_inside)
-            rays_intersections.append(ray_intersection)
-        for test1, test2 in zip(tests[:-1], tests[1:]):
-            if test1 != test2:
-                raise ValueError
-        return tests[0]
+        A ray along the x axis is cast from each point, and its crossings with the triangles are counted in the
+        projection on the yz plane. Candidate triangles are found with a bounding volume hierarchy, and all the
+        tests are vectorized. The edges of the projected triangles follow a top-left rule, computed on edges of
+        canonical orientation, so that a ray going through a shared edge or vertex is counted once: results are
+        deterministic. Points closer than tol to the triangulation are on the boundary, they are not inside.
+
+        :param points: The points to classify, as a list of points or a (n, 3) array.
+        :param tol: The distance under which a point is on the boundary of the shell.
+        :return: Whether each point is inside the shell, as a (n,) boolean array.
+        :rtype: numpy.ndarray
+        """
+        if not isinstance(points, npy.ndarray):
+            points = [tuple(point) for point in points]
+        points = npy.asarray(points, dtype=float).reshape(-1, 3)
+        bbox = self.bounding_box
+        inside = npy.zeros(len(points), dtype=bool)
+        in_bbox = npy.nonzero(((points >= (bbox.xmin, bbox.ymin, bbox.zmin))
+                               & (points <= (bbox.xmax, bbox.ymax, bbox.zmax))).all(axis=1))[0]
+        if len(in_bbox) == 0:
+            return inside
+        triangles, vertices, bvh = self._get_triangulation_bvh()
+        rays_maxs = points[in_bbox].copy()
+        rays_maxs[:, 0] = bbox.xmax
+        candidates = bvh.boxes_query(points[in_bbox], rays_maxs)
+        rays, rays_triangles = in_bbox[candidates[:, 0]], triangles[candidates[:, 1]]
+        points_yz = points[rays, 1:]
+
+        # Edge functions of the edges opposite to the vertices 0, 1 and 2, on edges oriented by vertex index
+        weights, directions = [], []
+        for index1, index2 in ((1, 2), (2, 0), (0, 1)):
+            first, second = rays_triangles[:, index1], rays_triangles[:, index2]
+            sign = npy.where(first < second, 1., -1.)
+            start = vertices[npy.minimum(first, second), 1:]
+            direction = vertices[npy.maximum(first, second), 1:] - start
+            weights.append(sign * (direction[:, 0] * (points_yz[:, 1] - start[:, 1])
+                                   - direction[:, 1] * (points_yz[:, 0] - start[:, 0])))
+            directions.append(sign[:, None] * direction)
+        weights, directions = npy.array(weights), npy.array(directions)
+        # Orienting the projected triangles counterclockwise
+        area_sign = npy.sign(directions[2][:, 0] * directions[0][:, 1] - directions[2][:, 1] * directions[0][:, 0])
+        weights *= area_sign
+        directions *= area_sign[:, None]
+        top_left = (directions[:, :, 1] < 0) | ((directions[:, :, 1] == 0) & (directions[:, :, 0] > 0))
+        crossed = (area_sign != 0) & ((weights > 0) | ((weights == 0) & top_left)).all(axis=0)
+
+        crossed_weights = weights[:, crossed]
+        crossings_x = ((vertices[rays_triangles[crossed], 0] * crossed_weights.T).sum(axis=1)
+                       / crossed_weights.sum(axis=0))
+        crossing_rays = rays[crossed][crossings_x > points[rays[crossed], 0]]
+        inside[:] = npy.bincount(crossing_rays, minlength=len(points)) % 2 == 1
+
+        near_pairs = bvh.boxes_query(points[in_bbox], points[in_bbox], tol=tol)
+        near_points, near_triangles = in_bbox[near_pairs[:, 0]], near_pairs[:, 1]
+        on_boundary = points_triangles_distances(points[near_points], vertices[triangles[near_triangles]]) <= tol
+        inside[near_points[on_boundary]] = False
+        return inside
 
     def point_in_shell_face(self, point: volmdlr.Point3D):
 
@@ -9568,10 +9979,10 @@ class ClosedShell3D(OpenShell3D):
         :return:
         """
         face_combinations = []
-        for face1 in self.faces:
-            for face2 in shell2.faces:
-                if face1.is_intersecting(face2, list_coincident_faces, tol):
-                    face_combinations.append((face1, face2))
+        for index1, index2 in self.faces_bvh.pairs(shell2.faces_bvh, tol):
+            face1, face2 = self.faces[index1], shell2.faces[index2]
+            if face1.is_intersecting(face2, list_coincident_faces, tol):
+                face_combinations.append((face1, face2))
         return face_combinations
 
     @staticmethod
@@ -10057,7 +10468,50 @@ class ClosedShell3D(OpenShell3D):
                     if self.faces_graph.edges[(node, neighbor_node)]['edge'] in face.outer_contour3d.primitives:
                         self.faces.remove(face)
                         break
-        self._faces_graph = None
+        self._faces_caches = {}
+
+
+class LazyTriangles3D(Sequence):
+    """
+    Triangles defined by a vertices coordinates array and a faces array.
+
+    The Triangle3D objects, and their points, are only created when they are accessed.
+
+    :param vertices: The (n, 3) array of the vertices coordinates.
+    :param faces: The (m, 3) array of the vertices indices of the triangles.
+    """
+
+    def __init__(self, vertices, faces):
+        self.vertices = vertices
+        self.faces = faces
+        self._triangles = [None] * len(faces)
+        self._points = {}
+
+    def __len__(self):
+        return len(self._triangles)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        triangle = self._triangles[index]
+        if triangle is None:
+            triangle = Triangle3D(*[self.point(vertex_index) for vertex_index in self.faces[index].tolist()])
+            self._triangles[index] = triangle
+        return triangle
+
+    def point(self, index: int):
+        """Gets the point of index index, creating it if needed."""
+        point = self._points.get(index)
+        if point is None:
+            point = volmdlr.Point3D(*self.vertices[index].tolist())
+            self._points[index] = point
+        return point
+
+    def set_vertices(self, vertices):
+        """Replaces the vertices array, the triangles and points created from the previous one are discarded."""
+        self.vertices = vertices
+        self._triangles = [None] * len(self.faces)
+        self._points = {}
 
 
 class OpenTriangleShell3D(OpenShell3D):
@@ -10076,6 +10530,9 @@ class OpenTriangleShell3D(OpenShell3D):
     :type alpha: float
     :param name: The name of the shell.
     :type name: str
+
+    The shell can also be stored as vertices & faces arrays (see from_mesh_data): its faces are then
+    a LazyTriangles3D, creating the Triangle3D only when they are accessed.
     """
 
     def __init__(self, faces: List[Triangle3D],
@@ -10098,53 +10555,177 @@ class OpenTriangleShell3D(OpenShell3D):
                 return True
         return False
 
+    def is_array_based(self):
+        """Returns True if the shell is stored as vertices & faces arrays."""
+        return isinstance(self.faces, LazyTriangles3D)
+
+    def _data_eq(self, other_object):
+        if isinstance(other_object, OpenTriangleShell3D) and self.is_array_based() \
+                and other_object.is_array_based():
+            if other_object.__class__.__name__ != self.__class__.__name__ \
+                    or self.faces.faces.shape != other_object.faces.faces.shape:
+                return False
+            return npy.allclose(self.faces.vertices[self.faces.faces],
+                                other_object.faces.vertices[other_object.faces.faces], rtol=0., atol=1e-6)
+        return OpenShell3D._data_eq(self, other_object)
+
     def to_mesh_data(self):
-        positions = npy.zeros((3 * len(self.faces), 3))
-        faces = npy.zeros((len(self.faces), 3))
-        for i, triangle_face in enumerate(self.faces):
-            i1 = 3 * i
-            i2 = i1 + 1
-            i3 = i1 + 2
-            positions[i1, 0] = triangle_face.points[0].x
-            positions[i1, 1] = triangle_face.points[0].y
-            positions[i1, 2] = triangle_face.points[0].z
-            positions[i2, 0] = triangle_face.points[1].x
-            positions[i2, 1] = triangle_face.points[1].y
-            positions[i2, 2] = triangle_face.points[1].z
-            positions[i3, 0] = triangle_face.points[2].x
-            positions[i3, 1] = triangle_face.points[2].y
-            positions[i3, 2] = triangle_face.points[2].z
-
-            faces[i, 0] = i1
-            faces[i, 1] = i2
-            faces[i, 2] = i3
+        """
+        Gets the vertices & faces arrays of the shell.
+
+        An array-based shell returns its own arrays, without copy. Otherwise, each triangle has its own three
+        vertices.
 
+        :return: The (n, 3) float array of the vertices and the (m, 3) int array of the faces.
+        """
+        if self.is_array_based():
+            return self.faces.vertices, self.faces.faces
+        positions = npy.array([[*point] for triangle_face in self.faces for point in triangle_face.points],
+                              dtype=npy.float64).reshape(-1, 3)
+        faces = npy.arange(len(positions), dtype=npy.int32).reshape(-1, 3)
         return positions, faces
 
     @classmethod
-    def from_mesh_data(cls, positions, faces):
-        triangles = []
-        points = [volmdlr.Point3D(px, py, pz) for px, py, pz in positions]
-        for i1, i2, i3 in faces:
-            triangles.append(Triangle3D(points[i1], points[i2], points[i3]))
-        return cls(triangles)
+    def from_mesh_data(cls, positions, faces, name: str = ''):
+        """
+        Defines an array-based shell. Its Triangle3D are only created when they are accessed.
+
+        :param positions: The (n, 3) array of the vertices coordinates.
+        :param faces: The (m, 3) array of the vertices indices of each triangle.
+        """
+        return cls(LazyTriangles3D(npy.asarray(positions, dtype=npy.float64).reshape(-1, 3),
+                                   npy.asarray(faces, dtype=npy.int32).reshape(-1, 3)), name=name)
+
+    def _triangulation_arrays(self):
+        return self.to_mesh_data()
+
+    @staticmethod
+    def _rotated_vertices(vertices, center: volmdlr.Point3D, axis: volmdlr.Vector3D, angle: float):
+        """Rotates a vertices array with the Rodrigues formula, as Point3D.rotation does."""
+        axis, center = npy.array([*axis]), npy.array([*center])
+        vectors = vertices - center
+        return (math.cos(angle) * vectors + (1. - math.cos(angle)) * (vectors @ axis)[:, None] * axis
+                + math.sin(angle) * npy.cross(axis, vectors) + center)
+
+    @staticmethod
+    def _frame_mapped_vertices(vertices, frame: volmdlr.Frame3D, side: str):
+        """Maps a vertices array with a frame, as Point3D.frame_mapping does."""
+        basis = npy.array([[*frame.u], [*frame.v], [*frame.w]])
+        origin = npy.array([*frame.origin])
+        if side == 'old':
+            return vertices @ basis + origin
+        if side == 'new':
+            return npy.linalg.solve(basis.T, (vertices - origin).T).T
+        raise ValueError(f'side must be either old or new, not {side}')
+
+    def _set_vertices(self, vertices):
+        """Replaces the vertices array of an array-based shell, resetting the caches depending on it."""
+        self.faces.set_vertices(vertices)
+        self.bounding_box = self.get_bounding_box()
+        self._faces_caches = {}
+
+    def _from_vertices(self, vertices):
+        """Copies an array-based shell with other vertices, sharing the faces array."""
+        return self.__class__(LazyTriangles3D(vertices, self.faces.faces), color=self.color, alpha=self.alpha,
+                              name=self.name)
+
+    def translation(self, offset: volmdlr.Vector3D):
+        """
+        Shell translation. The vertices of an array-based shell are translated at once.
+
+        :param offset: translation vector
+        :return: A new translated shell
+        """
+        if self.is_array_based():
+            return self._from_vertices(self.faces.vertices + npy.array([*offset]))
+        return OpenShell3D.translation(self, offset)
+
+    def translation_inplace(self, offset: volmdlr.Vector3D):
+        """
+        Shell translation. Object is updated inplace.
+
+        :param offset: translation vector
+        """
+        if not self.is_array_based():
+            OpenShell3D.translation_inplace(self, offset)
+            return
+        warnings.warn("'inplace' methods are deprecated. Use a not inplace method instead.", DeprecationWarning)
+        self._set_vertices(self.faces.vertices + npy.array([*offset]))
+
+    def rotation(self, center: volmdlr.Point3D, axis: volmdlr.Vector3D, angle: float):
+        """
+        Shell rotation. The vertices of an array-based shell are rotated at once.
+
+        :param center: rotation center
+        :param axis: rotation axis
+        :param angle: rotation angle
+        :return: A new rotated shell
+        """
+        if self.is_array_based():
+            return self._from_vertices(self._rotated_vertices(self.faces.vertices, center, axis, angle))
+        return OpenShell3D.rotation(self, center, axis, angle)
+
+    def rotation_inplace(self, center: volmdlr.Point3D, axis: volmdlr.Vector3D, angle: float):
+        """
+        Shell rotation. Object is updated inplace.
+
+        :param center: rotation center
+        :param axis: rotation axis
+        :param angle: rotation angle
+        """
+        if not self.is_array_based():
+            OpenShell3D.rotation_inplace(self, center, axis, angle)
+            return
+        warnings.warn("'inplace' methods are deprecated. Use a not inplace method instead.", DeprecationWarning)
+        self._set_vertices(self._rotated_vertices(self.faces.vertices, center, axis, angle))
+
+    def frame_mapping(self, frame: volmdlr.Frame3D, side: str):
+        """
+        Changes frame_mapping and return a new shell. The vertices of an array-based shell are mapped at once.
+
+        side = 'old' or 'new'
+        """
+        if self.is_array_based():
+            return self._from_vertices(self._frame_mapped_vertices(self.faces.vertices, frame, side))
+        return OpenShell3D.frame_mapping(self, frame, side)
+
+    def frame_mapping_inplace(self, frame: volmdlr.Frame3D, side: str):
+        """
+        Changes frame_mapping and the object is updated inplace.
+
+        side = 'old' or 'new'
+        """
+        if not self.is_array_based():
+            OpenShell3D.frame_mapping_inplace(self, frame, side)
+            return
+        warnings.warn("'inplace' methods are deprecated. Use a not inplace method instead.", DeprecationWarning)
+        self._set_vertices(self._frame_mapped_vertices(self.faces.vertices, frame, side))
+
+    def get_bounding_box(self):
+        vertices, faces = self.to_mesh_data()
+        if self.is_array_based():
+            used_vertices = npy.zeros(len(vertices), dtype=bool)
+            used_vertices[faces.ravel()] = True
+            vertices = vertices[used_vertices]
+        xmin, ymin, zmin = vertices.min(axis=0).tolist()
+        xmax, ymax, zmax = vertices.max(axis=0).tolist()
+        return volmdlr.core.BoundingBox(xmin, xmax, ymin, ymax, zmin, zmax)
 
     def to_trimesh(self):
         return Trimesh(*self.to_mesh_data())
 
     @classmethod
     def from_trimesh(cls, trimesh):
-        return cls.from_mesh_data(trimesh.vertices.tolist(), trimesh.faces.tolist())
+        return cls.from_mesh_data(trimesh.vertices, trimesh.faces)
 
-    def triangulation(self):
-        points = []
-        triangles = []
-        for i, triangle in enumerate(self.faces):
-            points.append(vmd.Node3D.from_point(triangle.point1))
-            points.append(vmd.Node3D.from_point(triangle.point2))
-            points.append(vmd.Node3D.from_point(triangle.point3))
-            triangles.append((3 * i, 3 * i + 1, 3 * i + 2))
-        return vmd.DisplayMesh3D(points, triangles)
+    def triangulation(self, workers: int = None, executor=None):
+        """
+        Gets the display mesh of the shell, built from the vertices & faces arrays.
+
+        :param workers: Unused, the triangles do not need to be triangulated.
+        :param executor: Unused, the triangles do not need to be triangulated.
+        """
+        return vmd.DisplayMesh3D.from_arrays(*self.to_mesh_data())
 
 
 class ClosedTriangleShell3D(ClosedShell3D, OpenTriangleShell3D):
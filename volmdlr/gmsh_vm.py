@@ -3,11 +3,355 @@
 """
 Gmsh and related objects
 """
+from collections.abc import Mapping
+
+import numpy as npy
+
 from dessia_common.core import DessiaObject  # isort: skip
+from dessia_common.serialization import serialize  # isort: skip
 
 import volmdlr
 import volmdlr.mesh
 
+# Number of nodes of the gmsh elements, by element type
+GMSH_ELEMENTS_NODES_NUMBER = {1: 2, 2: 3, 3: 4, 4: 4, 5: 8, 6: 6, 7: 5, 8: 3, 9: 6, 10: 9, 11: 10, 12: 27,
+                              13: 18, 14: 14, 15: 1, 16: 8, 17: 20, 18: 15, 19: 13, 20: 9, 21: 10, 22: 12,
+                              23: 15, 24: 15, 25: 21, 26: 4, 27: 5, 28: 6, 29: 20, 30: 35, 31: 56, 92: 64,
+                              93: 125}
+
+
+def _elements_nodes_number(element_type: int):
+    try:
+        return GMSH_ELEMENTS_NODES_NUMBER[element_type]
+    except KeyError as error:
+        raise NotImplementedError(f'gmsh element type {element_type} is not supported') from error
+
+
+class BinarySectionReader:
+    """
+    Reads the values of a binary section of a .msh file, with numpy.frombuffer.
+
+    :param data: The bytes of the section.
+    :param size_t: The size of the size_t values, as given by the mesh format.
+    :param byteorder: The byte order of the file, '<' or '>'.
+    """
+
+    def __init__(self, data: bytes, size_t: int = 8, byteorder: str = '<'):
+        self.data = data
+        self.offset = 0
+        self.int_dtype = npy.dtype(byteorder + 'i4')
+        self.size_t_dtype = npy.dtype(byteorder + ('u8' if size_t == 8 else 'u4'))
+        self.double_dtype = npy.dtype(byteorder + 'f8')
+
+    def read(self, dtype, count: int = 1):
+        """Reads count values of type dtype and moves forward."""
+        values = npy.frombuffer(self.data, dtype=dtype, count=count, offset=self.offset)
+        self.offset += values.nbytes
+        return values
+
+    def ints(self, count: int = 1):
+        """Reads count int values."""
+        return self.read(self.int_dtype, count).astype(npy.int64)
+
+    def sizes(self, count: int = 1):
+        """Reads count size_t values."""
+        return self.read(self.size_t_dtype, count).astype(npy.int64)
+
+    def doubles(self, count: int = 1):
+        """Reads count double values."""
+        return self.read(self.double_dtype, count)
+
+
+class GmshNodes(Mapping):
+    """
+    Nodes of a .msh file, stored in numpy arrays.
+
+    The dict layout of the line by line parser ('nodes_dim_x' keys with a list of nodes by block, 'all_nodes' key)
+    is available as a lazy view: the volmdlr nodes are only created when one of its keys is accessed.
+
+    :param tags: The gmsh tags of the nodes.
+    :param coordinates: The (n, 3) array of the coordinates of the nodes.
+    :param blocks_dims: The dimension of the entity of each block of nodes.
+    :param blocks_offsets: The index of the first node of each block, followed by the number of nodes.
+    """
+
+    def __init__(self, tags, coordinates, blocks_dims, blocks_offsets):
+        self.tags = tags
+        self.coordinates = coordinates
+        self.blocks_dims = blocks_dims
+        self.blocks_offsets = blocks_offsets
+        self._tags_indices = None
+        self._items = {}
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __contains__(self, key):
+        return key in self._keys()
+
+    def __hash__(self):
+        return len(self.tags)
+
+    def __getitem__(self, key):
+        if key not in self._items:
+            if key not in self._keys():
+                raise KeyError(key)
+            all_nodes = self._items.get('all_nodes')
+            if all_nodes is None:
+                if self.is_2d():
+                    all_nodes = [volmdlr.mesh.Node2D(x, y) for x, y in self.coordinates[:, :2].tolist()]
+                else:
+                    all_nodes = [volmdlr.mesh.Node3D(x, y, z) for x, y, z in self.coordinates.tolist()]
+                self._items['all_nodes'] = all_nodes
+            if key != 'all_nodes':
+                dim = int(key[len('nodes_dim_'):])
+                self._items[key] = [all_nodes[start:end] for block_dim, start, end in self._blocks()
+                                    if block_dim == dim]
+        return self._items[key]
+
+    def _blocks(self):
+        return [(int(dim), int(start), int(end)) for dim, start, end
+                in zip(self.blocks_dims, self.blocks_offsets[:-1], self.blocks_offsets[1:]) if end > start]
+
+    def _keys(self):
+        keys = []
+        for dim, _, _ in self._blocks():
+            if 'nodes_dim_' + str(dim) not in keys:
+                keys.append('nodes_dim_' + str(dim))
+        if len(self.tags):
+            keys.append('all_nodes')
+        return keys
+
+    def to_dict(self, *args, **kwargs):
+        """Serializes the dict layout of the nodes."""
+        return serialize(dict(self))
+
+    def _data_eq(self, other_object):
+        return (npy.array_equal(self.tags, other_object.tags)
+                and npy.array_equal(self.coordinates, other_object.coordinates)
+                and npy.array_equal(self.blocks_dims, other_object.blocks_dims)
+                and npy.array_equal(self.blocks_offsets, other_object.blocks_offsets))
+
+    def is_2d(self):
+        """Checks if all the nodes are in the plane z = 0."""
+        return not self.coordinates[:, 2].any()
+
+    def tags_to_indices(self, tags):
+        """
+        Converts gmsh nodes tags to indices in the nodes arrays.
+
+        :param tags: An array of nodes tags.
+        :return: The array of the indices of the nodes.
+        """
+        if self._tags_indices is None:
+            if npy.array_equal(self.tags, npy.arange(1, len(self.tags) + 1)):
+                self._tags_indices = False
+            else:
+                self._tags_indices = npy.full(int(self.tags.max(initial=0)) + 1, -1, dtype=npy.int64)
+                self._tags_indices[self.tags] = npy.arange(len(self.tags))
+        if self._tags_indices is False:
+            return tags - 1
+        return self._tags_indices[tags]
+
+    @classmethod
+    def from_ascii(cls, data):
+        """
+        Parses the content of an ASCII $Nodes section in one bulk conversion.
+
+        :param data: The text of the section, without the $Nodes and $EndNodes lines.
+        """
+        if isinstance(data, bytes):
+            data = data.decode()
+        values = npy.fromstring(data, sep=' ')
+        number_blocks, number_nodes = int(values[0]), int(values[1])
+        tags, coordinates = [], []
+        blocks_dims, blocks_offsets = [], [0]
+        cursor = 4
+        for _ in range(number_blocks):
+            dim, _, parametric, block_size = values[cursor:cursor + 4].astype(npy.int64)
+            cursor += 4
+            tags.append(values[cursor:cursor + block_size])
+            cursor += block_size
+            width = 3 + (dim if parametric else 0)
+            coordinates.append(values[cursor:cursor + block_size * width].reshape(block_size, width)[:, :3])
+            cursor += block_size * width
+            blocks_dims.append(dim)
+            blocks_offsets.append(blocks_offsets[-1] + block_size)
+        return cls._from_blocks(tags, coordinates, blocks_dims, blocks_offsets, number_nodes)
+
+    @classmethod
+    def from_binary(cls, data: bytes, size_t: int = 8, byteorder: str = '<'):
+        """
+        Parses the content of a binary $Nodes section of a MSH 4.1 file.
+
+        :param data: The bytes of the section, without the $Nodes and $EndNodes lines.
+        :param size_t: The size of the size_t values, as given by the mesh format.
+        :param byteorder: The byte order of the file, '<' or '>'.
+        """
+        reader = BinarySectionReader(data, size_t, byteorder)
+        number_blocks, number_nodes, _, _ = reader.sizes(4)
+        tags, coordinates = [], []
+        blocks_dims, blocks_offsets = [], [0]
+        for _ in range(number_blocks):
+            dim, _, parametric = reader.ints(3)
+            block_size = int(reader.sizes()[0])
+            tags.append(reader.sizes(block_size))
+            width = 3 + (dim if parametric else 0)
+            coordinates.append(reader.doubles(block_size * width).reshape(block_size, width)[:, :3])
+            blocks_dims.append(dim)
+            blocks_offsets.append(blocks_offsets[-1] + block_size)
+        return cls._from_blocks(tags, coordinates, blocks_dims, blocks_offsets, number_nodes)
+
+    @classmethod
+    def _from_blocks(cls, tags, coordinates, blocks_dims, blocks_offsets, number_nodes):
+        if blocks_offsets[-1] != number_nodes:
+            raise ValueError(f'{blocks_offsets[-1]} nodes read instead of {number_nodes}')
+        if not tags:
+            return cls(npy.zeros(0, dtype=npy.int64), npy.zeros((0, 3)), npy.zeros(0, dtype=npy.int64),
+                       npy.zeros(1, dtype=npy.int64))
+        return cls(npy.concatenate(tags).astype(npy.int64), npy.ascontiguousarray(npy.concatenate(coordinates)),
+                   npy.array(blocks_dims, dtype=npy.int64), npy.array(blocks_offsets, dtype=npy.int64))
+
+
+class GmshElements(Mapping):
+    """
+    Elements of a .msh file, stored in numpy arrays by block.
+
+    The dict layout of the line by line parser ('elements_type_x' keys with a list of elements by block, an element
+    being the list of the indices of its nodes) is available as a lazy view.
+
+    :param blocks_types: The gmsh type of the elements of each block.
+    :param blocks_tags: The arrays of the tags of the elements of each block.
+    :param blocks_nodes: The (n, k) arrays of the indices of the nodes of the elements of each block.
+    """
+
+    def __init__(self, blocks_types, blocks_tags, blocks_nodes):
+        self.blocks_types = blocks_types
+        self.blocks_tags = blocks_tags
+        self.blocks_nodes = blocks_nodes
+        self._items = {}
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __contains__(self, key):
+        return key in self._keys()
+
+    def __hash__(self):
+        return sum(len(tags) for tags in self.blocks_tags)
+
+    def __getitem__(self, key):
+        if key not in self._items:
+            if key not in self._keys():
+                raise KeyError(key)
+            element_type = int(key[len('elements_type_'):])
+            self._items[key] = [nodes.tolist() for block_type, nodes in zip(self.blocks_types, self.blocks_nodes)
+                                if block_type == element_type and len(nodes)]
+        return self._items[key]
+
+    def _keys(self):
+        keys = []
+        for element_type, nodes in zip(self.blocks_types, self.blocks_nodes):
+            if len(nodes) and 'elements_type_' + str(element_type) not in keys:
+                keys.append('elements_type_' + str(element_type))
+        return keys
+
+    def to_dict(self, *args, **kwargs):
+        """Serializes the dict layout of the elements."""
+        return serialize(dict(self))
+
+    def _data_eq(self, other_object):
+        return (self.blocks_types == other_object.blocks_types
+                and all(npy.array_equal(tags, other_tags)
+                        for tags, other_tags in zip(self.blocks_tags, other_object.blocks_tags))
+                and all(npy.array_equal(nodes, other_nodes)
+                        for nodes, other_nodes in zip(self.blocks_nodes, other_object.blocks_nodes)))
+
+    def blocks(self, element_type: int):
+        """
+        Gets the nodes indices of the elements of a type, by block.
+
+        :param element_type: The gmsh type of the elements.
+        :return: The list of the (n, k) arrays of the indices of the nodes of the elements of the not empty blocks.
+        """
+        return [nodes for block_type, nodes in zip(self.blocks_types, self.blocks_nodes)
+                if block_type == element_type and len(nodes)]
+
+    def connectivity(self, element_type: int):
+        """
+        Gets the nodes indices of all the elements of a type.
+
+        :param element_type: The gmsh type of the elements.
+        :return: The (n, k) array of the indices of the nodes of the elements.
+        """
+        blocks = self.blocks(element_type)
+        if not blocks:
+            return npy.zeros((0, _elements_nodes_number(element_type)), dtype=npy.int64)
+        return npy.concatenate(blocks)
+
+    @classmethod
+    def from_ascii(cls, data, nodes: GmshNodes = None):
+        """
+        Parses the content of an ASCII $Elements section in one bulk conversion.
+
+        :param data: The text of the section, without the $Elements and $EndElements lines.
+        :param nodes: The nodes of the file, to convert nodes tags to indices. If None, the tags are supposed to
+            follow the nodes order.
+        """
+        if isinstance(data, bytes):
+            data = data.decode()
+        values = npy.fromstring(data, dtype=npy.int64, sep=' ')
+        number_blocks = int(values[0])
+        blocks = []
+        cursor = 4
+        for _ in range(number_blocks):
+            _, _, element_type, block_size = values[cursor:cursor + 4]
+            cursor += 4
+            width = 1 + _elements_nodes_number(int(element_type))
+            blocks.append((element_type, values[cursor:cursor + block_size * width].reshape(block_size, width)))
+            cursor += block_size * width
+        return cls._from_blocks(blocks, int(values[1]), nodes)
+
+    @classmethod
+    def from_binary(cls, data: bytes, nodes: GmshNodes = None, size_t: int = 8, byteorder: str = '<'):
+        """
+        Parses the content of a binary $Elements section of a MSH 4.1 file.
+
+        :param data: The bytes of the section, without the $Elements and $EndElements lines.
+        :param nodes: The nodes of the file, to convert nodes tags to indices. If None, the tags are supposed to
+            follow the nodes order.
+        :param size_t: The size of the size_t values, as given by the mesh format.
+        :param byteorder: The byte order of the file, '<' or '>'.
+        """
+        reader = BinarySectionReader(data, size_t, byteorder)
+        number_blocks, number_elements, _, _ = reader.sizes(4)
+        blocks = []
+        for _ in range(number_blocks):
+            _, _, element_type = reader.ints(3)
+            block_size = int(reader.sizes()[0])
+            width = 1 + _elements_nodes_number(int(element_type))
+            blocks.append((element_type, reader.sizes(block_size * width).reshape(block_size, width)))
+        return cls._from_blocks(blocks, number_elements, nodes)
+
+    @classmethod
+    def _from_blocks(cls, blocks, number_elements, nodes):
+        if sum(len(block) for _, block in blocks) != number_elements:
+            raise ValueError(f'{sum(len(block) for _, block in blocks)} elements read instead of {number_elements}')
+        blocks_nodes = []
+        for _, block in blocks:
+            if nodes is None:
+                blocks_nodes.append(block[:, 1:] - 1)
+            else:
+                blocks_nodes.append(nodes.tags_to_indices(block[:, 1:]))
+        return cls([int(element_type) for element_type, _ in blocks], [block[:, 0] for _, block in blocks],
+                   blocks_nodes)
+
 
 class GmshParser(DessiaObject):
     """
@@ -56,15 +400,37 @@ class GmshParser(DessiaObject):
     @classmethod
     def from_file(cls, file_path: str):
         """
-        Defines a gmsh object from .msh file.
+        Defines a gmsh object from .msh file, in ASCII or binary MSH 4.1 format.
+
+        Nodes and elements are parsed in bulk into numpy arrays, see GmshNodes and GmshElements.
         """
 
-        file_data = GmshParser.read_file(file_path)
-        mesh_format = GmshParser.from_file_mesh_format(file_data['MeshFormat'])
+        sections = GmshParser.read_sections(file_path)
+        format_line = sections['MeshFormat'].split(b'\n', 1)[0].decode()
+        mesh_format = GmshParser.from_file_mesh_format([format_line])
+        if mesh_format['version_number'] != 4.1:
+            raise NotImplementedError(f"MSH format {mesh_format['version_number']} is not supported, "
+                                      f"only 4.1 is")
+        nodes, elements = {}, {}
+        if mesh_format['file_type'][0] == 1:
+            one = sections['MeshFormat'][len(format_line) + 1:len(format_line) + 5]
+            byteorder = '<' if int.from_bytes(one, 'little') == 1 else '>'
+            if sections['Nodes']:
+                nodes = GmshNodes.from_binary(sections['Nodes'], mesh_format['data_size'], byteorder)
+            if sections['Elements']:
+                elements = GmshElements.from_binary(sections['Elements'], nodes or None, mesh_format['data_size'],
+                                                    byteorder)
+            entities = GmshParser.from_binary_entities(sections['Entities'], mesh_format['data_size'], byteorder)
+        else:
+            if sections['Nodes']:
+                nodes = GmshNodes.from_ascii(sections['Nodes'])
+            if sections['Elements']:
+                elements = GmshElements.from_ascii(sections['Elements'], nodes or None)
+            entities = GmshParser.from_file_entities(sections['Entities'].decode().splitlines())
+
+        file_data = {name: section.decode(errors='replace').splitlines() for name, section in sections.items()
+                     if name not in ('Nodes', 'Elements', 'Entities')}
         physical_names = GmshParser.from_file_physical_names(file_data['PhysicalNames'])
-        entities = GmshParser.from_file_entities(file_data['Entities'])
-        nodes = GmshParser.from_file_nodes(file_data['Nodes'])
-        elements = GmshParser.from_file_elements(file_data['Elements'])
         partitioned_entities = GmshParser.from_file_partitioned_entities(file_data['PartitionedEntities'])
         periodic = GmshParser.from_file_periodic(file_data['Periodic'])
         # ghost_elements = GmshParser.from_file_ghost_elements(file_data['GhostElements'])
@@ -98,37 +464,7 @@ class GmshParser(DessiaObject):
         if not lines:
             return {}
 
-        elements = {}
-        elements_types, elements_type = [], []
-        step = 1
-        while True:
-            line = lines[step].split()
-            num_elements_in_block = int(line[3])
-            if num_elements_in_block:
-                element_type = line[2]
-                try:
-                    elements['elements_type_' + element_type]
-                except KeyError:
-                    elements_types.append(elements_type)
-                    elements['elements_type_' + element_type] = []
-                    elements_type = []
-
-                step = step + 1
-                elements_list = []
-                for i in range(step, step + num_elements_in_block):
-                    line = lines[i].split()
-                    element = [int(index) - 1 for index in line[1::]]
-                    # elements['elements_type_'+ element_type].append(element)
-                    elements_list.append(element)
-                    elements_type.append(element)
-                elements['elements_type_' + element_type].append(elements_list)
-
-            step = i + 1  # num_nodes_in_block
-
-            if step == len(lines):
-                break
-
-        return elements
+        return GmshElements.from_ascii('\n'.join(lines))
 
     # $ElementData
     #   numStringTags(ASCII int)
@@ -337,58 +673,7 @@ class GmshParser(DessiaObject):
         if not lines:
             return {}
 
-        nodes = {}
-        nodes_points = []
-        step = 1
-        while True:
-            line = lines[step].split()
-            num_nodes_in_block = int(line[3])
-            if num_nodes_in_block:
-                entity_dim = line[0]
-                # nodes['nodes_dim_'+ entity_dim] = []
-                try:
-                    nodes['nodes_dim_' + entity_dim]
-                except KeyError:
-                    nodes['nodes_dim_' + entity_dim] = []
-
-                step = step + num_nodes_in_block + 1
-                points = []
-                for i in range(step, step + num_nodes_in_block):
-                    line = lines[i].split()
-                    points.append(volmdlr.mesh.Node3D(float(line[0]),
-                                                      float(line[1]),
-                                                      float(line[2])))
-
-                    # nodes['nodes_dim_'+ entity_dim].append(
-                    #     volmdlr.Point3D(float(line[0]),
-                    #                     float(line[1]),
-                    #                     float(line[2])))
-                    # nodes_points.append(volmdlr.Point3D(float(line[0]),
-                    #                                     float(line[1]),
-                    #                                     float(line[2])))
-
-                nodes['nodes_dim_' + entity_dim].append(points)
-                nodes_points.extend(points)
-
-                step = step + num_nodes_in_block
-
-            else:
-                step += 1
-
-            if len(nodes_points) == int(lines[0].split()[1]):
-                break
-
-        if GmshParser.check_2d(nodes_points):
-            for key, value in nodes.items():
-                values = []
-                for points in value:
-                    values.append(GmshParser.to_2d(points))
-                nodes[key] = values
-            nodes['all_nodes'] = GmshParser.to_2d(nodes_points)
-        else:
-            nodes['all_nodes'] = nodes_points
-
-        return nodes
+        return GmshNodes.from_ascii('\n'.join(lines))
 
     # $NodeData
     #   numStringTags(ASCII int)
@@ -527,6 +812,82 @@ class GmshParser(DessiaObject):
 
         return physical_names
 
+    @staticmethod
+    def read_sections(file_path: str):
+        """
+        Gets the sections of a .msh file, reading it at once.
+
+        :param file_path: The path of the .msh file.
+        :return: A dict of the raw content of the sections, without their $ and $End lines. Binary sections are
+            kept as they are, so that they can be read with numpy.frombuffer.
+        :rtype: Dict[str, bytes]
+        """
+
+        sections = {name: b'' for name in ['MeshFormat', 'PhysicalNames', 'Entities', 'PartitionedEntities',
+                                           'Nodes', 'Elements', 'Periodic', 'GhostElements', 'Parametrizations',
+                                           'NodeData', 'ElementData', 'ElementNodeData', 'InterpolationScheme']}
+        with open(file_path, 'rb') as file:
+            data = file.read()
+
+        start = data.find(b'$')
+        while start != -1:
+            header_end = data.find(b'\n', start)
+            name = data[start + 1:header_end].strip().decode()
+            end = data.find(b'\n$End' + name.encode(), header_end)
+            if end == -1:
+                raise ValueError(f'Section ${name} of {file_path} is not closed')
+            content = data[header_end + 1:end]
+            sections[name] = sections[name] + b'\n' + content if sections.get(name) else content
+            start = data.find(b'$', end + len(name) + 5)
+
+        return sections
+
+    @staticmethod
+    def from_binary_entities(data: bytes, size_t: int = 8, byteorder: str = '<'):
+        """
+        Gets entities data from the binary $Entities section of a .msh file.
+        """
+
+        if not data:
+            return {}
+
+        reader = BinarySectionReader(data, size_t, byteorder)
+        entities_numbers = reader.sizes(4)
+
+        points_data = []
+        for _ in range(entities_numbers[0]):
+            points = {'pointTag': int(reader.ints()[0])}
+            points['X'], points['Y'], points['Z'] = reader.doubles(3).tolist()
+            points['numPhysicalTags'] = int(reader.sizes()[0])
+            physical_tags = reader.ints(points['numPhysicalTags'])
+            if points['numPhysicalTags']:
+                points['physicalTag'] = int(physical_tags[0])
+            points_data.append(points)
+
+        entities_data = []
+        # same keys as from_file_entities
+        for dim, (tag_key, number_key, bounding_key) in enumerate([('curveTag', 'numBoundingPoints', 'pointTag'),
+                                                                   ('surfaceTag', 'numBoundingCurves', 'curveTag'),
+                                                                   ('volumeTag', 'numBoundngSurfaces', 'surfaceTag')]):
+            data_list = []
+            for _ in range(entities_numbers[dim + 1]):
+                entity = {tag_key: int(reader.ints()[0])}
+                for key, value in zip(['minX', 'minY', 'minZ', 'maxX', 'maxY', 'maxZ'], reader.doubles(6).tolist()):
+                    entity[key] = value
+                entity['numPhysicalTags'] = int(reader.sizes()[0])
+                physical_tags = reader.ints(entity['numPhysicalTags'])
+                if entity['numPhysicalTags']:
+                    entity['physicalTag'] = int(physical_tags[0])
+                entity[number_key] = int(reader.sizes()[0])
+                entity[bounding_key] = reader.ints(entity[number_key]).tolist()
+                data_list.append(entity)
+            entities_data.append(data_list)
+
+        return {'points': points_data,
+                'curves': entities_data[0],
+                'surfaces': entities_data[1],
+                'volumes': entities_data[2]}
+
     @staticmethod
     def read_file(file_path: str):
         """
@@ -570,6 +931,13 @@ class GmshParser(DessiaObject):
         Defines a volmdlr mesh with TetrahedronElement from a .msh file.
         """
 
+        if isinstance(self.nodes, GmshNodes):
+            element_groups = [volmdlr.mesh.ElementsGroup.from_arrays(self.nodes.coordinates, tetrahedrons, name='')
+                              for tetrahedrons in self.elements.blocks(4)]
+            mesh = volmdlr.mesh.Mesh(element_groups)
+            mesh.gmsh = self
+            return mesh
+
         # nodes = self.nodes[0]
         points = self.nodes['all_nodes']
         # elements = self.elements[0]
@@ -598,6 +966,14 @@ class GmshParser(DessiaObject):
         Defines a volmdlr mesh with TriangularElement from a .msh file.
         """
 
+        if isinstance(self.nodes, GmshNodes):
+            coordinates = self.nodes.coordinates[:, :2] if self.nodes.is_2d() else self.nodes.coordinates
+            element_groups = [volmdlr.mesh.ElementsGroup.from_arrays(coordinates, triangles, name='')
+                              for triangles in self.elements.blocks(2)]
+            mesh = volmdlr.mesh.Mesh(element_groups)
+            mesh.gmsh = self
+            return mesh
+
         # nodes = self.nodes[0]
         points = self.nodes['all_nodes']
         # elements = self.elements[0]
@@ -5,11 +5,13 @@ Module containing mesh and relative objects.
 """
 
 import math
+from collections.abc import Sequence
 from itertools import combinations
 from typing import List
 
 import matplotlib.pyplot as plt
 import numpy as npy
+from scipy.spatial import cKDTree
 
 from dessia_common.core import DessiaObject  # isort: skip
 
@@ -716,8 +718,120 @@ class TetrahedralElement(TriangularElement, vmw.ClosedPolygon3D):
         return form_funct[0], form_funct[1], form_funct[2], form_funct[3]
 
 
+def determinants(matrices):
+    """
+    Computes the determinants of a stack of square matrices.
+
+    Explicit formulas are used for 2x2 and 3x3 matrices, which is much faster than numpy.linalg.det on small
+    matrices.
+
+    :param matrices: A (m, n, n) array of matrices.
+    :return: The (m,) array of their determinants.
+    """
+
+    size = matrices.shape[-1]
+    if size == 2:
+        return matrices[:, 0, 0] * matrices[:, 1, 1] - matrices[:, 0, 1] * matrices[:, 1, 0]
+    if size == 3:
+        return (matrices[:, 0, 0] * (matrices[:, 1, 1] * matrices[:, 2, 2] - matrices[:, 1, 2] * matrices[:, 2, 1])
+                - matrices[:, 0, 1] * (matrices[:, 1, 0] * matrices[:, 2, 2] - matrices[:, 1, 2] * matrices[:, 2, 0])
+                + matrices[:, 0, 2] * (matrices[:, 1, 0] * matrices[:, 2, 1] - matrices[:, 1, 1] * matrices[:, 2, 0]))
+    return npy.linalg.det(matrices)
+
+
+def cofactors(matrices):
+    """
+    Computes the cofactors matrices of a stack of square matrices.
+
+    :param matrices: A (m, n, n) array of matrices.
+    :return: The (m, n, n) array of their cofactors matrices.
+    """
+
+    size = matrices.shape[-1]
+    indices = [[j for j in range(size) if j != i] for i in range(size)]
+    cofactors_matrices = npy.empty(matrices.shape)
+    for i in range(size):
+        rows = matrices[:, indices[i]]
+        for j in range(size):
+            cofactors_matrices[:, i, j] = (-1) ** (i + j) * determinants(rows[:, :, indices[j]])
+    return cofactors_matrices
+
+
+def node_to_elements_adjacency(connectivities, number_nodes: int):
+    """
+    Computes the node to elements adjacency of elements, in compressed sparse row (CSR) format.
+
+    :param connectivities: A list of (m, k) arrays of the nodes indices of the elements, the elements being numbered
+        consecutively from one array to the next.
+    :param number_nodes: The number of nodes.
+    :return: The offsets and elements indices arrays: the elements of the node i are
+        elements_indices[offsets[i]:offsets[i + 1]].
+    """
+
+    nodes_indices = npy.concatenate([connectivity.ravel() for connectivity in connectivities])
+    elements_indices, offset = [], 0
+    for connectivity in connectivities:
+        elements_indices.append(npy.repeat(npy.arange(offset, offset + connectivity.shape[0]), connectivity.shape[1]))
+        offset += connectivity.shape[0]
+    elements_indices = npy.concatenate(elements_indices)
+    offsets = npy.zeros(number_nodes + 1, dtype=npy.int64)
+    npy.cumsum(npy.bincount(nodes_indices, minlength=number_nodes), out=offsets[1:])
+    return offsets, elements_indices[npy.argsort(nodes_indices, kind='stable')]
+
+
+# Classes of the elements defined from arrays, by number of nodes and dimension
+ARRAYS_ELEMENT_CLASSES = {(3, 2): TriangularElement2D, (3, 3): TriangularElement3D,
+                          (4, 2): QuadrilateralElement2D, (4, 3): TetrahedralElement}
+
+
+class LazyElements(Sequence):
+    """
+    Elements defined by a nodes coordinates array and a connectivity array.
+
+    The element objects, and their nodes, are only created when they are accessed.
+
+    :param nodes_coordinates: The (n, 2) or (n, 3) array of the nodes coordinates.
+    :param connectivity: The (m, k) array of the nodes indices of the elements.
+    :param element_class: The class of the elements, built from the list of their nodes.
+    """
+
+    def __init__(self, nodes_coordinates, connectivity, element_class):
+        self.nodes_coordinates = nodes_coordinates
+        self.connectivity = connectivity
+        self.element_class = element_class
+        self._node_class = Node2D if nodes_coordinates.shape[1] == 2 else Node3D
+        self._elements = [None] * len(connectivity)
+        self._nodes = {}
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        element = self._elements[index]
+        if element is None:
+            element = self.element_class([self.node(node_index)
+                                          for node_index in self.connectivity[index].tolist()])
+            self._elements[index] = element
+        return element
+
+    def node(self, index: int):
+        """Gets the node of index index, creating it if needed."""
+        node = self._nodes.get(index)
+        if node is None:
+            node = self._node_class(*self.nodes_coordinates[index].tolist())
+            self._nodes[index] = node
+        return node
+
+
 class ElementsGroup(DessiaObject):
-    """Defines a group of elements."""
+    """
+    Defines a group of elements.
+
+    A group is defined either by a list of elements, or by nodes coordinates and connectivity arrays (see
+    from_arrays), its elements being then created only when they are accessed.
+    """
 
     _standalone_in_db = False
     _non_serializable_attributes = []
@@ -727,19 +841,155 @@ class ElementsGroup(DessiaObject):
 
     def __init__(self, elements, name: str):
         self.elements = elements
-        self.nodes = self._nodes()
         self.name = name
 
+        self._nodes = None
         self._elements_per_node = None
+        self._nodes_coordinates = None
+        self._connectivity = None
+        self._node_to_elements = None
 
         DessiaObject.__init__(self, name=name)
 
-    def _nodes(self):
-        nodes = set()
-        for element in self.elements:
-            for point in element.points:
-                nodes.add(point)
-        return nodes
+    @classmethod
+    def from_arrays(cls, nodes_coordinates, connectivity, name: str = ''):
+        """
+        Defines a group of elements from arrays, without creating the elements.
+
+        The class of the elements is deduced from the number of their nodes and from the dimension: triangles
+        (TriangularElement2D, TriangularElement3D), quadrilaterals (QuadrilateralElement2D) and tetrahedrons
+        (TetrahedralElement) are supported.
+
+        :param nodes_coordinates: The (n, 2) or (n, 3) array of the nodes coordinates. It can be shared by several
+            groups.
+        :param connectivity: The (m, k) array of the indices of the nodes of the elements.
+        :param name: The name of the group.
+        """
+
+        nodes_coordinates = npy.asarray(nodes_coordinates, dtype=npy.float64)
+        connectivity = npy.asarray(connectivity, dtype=npy.int64).reshape(-1, npy.shape(connectivity)[-1])
+        try:
+            element_class = ARRAYS_ELEMENT_CLASSES[(connectivity.shape[1], nodes_coordinates.shape[1])]
+        except KeyError as error:
+            raise NotImplementedError(f'elements with {connectivity.shape[1]} nodes in '
+                                      f'{nodes_coordinates.shape[1]}D are not supported') from error
+
+        group = cls(LazyElements(nodes_coordinates, connectivity, element_class), name=name)
+        group._nodes_coordinates = nodes_coordinates
+        group._connectivity = connectivity
+        return group
+
+    def arrays_element_class(self):
+        """
+        Gets the class of the elements of the group as defined by from_arrays, None if from_arrays can't define them.
+
+        """
+        element_classes = {element.__class__ for element in self.elements}
+        if len(element_classes) != 1:
+            return None
+        element_class = element_classes.pop()
+        element = self.elements[0]
+        dimension = 3 if isinstance(element.points[0], vm.Point3D) else 2
+        if ARRAYS_ELEMENT_CLASSES.get((len(element.points), dimension)) is not element_class:
+            return None
+        return element_class
+
+    def is_array_based(self):
+        """Returns True if the group was defined from arrays, its elements being created on access."""
+        return isinstance(self.elements, LazyElements)
+
+    @property
+    def nodes(self):
+        """The set of the nodes of the elements."""
+        if self._nodes is None:
+            if self.is_array_based():
+                self._nodes = {self.elements.node(index) for index in npy.unique(self.connectivity).tolist()}
+            else:
+                nodes = set()
+                for element in self.elements:
+                    for point in element.points:
+                        nodes.add(point)
+                self._nodes = nodes
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes):
+        self._nodes = nodes
+
+    @property
+    def nodes_coordinates(self):
+        """The (n, 2) or (n, 3) array of the coordinates of the nodes indexed by the connectivity."""
+        if self._nodes_coordinates is None:
+            self._set_arrays()
+        return self._nodes_coordinates
+
+    @property
+    def connectivity(self):
+        """The (m, k) array of the indices of the nodes of the elements, in nodes_coordinates."""
+        if self._connectivity is None:
+            self._set_arrays()
+        return self._connectivity
+
+    def _set_arrays(self):
+        node_to_index = {}
+        connectivity = [[node_to_index.setdefault(point, len(node_to_index)) for point in element.points]
+                        for element in self.elements]
+        self._nodes_coordinates = npy.array([[*node] for node in node_to_index], dtype=npy.float64)
+        self._connectivity = npy.array(connectivity, dtype=npy.int64)
+
+    def node_to_elements(self):
+        """
+        Gets the elements of each node, in compressed sparse row (CSR) format.
+
+        :return: The offsets and elements indices arrays: the elements of the node i of nodes_coordinates are
+            elements_indices[offsets[i]:offsets[i + 1]].
+        """
+        if self._node_to_elements is None:
+            self._node_to_elements = node_to_elements_adjacency([self.connectivity], len(self.nodes_coordinates))
+        return self._node_to_elements
+
+    def elements_points(self):
+        """Gets the (m, k, d) array of the coordinates of the nodes of the elements."""
+        return self.nodes_coordinates[self.connectivity]
+
+    def areas(self):
+        """Computes the areas of the triangular elements of the group, in a vectorized way."""
+        points = self.elements_points()
+        if points.shape[1] != 3:
+            raise NotImplementedError('Areas are only computed for triangular elements')
+        u_vectors = points[:, 1] - points[:, 0]
+        v_vectors = points[:, 2] - points[:, 0]
+        if points.shape[2] == 2:
+            return npy.abs(u_vectors[:, 0] * v_vectors[:, 1] - u_vectors[:, 1] * v_vectors[:, 0]) / 2
+        return npy.linalg.norm(npy.cross(u_vectors, v_vectors), axis=1) / 2
+
+    def volumes(self):
+        """Computes the volumes of the tetrahedral elements of the group, in a vectorized way."""
+        points = self.elements_points()
+        if points.shape[1:] != (4, 3):
+            raise NotImplementedError('Volumes are only computed for tetrahedral elements')
+        return npy.abs(determinants(points[:, 1:] - points[:, :1])) / 6
+
+    def form_functions(self):
+        """
+        Computes the linear form functions of the elements of the group, in a vectorized way.
+
+        The form functions of an element are the same as the form_functions attribute of TriangularElement2D and
+        TetrahedralElement.
+
+        :return: A (m, k, k) array, the form function j of the element i being the vector [i, j].
+        """
+        points = self.elements_points()
+        matrices = npy.concatenate([npy.ones(points.shape[:2] + (1,)), points], axis=2)
+        if points.shape[1:] == (3, 2):
+            cofactors_matrices = cofactors(matrices)
+            elements_determinants = npy.einsum('ij,ij->i', matrices[:, 0], cofactors_matrices[:, 0])
+            if not elements_determinants.all():
+                raise FlatElementError('form function bug')
+            return cofactors_matrices / elements_determinants[:, None, None]
+        if points.shape[1:] == (4, 3):
+            return cofactors(matrices)
+        raise NotImplementedError('Form functions are only computed for triangular 2D and tetrahedral elements')
 
     def point_to_element(self, point):
         for element in self.elements:
@@ -788,7 +1038,12 @@ class ElementsGroup(DessiaObject):
 
 
 class Mesh(DessiaObject):
-    """Defines a mesh."""
+    """
+    Defines a mesh.
+
+    When its groups are defined from arrays, the nodes of the mesh are stored in the nodes_coordinates array and
+    the nodes and node_to_index attributes are only computed when they are accessed.
+    """
 
     _standalone_in_db = True
     _non_serializable_attributes = ['node_to_index']
@@ -798,12 +1053,97 @@ class Mesh(DessiaObject):
 
     def __init__(self, elements_groups: List[ElementsGroup]):
         self.elements_groups = elements_groups
-        self.nodes = self._set_nodes_number()
-        self.node_to_index = {self.nodes[i]: i for i in range(len(self.nodes))}
+        self._nodes = None
+        # node_to_index dict, nodes and connectivity arrays and node to elements adjacency, computed when needed
+        self._caches = {}
         self._nodes_correction = {}
+        self._nodes_correction_parameters = None
         self._gmsh = None
         DessiaObject.__init__(self, name='')
 
+    def is_array_based(self):
+        """Returns True if all the groups of the mesh are defined from arrays."""
+        return bool(self.elements_groups) and all(group.is_array_based() for group in self.elements_groups)
+
+    @property
+    def nodes(self):
+        """The tuple of the nodes of the mesh."""
+        if self._nodes is None:
+            if self.is_array_based():
+                node_class = Node2D if self.nodes_coordinates.shape[1] == 2 else Node3D
+                self._nodes = tuple(node_class(*coordinates) for coordinates in self.nodes_coordinates.tolist())
+            else:
+                self._nodes = self._set_nodes_number()
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes):
+        self._nodes = nodes
+        self._caches.pop('node_to_index', None)
+
+    @property
+    def node_to_index(self):
+        """A dict giving the index of each node in nodes."""
+        if 'node_to_index' not in self._caches:
+            self._caches['node_to_index'] = {node: i for i, node in enumerate(self.nodes)}
+        return self._caches['node_to_index']
+
+    @node_to_index.setter
+    def node_to_index(self, node_to_index):
+        self._caches['node_to_index'] = node_to_index
+
+    @property
+    def nodes_coordinates(self):
+        """The array of the coordinates of the nodes of the mesh."""
+        if 'nodes_coordinates' not in self._caches:
+            self._set_arrays()
+        return self._caches['nodes_coordinates']
+
+    @property
+    def groups_connectivity(self):
+        """The connectivity arrays of the groups, in the nodes numbering of the mesh."""
+        if 'groups_connectivity' not in self._caches:
+            self._set_arrays()
+        return self._caches['groups_connectivity']
+
+    def _set_arrays(self):
+        groups = self.elements_groups
+        if not self.is_array_based():
+            nodes_coordinates = npy.array([[*node] for node in self.nodes], dtype=npy.float64)
+            node_to_index = self.node_to_index
+            groups_connectivity = [npy.array([[node_to_index[point] for point in element.points]
+                                              for element in group.elements], dtype=npy.int64)
+                                   for group in groups]
+        elif all(group.nodes_coordinates is groups[0].nodes_coordinates for group in groups):
+            # groups sharing their nodes, as the ones of a .msh file: only the nodes used are kept
+            used_nodes = npy.unique(npy.concatenate([group.connectivity.ravel() for group in groups]))
+            nodes_coordinates = groups[0].nodes_coordinates[used_nodes]
+            groups_connectivity = [npy.searchsorted(used_nodes, group.connectivity) for group in groups]
+        else:
+            # identical nodes of different groups are merged
+            offsets = npy.cumsum([0] + [len(group.nodes_coordinates) for group in groups])
+            nodes_coordinates, inverse = npy.unique(
+                npy.concatenate([group.nodes_coordinates for group in groups]), axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            groups_connectivity = [inverse[offset + group.connectivity]
+                                   for offset, group in zip(offsets, groups)]
+        self._caches['nodes_coordinates'] = nodes_coordinates
+        self._caches['groups_connectivity'] = groups_connectivity
+
+    def node_to_elements(self):
+        """
+        Gets the elements of each node of the mesh, in compressed sparse row (CSR) format.
+
+        The elements are numbered consecutively from one group to the next.
+
+        :return: The offsets and elements indices arrays: the elements of the node i are
+            elements_indices[offsets[i]:offsets[i + 1]].
+        """
+        if 'node_to_elements' not in self._caches:
+            self._caches['node_to_elements'] = node_to_elements_adjacency(self.groups_connectivity,
+                                                                          len(self.nodes_coordinates))
+        return self._caches['node_to_elements']
+
     # def __add__(self, other_mesh):
     #     new_nodes = self.nodes[:]
     #     new_nodes_index = {p: i for i, p in enumerate(self.points)}
@@ -915,16 +1255,9 @@ class Mesh(DessiaObject):
     #     return ax
 
     def bounding_rectangle(self):
-        nodes = self.nodes
-        x, y = [], []
-        for n in nodes:
-            x.append(n.x)
-            y.append(n.y)
-        if len([*nodes[0]]) == 2:
-            return min(x), max(x), min(y), max(y)
-
-        z = [n.z for n in nodes]
-        return min(x), max(x), min(y), max(y), min(z), max(z)
+        mins = self.nodes_coordinates.min(axis=0).tolist()
+        maxs = self.nodes_coordinates.max(axis=0).tolist()
+        return tuple(value for bounds in zip(mins, maxs) for value in bounds)
 
     # def delete_duplicated_nodes(self, tol=1e-4):
     #     mesh = self.__class__(self.elements_groups[:])
@@ -952,63 +1285,93 @@ class Mesh(DessiaObject):
 
     #     return mesh
 
-    def nodes_correction(self, reference_index, tol=1e-4):
-        if not self._nodes_correction:
-            nodes_reference = self.elements_groups[reference_index].nodes
-            groups = self.elements_groups[:]
-            groups.pop(reference_index)
-            nodes_correction = {}
+    def nodes_correction_indices(self, reference_index, tol=1e-4):
+        """
+        Finds the nodes of the other groups that are close to a node of the reference group.
 
-            for group in groups:
-                for node in group.nodes:
-                    for node_ref in nodes_reference:
-                        d = node.point_distance(node_ref)
-                        if 1e-8 < d < 1e-4:
-                            nodes_correction[node] = node_ref
+        The nearest reference node of each node is found with a KD-tree of the reference nodes. Nodes closer than
+        1e-8 to a reference node are considered as already merged.
 
-            self._nodes_correction = nodes_correction
+        :param reference_index: The index of the reference group.
+        :param tol: The distance under which a node is corrected.
+        :return: The indices of the nodes to correct and the ones of their reference nodes, in nodes_coordinates.
+        """
 
-        return self._nodes_correction
+        groups_connectivity = self.groups_connectivity
+        reference_nodes = npy.unique(groups_connectivity[reference_index])
+        other_nodes = npy.unique(npy.concatenate([npy.zeros(0, dtype=npy.int64)] + [
+            connectivity.ravel() for i, connectivity in enumerate(groups_connectivity) if i != reference_index]))
+        if len(reference_nodes) == 0 or len(other_nodes) == 0:
+            return npy.zeros(0, dtype=npy.int64), npy.zeros(0, dtype=npy.int64)
+        distances, indices = cKDTree(self.nodes_coordinates[reference_nodes]).query(
+            self.nodes_coordinates[other_nodes], distance_upper_bound=tol)
+        corrected = (distances > 1e-8) & (distances < tol)
+        return other_nodes[corrected], reference_nodes[indices[corrected]]
 
-    def delete_duplicated_nodes(self, reference_index, tol=1e-4):
+    def nodes_correction(self, reference_index, tol=1e-4):
+        """
+        Gets the nodes of the other groups that are close to a node of the reference group.
 
-        groups = self.elements_groups[:]
-        groups.pop(reference_index)
+        The result is cached for the last reference_index and tol.
 
-        nodes_correction = self.nodes_correction(reference_index, tol)
+        :return: A dict of the nodes to correct, with their reference node as value.
+        :rtype: dict
+        """
+        if self._nodes_correction_parameters != (reference_index, tol):
+            self.set_nodes_correction(self._nodes_correction_dict(
+                *self.nodes_correction_indices(reference_index, tol)), (reference_index, tol))
 
-        count = 0
-        old_elements, new_elements = set(), set()
-        for g, group in enumerate(groups):
-            elements = []
-            for element in group.elements:
-                new = False
-                points = []
+        return self._nodes_correction
 
-                for point in element.points:
-                    correc_point = nodes_correction.get(point)
-                    if correc_point is not None:
-                        points.append(correc_point)
-                        count += 1
-                        old_elements.add(element)
-                        new = True
-                    else:
-                        points.append(point)
+    def _nodes_correction_dict(self, nodes_indices, reference_indices):
+        if self._nodes is None and self.is_array_based():
+            node_class = Node2D if self.nodes_coordinates.shape[1] == 2 else Node3D
+            return {node_class(*self.nodes_coordinates[index]): node_class(*self.nodes_coordinates[reference_index])
+                    for index, reference_index in zip(nodes_indices.tolist(), reference_indices.tolist())}
+        return {self.nodes[index]: self.nodes[reference_index]
+                for index, reference_index in zip(nodes_indices.tolist(), reference_indices.tolist())}
 
-                elements.append(element.__class__(points))
-                if new:
-                    new_elements.add(element.__class__(points))
+    def delete_duplicated_nodes(self, reference_index, tol=1e-4):
+        """
+        Replaces the nodes of the other groups that are close to a node of the reference group by this node.
 
-            groups[g] = group.__class__(elements, name='')
+        The connectivity arrays of the groups are remapped, the new groups being defined from arrays. Groups whose
+        elements can't be defined from arrays (see ElementsGroup.from_arrays) are rebuilt with their elements classes.
+        """
 
-        groups.insert(reference_index, self.elements_groups[reference_index])
+        nodes_indices, reference_indices = self.nodes_correction_indices(reference_index, tol)
+        if self._nodes_correction_parameters != (reference_index, tol):
+            self.set_nodes_correction(self._nodes_correction_dict(nodes_indices, reference_indices),
+                                      (reference_index, tol))
+
+        nodes_remap = npy.arange(len(self.nodes_coordinates))
+        nodes_remap[nodes_indices] = reference_indices
+        groups = []
+        for i, (group, connectivity) in enumerate(zip(self.elements_groups, self.groups_connectivity)):
+            if not group.is_array_based() and group.arrays_element_class() is None:
+                groups.append(group if i == reference_index else group.__class__(
+                    [self._corrected_element(element) for element in group.elements], name=''))
+            elif i == reference_index:
+                groups.append(ElementsGroup.from_arrays(self.nodes_coordinates, connectivity, name=group.name))
+            else:
+                groups.append(ElementsGroup.from_arrays(self.nodes_coordinates, nodes_remap[connectivity], name=''))
 
         mesh = self.__class__(groups)
-        mesh.gmsh = self.gmsh
-        mesh.set_nodes_correction(self.get_nodes_correction())
+        if self.gmsh is not None:
+            mesh.gmsh = self.gmsh
+        mesh.set_nodes_correction(self.get_nodes_correction(), self._nodes_correction_parameters)
 
         return mesh
 
+    def _corrected_element(self, element):
+        """Copies an element with its nodes replaced by their reference node, as in nodes_correction."""
+        points = [self._nodes_correction.get(point, point) for point in element.points]
+        if all(point is old_point for point, old_point in zip(points, element.points)):
+            return element
+        if isinstance(element, LinearElement):
+            return element.__class__(*points, element.interior_normal)
+        return element.__class__(points)
+
     def get_nodes_correction(self):
         """
         A getter method for nodes_correction private variable.
@@ -1019,17 +1382,20 @@ class Mesh(DessiaObject):
 
         return self._nodes_correction
 
-    def set_nodes_correction(self, nodes_correction):
+    def set_nodes_correction(self, nodes_correction, parameters=None):
         """
         A setter method for nodes_correction private variable.
 
         :param nodes_correction: A dict of nodes_correction
         :type nodes_correction: dict
+        :param parameters: The (reference_index, tol) the nodes correction was computed with, None if unknown.
+        :type parameters: tuple
         """
 
         if not isinstance(nodes_correction, dict):
             raise ValueError("It must be volmdlr.GmshParser class")
         self._nodes_correction = nodes_correction
+        self._nodes_correction_parameters = parameters
 
     @property
     def gmsh(self):
@@ -1057,7 +1423,7 @@ class Mesh(DessiaObject):
 
     def copy(self):
         m = self.__class__(elements_groups=self.elements_groups[:])
-        m.set_nodes_correction(self.get_nodes_correction())
+        m.set_nodes_correction(self.get_nodes_correction(), self._nodes_correction_parameters)
         m.gmsh = self.gmsh
 
         return m
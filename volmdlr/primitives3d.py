@@ -18,6 +18,7 @@ from scipy.stats import qmc
 
 import volmdlr
 import volmdlr.core
+import volmdlr.display
 import volmdlr.edges
 import volmdlr.faces
 import volmdlr.primitives
@@ -905,6 +906,268 @@ class RevolvedProfile(volmdlr.faces.ClosedShell3D):
         self.axis_point.frame_mapping_inplace(frame, side)
 
 
+def _cylinders_min_distance_optimization(position1, axis1, radius1: float, length1: float,
+                                         position2, axis2, radius2: float, length2: float) -> float:
+    """
+    Computes the minimal distance between two cylinders with a constrained optimization.
+
+    :param position1: The center of the first cylinder, as a tuple or an array.
+    :param axis1: The unit axis of the first cylinder, as a tuple or an array.
+    :param position2: The center of the second cylinder, as a tuple or an array.
+    :param axis2: The unit axis of the second cylinder, as a tuple or an array.
+    """
+    # Local frames of cylinders
+    frame0 = volmdlr.Frame3D.from_point_and_vector(
+        point=volmdlr.Point3D(*position1), vector=volmdlr.Vector3D(*axis1), main_axis=volmdlr.Z3D
+    )
+    frame1 = volmdlr.Frame3D.from_point_and_vector(
+        point=volmdlr.Point3D(*position2),
+        vector=volmdlr.Vector3D(*axis2),
+        main_axis=volmdlr.Z3D,
+    )
+
+    matrix0 = frame0.transfer_matrix()
+    x0, y0, z0 = frame0.origin.x, frame0.origin.y, frame0.origin.z
+    matrix1 = frame1.transfer_matrix()
+    x1, y1, z1 = frame1.origin.x, frame1.origin.y, frame1.origin.z
+
+    # Euclidean distance
+    def dist(p0, p1):
+        return math.sqrt(
+            (p0[0] - p1[0]) ** 2 + (p0[1] - p1[1]) ** 2 + (p0[2] - p1[2]) ** 2
+        )
+
+    # Local coordinates to global coordinates
+    def to_global_point(p, matrix, origin):
+        return [
+            matrix.M11 * p[0] + matrix.M12 * p[1] + matrix.M13 * p[2] + origin[0],
+            matrix.M21 * p[0] + matrix.M22 * p[1] + matrix.M23 * p[2] + origin[1],
+            matrix.M31 * p[0] + matrix.M32 * p[1] + matrix.M33 * p[2] + origin[2],
+        ]
+
+    # Objective function
+    def objective(x):
+        p0 = to_global_point(x[:3], matrix0, [x0, y0, z0])
+        p1 = to_global_point(x[3:], matrix1, [x1, y1, z1])
+
+        return dist(p0, p1)
+
+    # Gradient of objective function
+    def gradient_objective(x):
+        p0 = to_global_point(x[:3], matrix0, [x0, y0, z0])
+        p1 = to_global_point(x[3:], matrix1, [x1, y1, z1])
+
+        distance = dist(p0, p1)
+
+        return [
+            (p0[0] - p1[0]) / distance * matrix0.M11
+            + (p0[1] - p1[1]) / distance * matrix0.M21
+            + (p0[2] - p1[2]) / distance * matrix0.M31,
+            (p0[0] - p1[0]) / distance * matrix0.M12
+            + (p0[1] - p1[1]) / distance * matrix0.M22
+            + (p0[2] - p1[2]) / distance * matrix0.M32,
+            (p0[0] - p1[0]) / distance * matrix0.M13
+            + (p0[1] - p1[1]) / distance * matrix0.M23
+            + (p0[2] - p1[2]) / distance * matrix0.M33,
+            (p1[0] - p0[0]) / distance * matrix1.M11
+            + (p1[1] - p0[1]) / distance * matrix1.M21
+            + (p1[2] - p0[2]) / distance * matrix1.M31,
+            (p1[0] - p0[0]) / distance * matrix1.M12
+            + (p1[1] - p0[1]) / distance * matrix1.M22
+            + (p1[2] - p0[2]) / distance * matrix1.M32,
+            (p1[0] - p0[0]) / distance * matrix1.M13
+            + (p1[1] - p0[1]) / distance * matrix1.M23
+            + (p1[2] - p0[2]) / distance * matrix1.M33,
+        ]
+
+    # Initial vector
+    initial_guess = npy.zeros(6)
+
+    # Constraints
+    def constraint_radius_0(x):
+        # radius of cylinder 0
+        return x[0] ** 2 + x[1] ** 2
+
+    def constraint_radius_1(x):
+        # radius of cylinder 1
+        return x[3] ** 2 + x[4] ** 2
+
+    def gradient_constraint_radius_0(x):
+        # gradient of constraint_radius_0
+        return [2 * x[0], 2 * x[1], 0, 0, 0, 0]
+
+    def gradient_constraint_radius_1(x):
+        # gradient of constraint_radius_1
+        return [0, 0, 0, 2 * x[3], 2 * x[4], 0]
+
+    constraints = [
+        NonlinearConstraint(
+            fun=constraint_radius_0,
+            lb=0,
+            ub=radius1**2,
+            jac=gradient_constraint_radius_0,
+        ),
+        NonlinearConstraint(
+            fun=constraint_radius_1,
+            lb=0,
+            ub=radius2**2,
+            jac=gradient_constraint_radius_1,
+        ),
+    ]
+
+    # Bounds
+    bounds = Bounds(
+        lb=[
+            -radius1,
+            -radius1,
+            -length1 / 2,
+            -radius2,
+            -radius2,
+            -length2 / 2,
+        ],
+        ub=[
+            radius1,
+            radius1,
+            length1 / 2,
+            radius2,
+            radius2,
+            length2 / 2,
+        ],
+    )
+
+    return minimize(
+        fun=objective,
+        x0=initial_guess,
+        bounds=bounds,
+        tol=1e-6,
+        constraints=constraints,
+        jac=gradient_objective,
+    ).fun
+
+
+def _cylinders_closest_points(points, positions, axes, radii, lengths):
+    """
+    Closest point of the cylinder of the same index, for each point. Points inside the cylinders are kept.
+
+    """
+    vectors = points - positions
+    axial_coordinates = npy.einsum('ij,ij->i', vectors, axes)
+    radial_vectors = vectors - axial_coordinates[:, None] * axes
+    radial_distances = npy.linalg.norm(radial_vectors, axis=1)
+    outside = radial_distances > radii
+    radial_vectors[outside] *= (radii[outside] / radial_distances[outside])[:, None]
+    return (positions + npy.clip(axial_coordinates, -0.5 * lengths, 0.5 * lengths)[:, None] * axes
+            + radial_vectors)
+
+
+def cylinders_pairs_distances(positions, axes, radii, lengths, pairs, max_distance: float = math.inf,
+                              max_iterations: int = 100):
+    """
+    Minimal distances between pairs of cylinders, computed on all the pairs at once.
+
+    The distance of the axes segments gives the exact distance when the closest points of the axes are joined by a
+    common perpendicular: the cylinders are then closest by their lateral faces. Otherwise a cap is involved, and
+    the closest points are found by alternating projections on the two cylinders, which are convex. The optimizer
+    is only used for the pairs on which the projections did not converge. The pairs whose lower bound, given by the
+    axes distance minus the radii or by separating axes, is greater than max_distance get this lower bound.
+
+    :param positions: The (n, 3) array of the centers of the cylinders.
+    :param axes: The (n, 3) array of the unit axes of the cylinders.
+    :param radii: The (n,) array of the radii of the cylinders.
+    :param lengths: The (n,) array of the lengths of the cylinders.
+    :param pairs: The (k, 2) array of the indices of the cylinders of each pair.
+    :param max_distance: The distance above which the distances do not need to be exact.
+    :param max_iterations: The maximal number of alternating projections.
+    :return: The (k,) array of the distances.
+    """
+    positions, axes = npy.asarray(positions, dtype=float), npy.asarray(axes, dtype=float)
+    radii, lengths = npy.asarray(radii, dtype=float), npy.asarray(lengths, dtype=float)
+    pairs = npy.asarray(pairs, dtype=int).reshape(-1, 2)
+    indices1, indices2 = pairs[:, 0], pairs[:, 1]
+
+    directions = lengths[:, None] * axes
+    starts = positions - 0.5 * directions
+    points1, points2 = volmdlr.display.segments_closest_points(starts[indices1], directions[indices1],
+                                                               starts[indices2], directions[indices2])
+    vectors = points2 - points1
+    axes_distances = npy.linalg.norm(vectors, axis=1)
+    distances = npy.maximum(axes_distances - radii[indices1] - radii[indices2], 0.)
+
+    # Separating axes give other lower bounds: the gaps between the projections of the cylinders
+    for directions in (axes[indices1], axes[indices2], vectors, npy.cross(axes[indices1], axes[indices2])):
+        norms = npy.linalg.norm(directions, axis=1)
+        valid = norms > 1e-12
+        directions = directions[valid] / norms[valid, None]
+        half_widths = []
+        for indices in (indices1[valid], indices2[valid]):
+            cosines = npy.abs(npy.einsum('ij,ij->i', axes[indices], directions))
+            half_widths.append(0.5 * lengths[indices] * cosines
+                               + radii[indices] * npy.sqrt(npy.maximum(1. - cosines ** 2, 0.)))
+        centers_distances = npy.abs(npy.einsum('ij,ij->i', positions[indices2[valid]] - positions[indices1[valid]],
+                                               directions))
+        distances[valid] = npy.maximum(distances[valid], centers_distances - half_widths[0] - half_widths[1])
+
+    tolerances = 1e-9 * axes_distances
+    exact = ((npy.abs(npy.einsum('ij,ij->i', vectors, axes[indices1])) <= tolerances)
+             & (npy.abs(npy.einsum('ij,ij->i', vectors, axes[indices2])) <= tolerances))
+
+    # Alternating projections on the two convex cylinders converge to the closest points, or to a common point
+    remaining = npy.nonzero(~exact & (distances <= max_distance))[0]
+    points = points1[remaining]
+    cylinders1 = [array[indices1[remaining]] for array in (positions, axes, radii, lengths)]
+    cylinders2 = [array[indices2[remaining]] for array in (positions, axes, radii, lengths)]
+    for _ in range(max_iterations):
+        if len(remaining) == 0:
+            break
+        other_points = _cylinders_closest_points(points, *cylinders2)
+        new_points = _cylinders_closest_points(other_points, *cylinders1)
+        moves = npy.linalg.norm(new_points - points, axis=1)
+        points = new_points
+        scales = cylinders1[2] + cylinders1[3] + cylinders2[2] + cylinders2[3]
+        converged = moves <= 1e-12 * scales
+        converged_distances = npy.linalg.norm(other_points[converged] - points[converged], axis=1)
+        # Intersecting cylinders: the points converge to a common point
+        converged_distances[converged_distances <= 1e-9 * scales[converged]] = 0.
+        distances[remaining[converged]] = converged_distances
+        remaining, points = remaining[~converged], points[~converged]
+        cylinders1 = [array[~converged] for array in cylinders1]
+        cylinders2 = [array[~converged] for array in cylinders2]
+
+    for index in remaining.tolist():
+        index1, index2 = indices1[index], indices2[index]
+        distances[index] = _cylinders_min_distance_optimization(
+            positions[index1].tolist(), axes[index1].tolist(), radii[index1], lengths[index1],
+            positions[index2].tolist(), axes[index2].tolist(), radii[index2], lengths[index2])
+    return distances
+
+
+def cylinders_min_distances(positions, axes, radii, lengths, max_distance: float = 0.):
+    """
+    Finds the pairs of cylinders closer than max_distance, among n cylinders.
+
+    Candidate pairs are found with a bounding volume hierarchy over the bounding boxes of the cylinders, their
+    distances being then computed with cylinders_pairs_distances.
+
+    :param positions: The (n, 3) array of the centers of the cylinders.
+    :param axes: The (n, 3) array of the unit axes of the cylinders.
+    :param radii: The (n,) array of the radii of the cylinders.
+    :param lengths: The (n,) array of the lengths of the cylinders.
+    :param max_distance: The maximal distance of the pairs, 0 to find the intersecting pairs.
+    :return: The (k, 2) array of the indices of the pairs, in lexicographic order, and their (k,) distances.
+    """
+    positions, axes = npy.asarray(positions, dtype=float).reshape(-1, 3), npy.asarray(axes, dtype=float).reshape(-1, 3)
+    radii, lengths = npy.asarray(radii, dtype=float), npy.asarray(lengths, dtype=float)
+    extents = (0.5 * lengths[:, None] * npy.abs(axes)
+               + radii[:, None] * npy.sqrt(npy.maximum(1. - axes ** 2, 0.)))
+    mins, maxs = positions - extents, positions + extents
+    bvh = volmdlr.core.BoundingVolumeHierarchy(mins, maxs)
+    pairs = bvh.boxes_query(mins, maxs, tol=max_distance)
+    pairs = pairs[pairs[:, 0] < pairs[:, 1]]
+    distances = cylinders_pairs_distances(positions, axes, radii, lengths, pairs, max_distance=max_distance)
+    close = distances <= max_distance
+    return pairs[close], distances[close]
+
+
 class Cylinder(RevolvedProfile):
     """
     Creates a full cylinder with the position, the axis of revolution the radius and the length.
@@ -1094,6 +1357,8 @@ class Cylinder(RevolvedProfile):
         """
         Compute the minimal distance between two volmdlr cylinders.
 
+        The optimizer is only used when a cap is involved, see cylinders_pairs_distances.
+
         :param other_cylinder: volmdlr Cylinder
         :return: minimal distance between two 3D cylinders
         """
@@ -1101,133 +1366,24 @@ class Cylinder(RevolvedProfile):
         if self.point_belongs(other_cylinder.position) or other_cylinder.point_belongs(self.position):
             return 0.
 
-        # Local frames of cylinders
-        frame0 = volmdlr.Frame3D.from_point_and_vector(
-            point=self.position, vector=self.axis, main_axis=volmdlr.Z3D
-        )
-        frame1 = volmdlr.Frame3D.from_point_and_vector(
-            point=other_cylinder.position,
-            vector=other_cylinder.axis,
-            main_axis=volmdlr.Z3D,
-        )
-
-        matrix0 = frame0.transfer_matrix()
-        x0, y0, z0 = frame0.origin.x, frame0.origin.y, frame0.origin.z
-        matrix1 = frame1.transfer_matrix()
-        x1, y1, z1 = frame1.origin.x, frame1.origin.y, frame1.origin.z
-
-        # Euclidean distance
-        def dist(p0, p1):
-            return math.sqrt(
-                (p0[0] - p1[0]) ** 2 + (p0[1] - p1[1]) ** 2 + (p0[2] - p1[2]) ** 2
-            )
-
-        # Local coordinates to global coordinates
-        def to_global_point(p, matrix, origin):
-            return [
-                matrix.M11 * p[0] + matrix.M12 * p[1] + matrix.M13 * p[2] + origin[0],
-                matrix.M21 * p[0] + matrix.M22 * p[1] + matrix.M23 * p[2] + origin[1],
-                matrix.M31 * p[0] + matrix.M32 * p[1] + matrix.M33 * p[2] + origin[2],
-            ]
-
-        # Objective function
-        def objective(x):
-            p0 = to_global_point(x[:3], matrix0, [x0, y0, z0])
-            p1 = to_global_point(x[3:], matrix1, [x1, y1, z1])
-
-            return dist(p0, p1)
-
-        # Gradient of objective function
-        def gradient_objective(x):
-            p0 = to_global_point(x[:3], matrix0, [x0, y0, z0])
-            p1 = to_global_point(x[3:], matrix1, [x1, y1, z1])
-
-            distance = dist(p0, p1)
-
-            return [
-                (p0[0] - p1[0]) / distance * matrix0.M11
-                + (p0[1] - p1[1]) / distance * matrix0.M21
-                + (p0[2] - p1[2]) / distance * matrix0.M31,
-                (p0[0] - p1[0]) / distance * matrix0.M12
-                + (p0[1] - p1[1]) / distance * matrix0.M22
-                + (p0[2] - p1[2]) / distance * matrix0.M32,
-                (p0[0] - p1[0]) / distance * matrix0.M13
-                + (p0[1] - p1[1]) / distance * matrix0.M23
-                + (p0[2] - p1[2]) / distance * matrix0.M33,
-                (p1[0] - p0[0]) / distance * matrix1.M11
-                + (p1[1] - p0[1]) / distance * matrix1.M21
-                + (p1[2] - p0[2]) / distance * matrix1.M31,
-                (p1[0] - p0[0]) / distance * matrix1.M12
-                + (p1[1] - p0[1]) / distance * matrix1.M22
-                + (p1[2] - p0[2]) / distance * matrix1.M32,
-                (p1[0] - p0[0]) / distance * matrix1.M13
-                + (p1[1] - p0[1]) / distance * matrix1.M23
-                + (p1[2] - p0[2]) / distance * matrix1.M33,
-            ]
-
-        # Initial vector
-        initial_guess = npy.zeros(6)
-
-        # Constraints
-        def constraint_radius_0(x):
-            # radius of cylinder 0
-            return x[0] ** 2 + x[1] ** 2
-
-        def constraint_radius_1(x):
-            # radius of cylinder 1
-            return x[3] ** 2 + x[4] ** 2
-
-        def gradient_constraint_radius_0(x):
-            # gradient of constraint_radius_0
-            return [2 * x[0], 2 * x[1], 0, 0, 0, 0]
-
-        def gradient_constraint_radius_1(x):
-            # gradient of constraint_radius_1
-            return [0, 0, 0, 2 * x[3], 2 * x[4], 0]
-
-        constraints = [
-            NonlinearConstraint(
-                fun=constraint_radius_0,
-                lb=0,
-                ub=self.radius**2,
-                jac=gradient_constraint_radius_0,
-            ),
-            NonlinearConstraint(
-                fun=constraint_radius_1,
-                lb=0,
-                ub=other_cylinder.radius**2,
-                jac=gradient_constraint_radius_1,
-            ),
-        ]
+        return float(cylinders_pairs_distances([[*self.position], [*other_cylinder.position]],
+                                               [[*self.axis], [*other_cylinder.axis]],
+                                               [self.radius, other_cylinder.radius],
+                                               [self.length, other_cylinder.length], [[0, 1]])[0])
 
-        # Bounds
-        bounds = Bounds(
-            lb=[
-                -self.radius,
-                -self.radius,
-                -self.length / 2,
-                -other_cylinder.radius,
-                -other_cylinder.radius,
-                -other_cylinder.length / 2,
-            ],
-            ub=[
-                self.radius,
-                self.radius,
-                self.length / 2,
-                other_cylinder.radius,
-                other_cylinder.radius,
-                other_cylinder.length / 2,
-            ],
-        )
+    @staticmethod
+    def cylinders_min_distances(cylinders: List['Cylinder'], max_distance: float = 0.):
+        """
+        Finds the pairs of cylinders closer than max_distance, see the cylinders_min_distances function.
 
-        return minimize(
-            fun=objective,
-            x0=initial_guess,
-            bounds=bounds,
-            tol=1e-6,
-            constraints=constraints,
-            jac=gradient_objective,
-        ).fun
+        :param cylinders: volmdlr Cylinders
+        :param max_distance: The maximal distance of the pairs, 0 to find the intersecting pairs.
+        :return: The (k, 2) array of the indices of the pairs, and their (k,) distances.
+        """
+        return cylinders_min_distances([[*cylinder.position] for cylinder in cylinders],
+                                       [[*cylinder.axis] for cylinder in cylinders],
+                                       [cylinder.radius for cylinder in cylinders],
+                                       [cylinder.length for cylinder in cylinders], max_distance=max_distance)
 
     def is_intersecting_other_cylinder(self, other_cylinder: 'Cylinder') -> bool:
         """
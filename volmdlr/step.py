@@ -4,7 +4,20 @@
 ISO STEP reader/writer.
 """
 
+import hashlib
+import mmap
+import os
+import pickle
+import re
+import stat
+import tempfile
 import time
+import warnings
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 import numpy as npy
 
@@ -491,6 +504,258 @@ def bounded_surface_b_spline_surface_b_spline_surface_with_knots_geometric_repre
         modified_arguments, object_dict)
 
 
+def step_subfunctions(subfunctions):
+    """
+    Splits the subfunctions of a complex entity.
+
+    ex: IN: ['(LENGTH_UNIT()NAMED_UNIT(*)SI_UNIT(.MILLI.,.METRE.))']
+       OUT: [('LENGTH_UNIT', ['']), ('NAMED_UNIT', ['*']), ('SI_UNIT', ['.MILLI.', '.METRE.'])]
+    """
+    subfunctions = subfunctions[0]
+    parenthesis_count = 0
+    subfunction_names = []
+    subfunction_args = []
+    subfunction_name = ""
+    subfunction_arg = ""
+    for char in subfunctions:
+
+        if char == "(":
+            parenthesis_count += 1
+            if parenthesis_count == 1:
+                subfunction_names.append(subfunction_name)
+                subfunction_name = ""
+            else:
+                subfunction_arg += char
+
+        elif char == ")":
+            parenthesis_count -= 1
+            if parenthesis_count == 0:
+                subfunction_args.append(subfunction_arg)
+                subfunction_arg = ""
+            else:
+                subfunction_arg += char
+
+        elif parenthesis_count == 0:
+            subfunction_name += char
+
+        else:
+            subfunction_arg += char
+    return [
+        (subfunction_names[i], step_split_arguments(subfunction_args[i]))
+        for i in range(len(subfunction_names))]
+
+
+def step_function_from_line(line):
+    """
+    Parses the arguments of a STEP entity line, such as "#12=PLANE('',#11);".
+
+    :param line: The STEP entity, without its spaces and line breaks.
+    :return: The StepFunction of the entity.
+    """
+    function = line.split("=", 1)
+    function_id = int(function[0][1:])
+    function_name_arg = function[1].split("(", 1)
+    function_name = function_name_arg[0]
+
+    # FUNCTION ARGUMENTS
+    arguments = step_split_arguments(function_name_arg[1])
+    if function_name == "":
+        new_name = ''
+        new_arguments = []
+        for name, arg in step_subfunctions(arguments):
+            new_name += name + ', '
+            new_arguments.extend(arg)
+        function_name = new_name[:-2]
+        arguments = new_arguments
+
+    for i, argument in enumerate(arguments):
+        if argument[:2] == '(#' and argument[-1] == ')':
+            arguments[i] = set_to_list(argument)
+
+    return StepFunction(function_id, function_name, arguments)
+
+
+STEP_REFERENCE_PATTERN = re.compile(r"#\d+")
+# Tokens of the DATA section: strings and comments are skipped, entities start with #id= and end with ;
+STEP_TOKEN_PATTERN = re.compile(rb"'[^']*'|/\*.*?\*/|#(\d+)\s*(=)?\s*([A-Za-z0-9_]*)|;", re.DOTALL)
+
+
+class StepIndex(Mapping):
+    """
+    Compact index of the entities of a STEP file, behaving as a mapping of entity ids to StepFunction.
+
+    The file is tokenized in a single pass, recording only the byte offsets, the type name and the #id references of
+    each entity. Arguments are parsed the first time an entity is accessed.
+
+    :param buffer: The content of the STEP file, as bytes or as a memory map of the file.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.ids = array('q')
+        self.names = []
+        # Start and end offsets in the buffer of each entity
+        self.spans = array('q')
+        # Referenced ids of all the entities, and offsets of the references of each entity in this array
+        self._references = (array('q'), array('q', [0]))
+        self._functions = {}
+
+        self._index_entities()
+        # Sorted ids and their positions. Entities are usually sorted by id in files, the order is only stored
+        # when they are not
+        ids = npy.frombuffer(self.ids, dtype=npy.int64) if self.ids else npy.zeros(0, dtype=npy.int64)
+        if npy.all(ids[1:] > ids[:-1]):
+            self._lookup = (self.ids, None)
+        else:
+            order = npy.argsort(ids, kind='stable')
+            self._lookup = (array('q', ids[order].tobytes()), array('q', order.astype(npy.int64).tobytes()))
+
+        # Complex entities names are made of their subfunctions names
+        for position, name in enumerate(self.names):
+            if not name:
+                self.names[position] = self._parse(position).name
+
+    @classmethod
+    def from_lines(cls, lines: List[str]):
+        """
+        Indexes the lines of a STEP file.
+        """
+        return cls(''.join(lines).encode("ISO-8859-1"))
+
+    def _index_entities(self):
+        data_start = self.buffer.find(b'DATA;')
+        references, references_offsets = self._references
+        names = {}
+        in_entity = False
+        for match in STEP_TOKEN_PATTERN.finditer(self.buffer, 0 if data_start == -1 else data_start + 5):
+            reference = match.group(1)
+            if reference is None:
+                if in_entity and match.group() == b';':
+                    self.spans.append(match.end())
+                    references_offsets.append(len(references))
+                    in_entity = False
+            elif match.group(2):
+                name = match.group(3).decode()
+                self.ids.append(int(reference))
+                self.spans.append(match.start())
+                self.names.append(names.setdefault(name, name))
+                in_entity = True
+            elif in_entity:
+                references.append(int(reference))
+        if in_entity:
+            # Unterminated last entity
+            self.ids.pop()
+            self.spans.pop()
+            self.names.pop()
+            del references[references_offsets[-1]:]
+
+    def _position(self, function_id):
+        sorted_ids, order = self._lookup
+        index = bisect_left(sorted_ids, function_id)
+        if index == len(sorted_ids) or sorted_ids[index] != function_id:
+            raise KeyError(function_id)
+        if order is None:
+            return index
+        return order[index]
+
+    def _parse(self, position):
+        line = self.buffer[self.spans[2 * position]:self.spans[2 * position + 1]].decode("ISO-8859-1")
+        line = line.replace(" ", "").replace("\n", "").replace("\r", "")
+        function = step_function_from_line(line)
+        self._functions[function.id] = function
+        return function
+
+    def __getitem__(self, function_id):
+        if function_id in self._functions:
+            return self._functions[function_id]
+        return self._parse(self._position(function_id))
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, function_id):
+        try:
+            self._position(function_id)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def name(self, function_id):
+        """
+        Gives the type name of an entity without parsing its arguments.
+        """
+        return self.names[self._position(function_id)]
+
+    def function_names(self):
+        """
+        Iterates over the ids and the type names of the entities.
+        """
+        return zip(self.ids, self.names)
+
+    def function_references(self, function_id):
+        """
+        Gives the ids of the entities referenced by an entity, without parsing its arguments.
+        """
+        position = self._position(function_id)
+        references, references_offsets = self._references
+        return references[references_offsets[position]:references_offsets[position + 1]].tolist()
+
+    def connections(self):
+        """
+        List of the (entity id, referenced entity id) of the file.
+        """
+        references, references_offsets = self._references
+        connections = []
+        for position, function_id in enumerate(self.ids):
+            connections.extend((function_id, reference) for reference in
+                               references[references_offsets[position]:references_offsets[position + 1]])
+        return connections
+
+
+class InstantiationProfile:
+    """
+    Number and cumulated time of instantiations by step entity type.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.times = {}
+
+    def add(self, function_name: str, duration: float):
+        """
+        Records an instantiation of an entity type.
+        """
+        self.counts[function_name] = self.counts.get(function_name, 0) + 1
+        self.times[function_name] = self.times.get(function_name, 0.) + duration
+
+    def merge(self, other_profile: 'InstantiationProfile'):
+        """
+        Adds the instantiations recorded by another profile, such as the one of a worker process.
+        """
+        for function_name, count in other_profile.counts.items():
+            self.counts[function_name] = self.counts.get(function_name, 0) + count
+            self.times[function_name] = self.times.get(function_name, 0.) + other_profile.times[function_name]
+
+    @property
+    def total_time(self):
+        return sum(self.times.values())
+
+    def to_dict(self):
+        return {function_name: {'count': count, 'time': self.times[function_name]}
+                for function_name, count in self.counts.items()}
+
+    def __str__(self):
+        lines = ['']
+        for function_name in sorted(self.times, key=self.times.get, reverse=True):
+            lines.append(f'| {function_name} : {self.counts[function_name]} in {self.times[function_name]:.4f}s')
+        lines.append(f'| total : {sum(self.counts.values())} in {self.total_time:.4f}s')
+        lines.append('')
+        return '\n'.join(lines)
+
+
 class StepFunction(dc.DessiaObject):
     """
     Abstract class defining a step function.
@@ -527,126 +792,131 @@ class StepFunction(dc.DessiaObject):
         self.arg = arguments
 
 
+def parse_step_arguments(arguments):
+    """
+    Converts inplace the references of step function arguments to ids.
+    """
+    for i, arg in enumerate(arguments):
+        if isinstance(arg, str) and arg[0] == '#':
+            arguments[i] = int(arg[1:])
+        elif isinstance(arg, str) and arg[0:2] == '(#':
+            argument = []
+            arg_id = ""
+            for char in arg[1:-1]:
+                if char == ',':
+                    argument.append(arg_id)
+                    arg_id = ""
+                    continue
+
+                arg_id += char
+            argument.append(arg_id)
+            arguments[i] = argument
+
+
+def instantiate_step_function(name, arguments, object_dict):
+    """
+    Gives the volmdlr object related to the step function.
+    """
+    parse_step_arguments(arguments)
+
+    fun_name = name.replace(', ', '_')
+    fun_name = fun_name.lower()
+    if hasattr(volmdlr.step, fun_name):
+        volmdlr_object = getattr(volmdlr.step, fun_name)(arguments, object_dict)
+
+    elif name in STEP_TO_VOLMDLR and hasattr(STEP_TO_VOLMDLR[name], "from_step"):
+        volmdlr_object = STEP_TO_VOLMDLR[name].from_step(arguments, object_dict)
+
+    else:
+        raise NotImplementedError(
+            'Dont know how to interpret {} with args {}'.format(name,
+                                                                arguments))
+    return volmdlr_object
+
+
+def is_step_function_instantiable(name):
+    """
+    Whether instantiate_step_function knows how to interpret a step function.
+    """
+    return hasattr(volmdlr.step, name.replace(', ', '_').lower()) or \
+        (name in STEP_TO_VOLMDLR and hasattr(STEP_TO_VOLMDLR[name], "from_step"))
+
+
+def instantiate_step_functions(functions, unit_conversion_factor):
+    """
+    Instantiates step functions given in dependency order, children first.
+
+    Used to instantiate a shell and its dependencies in a worker process.
+
+    :param functions: list of (function id, function name, function arguments).
+    :param unit_conversion_factor: The unit conversion factor of the step file.
+    :return: The object of the last function and the InstantiationProfile of the instantiations.
+    """
+    object_dict = {}
+    profile = InstantiationProfile()
+    for function_id, function_name, function_arguments in functions:
+        start = time.perf_counter()
+        object_dict[function_id] = instantiate_step_function(function_name,
+                                                             function_arguments + [unit_conversion_factor],
+                                                             object_dict)
+        profile.add(function_name, time.perf_counter() - start)
+    return object_dict[functions[-1][0]], profile
+
+
 class Step(dc.DessiaObject):
     """
     Defines the Step class.
 
     """
 
-    def __init__(self, lines: List[str], name: str = ''):
+    def __init__(self, lines: List[str] = None, name: str = '', index: StepIndex = None):
         self.lines = lines
-        self.functions, self.all_connections = self.read_lines()
-        self._utd_graph = False
+        if index is None:
+            index = StepIndex.from_lines(lines)
+        self.functions = index
+        self._all_connections = None
         self._graph = None
         self.global_uncertainty = 1e-6
         self.unit_conversion_factor = 1
+        self.instantiation_profile = None
         dc.DessiaObject.__init__(self, name=name)
 
     @property
     def graph(self):
-        if not self._utd_graph:
+        if self._graph is None:
             self._graph = self.create_graph()
-            self._utd_graph = True
         return self._graph
 
+    @property
+    def all_connections(self):
+        if self._all_connections is None:
+            self._all_connections = self.functions.connections()
+        return self._all_connections
+
     @classmethod
     def from_stream(cls, stream: BinaryFile = None):
         stream.seek(0)
-        lines = []
-        for line in stream:
-            line = line.decode("ISO-8859-1")
-            line = line.replace("\r", "")
-            lines.append(line)
-        return cls(lines)
+        return cls(index=StepIndex(stream.read()))
 
     @classmethod
     def from_file(cls, filepath: str = None):
-        with open(filepath, "r", encoding="ISO-8859-1") as file:
-            lines = []
-            for line in file:
-                lines.append(line)
-        return cls(lines)
+        with open(filepath, "rb") as file:
+            try:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be memory mapped
+                buffer = b''
+        return cls(index=StepIndex(buffer))
 
     def read_lines(self):
-        all_connections = []
-
-        previous_line = ""
-        functions = {}
-
-        for line in self.lines:
-            line = line.replace(" ", "")
-            line = line.replace("\n", "")
-
-            # SKIP EMPTY LINE
-            if not line:
-                continue
-
-            # ASSEMBLE LINES IF THEY ARE SEPARATED
-            if line[-1] != ';':
-                previous_line = previous_line + line
-                continue
-
-            line = previous_line + line
-
-            # SKIP HEADER
-            if line[0] != "#":
-                previous_line = str()
-                continue
-
-            function = line.split("=")
-            function_id = int(function[0][1:])
-            function_name_arg = function[1].split("(", 1)
-            function_name = function_name_arg[0]
-            function_arg = function_name_arg[1].split("#")
-            function_connections = []
-            # print(function_id, function_name)
-            for connec in function_arg[1:]:
-                connec = connec.split(",")
-                connec = connec[0].split(")")
-                if connec[0][-1] != "'":
-                    function_connection = int(connec[0])
-                    function_connections.append(
-                        (function_id, function_connection))
-            # print(function_connections)
-
-            all_connections.extend(function_connections)
-
-            previous_line = str()
-
-            # FUNCTION ARGUMENTS
-            function_arg = function_name_arg[1]
-            arguments = step_split_arguments(function_arg)
-            new_name = ''
-            new_arguments = []
-            if function_name == "":
-                name_arg = self.step_subfunctions(arguments)
-                for name, arg in name_arg:
-                    new_name += name + ', '
-                    new_arguments.extend(arg)
-                new_name = new_name[:-2]
-                function_name = new_name
-                arguments = new_arguments
-                for arg in arguments:
-                    if arg[0] == '#':
-                        function_connections.append(
-                            (function_id, int(arg[1:])))
-            # print('=', function_connections)
-
-            for i, argument in enumerate(arguments):
-                if argument[:2] == '(#' and argument[-1] == ')':
-                    arg_list = set_to_list(argument)
-                    arguments[i] = arg_list
-
-            function = StepFunction(function_id, function_name, arguments)
-            functions[function_id] = function
-
-        return functions, all_connections
+        functions = StepIndex.from_lines(self.lines)
+        return functions, functions.connections()
 
     def not_implemented(self):
         not_implemented = []
-        for _, fun in self.functions.items():
-            if fun.name not in STEP_TO_VOLMDLR:
-                not_implemented.append(fun.name)
+        for _, function_name in self.functions.function_names():
+            if function_name not in STEP_TO_VOLMDLR:
+                not_implemented.append(function_name)
         return list(set(not_implemented))
 
     def create_graph(self):
@@ -658,9 +928,10 @@ class Step(dc.DessiaObject):
         F = nx.DiGraph()
         labels = {}
 
-        for function in self.functions.values():
-            if function.name == 'SHAPE_REPRESENTATION_RELATIONSHIP':
+        for function_id, function_name in self.functions.function_names():
+            if function_name == 'SHAPE_REPRESENTATION_RELATIONSHIP':
                 # Create short cut from id1 to id2
+                function = self.functions[function_id]
                 id1 = int(function.arg[2][1:])
                 id2 = int(function.arg[3][1:])
                 elem1 = (function.id, id1)
@@ -671,26 +942,20 @@ class Step(dc.DessiaObject):
 
                 self.functions[id1].arg.append('#{}'.format(id2))
 
-            elif function.name in STEP_TO_VOLMDLR:
-                G.add_node(function.id,
+            elif function_name in STEP_TO_VOLMDLR:
+                G.add_node(function_id,
                            color='rgb(0, 0, 0)',
                            shape='.',
-                           name=str(function.id))
-                F.add_node(function.id,
+                           name=str(function_id))
+                F.add_node(function_id,
                            color='rgb(0, 0, 0)',
                            shape='.',
-                           name=str(function.id))
-                labels[function.id] = str(function.id) + ' ' + function.name
+                           name=str(function_id))
+                labels[function_id] = str(function_id) + ' ' + function_name
 
         # Delete connection if node not found
-        node_list = list(F.nodes())
-        delete_connection = []
-        for connection in self.all_connections:
-            if connection[0] not in node_list \
-                    or connection[1] not in node_list:
-                delete_connection.append(connection)
-        for delete in delete_connection:
-            self.all_connections.remove(delete)
+        self._all_connections = [connection for connection in self.all_connections
+                                 if F.has_node(connection[0]) and F.has_node(connection[1])]
 
         # Create graph connections
         G.add_edges_from(self.all_connections)
@@ -765,12 +1030,12 @@ class Step(dc.DessiaObject):
             new_graph = graph.copy()
 
         labels = {}
-        for id_nb, function in self.functions.items():
+        for id_nb, function_name in self.functions.function_names():
             if id_nb in new_graph.nodes and not reduced:
-                labels[id_nb] = str(id_nb) + ' ' + function.name
+                labels[id_nb] = str(id_nb) + ' ' + function_name
             elif id_nb in new_graph.nodes and reduced:
-                if function.name not in delete:
-                    labels[id_nb] = str(id_nb) + ' ' + function.name
+                if function_name not in delete:
+                    labels[id_nb] = str(id_nb) + ' ' + function_name
                 else:
                     new_graph.remove_node(id_nb)
         pos = nx.kamada_kawai_layout(new_graph)
@@ -780,81 +1045,128 @@ class Step(dc.DessiaObject):
         nx.draw_networkx_labels(new_graph, pos, labels)
 
     def step_subfunctions(self, subfunctions):
-        subfunctions = subfunctions[0]
-        parenthesis_count = 0
-        subfunction_names = []
-        subfunction_args = []
-        subfunction_name = ""
-        subfunction_arg = ""
-        for char in subfunctions:
-
-            if char == "(":
-                parenthesis_count += 1
-                if parenthesis_count == 1:
-                    subfunction_names.append(subfunction_name)
-                    subfunction_name = ""
-                else:
-                    subfunction_arg += char
-
-            elif char == ")":
-                parenthesis_count -= 1
-                if parenthesis_count == 0:
-                    subfunction_args.append(subfunction_arg)
-                    subfunction_arg = ""
-                else:
-                    subfunction_arg += char
-
-            elif parenthesis_count == 0:
-                subfunction_name += char
-
-            else:
-                subfunction_arg += char
-        return [
-            (subfunction_names[i], step_split_arguments(subfunction_args[i]))
-            for i in range(len(subfunction_names))]
+        return step_subfunctions(subfunctions)
 
     def parse_arguments(self, arguments):
-        for i, arg in enumerate(arguments):
-            if isinstance(arg, str) and arg[0] == '#':
-                arguments[i] = int(arg[1:])
-            elif isinstance(arg, str) and arg[0:2] == '(#':
-                argument = []
-                arg_id = ""
-                for char in arg[1:-1]:
-                    if char == ',':
-                        argument.append(arg_id)
-                        arg_id = ""
-                        continue
-
-                    arg_id += char
-                argument.append(arg_id)
-                arguments[i] = argument
+        parse_step_arguments(arguments)
 
     def instanciate(self, name, arguments, object_dict):
         """
         Gives the volmdlr object related to the step function.
         """
-        self.parse_arguments(arguments)
+        return instantiate_step_function(name, arguments, object_dict)
+
+    def node_references(self, node):
+        """
+        Gives the instantiable entities referenced by a node, including the ones absent of the graph.
 
-        fun_name = name.replace(', ', '_')
-        fun_name = fun_name.lower()
-        if hasattr(volmdlr.step, fun_name):
-            volmdlr_object = getattr(volmdlr.step, fun_name)(arguments, object_dict)
+        The references are the ones of the step file, and the ones added to the arguments when creating the graph.
+        """
+        references = set(self.functions.function_references(node))
+        references.update(int(argument[1:]) for argument in self.functions[node].arg
+                          if isinstance(argument, str) and STEP_REFERENCE_PATTERN.fullmatch(argument))
+        return [reference for reference in references
+                if reference in self.functions and is_step_function_instantiable(self.functions[reference].name)]
 
-        elif name in STEP_TO_VOLMDLR and hasattr(STEP_TO_VOLMDLR[name], "from_step"):
-            volmdlr_object = STEP_TO_VOLMDLR[name].from_step(arguments, object_dict)
+    def instantiate_node(self, node, object_dict):
+        """
+        Instantiates a node of the graph in object_dict, if not already done.
 
-        else:
-            raise NotImplementedError(
-                'Dont know how to interpret {} with args {}'.format(name,
-                                                                    arguments))
-        return volmdlr_object
+        The entities it references that are not instantiated yet, such as the ones absent of the graph, are
+        instantiated first, in post-order.
+        """
+        in_progress = set()
+        nodes = [node]
+        while nodes:
+            node = nodes[-1]
+            if node in object_dict:
+                nodes.pop()
+                continue
+            if node not in in_progress:
+                in_progress.add(node)
+                nodes.extend(reference for reference in self.node_references(node)
+                             if reference not in object_dict and reference not in in_progress)
+                continue
+            function = self.functions[node]
+            start = time.perf_counter()
+            object_dict[node] = self.instanciate(function.name, function.arg[:] + [self.unit_conversion_factor],
+                                                 object_dict)
+            self.instantiation_profile.add(function.name, time.perf_counter() - start)
+            nodes.pop()
+
+    def shell_dependencies(self, shell_node):
+        """
+        Gives the step functions needed to instantiate a shell, each function coming after its dependencies.
 
-    def to_volume_model(self, show_times: bool = False):
+        :return: list of (function id, function name, function arguments).
         """
-        show_times=True displays the number of times a given class has been
-        instantiated and the total time of all the instantiations of this
-        given class.
+        closure = nx.descendants(self.graph, shell_node)
+        closure.add(shell_node)
+        return [(node, self.functions[node].name, self.functions[node].arg[:])
+                for node in reversed(list(nx.topological_sort(self.graph.subgraph(closure))))]
+
+    def instantiate_shells_in_parallel(self, shell_nodes, workers: int):
+        """
+        Instantiates shells in a process pool, each shell being an independent subgraph of the step graph.
+
+        Shells that can't be instantiated from their own subgraph are skipped, to be instantiated sequentially. A
+        worker failing for another reason is warned about, its shell being also instantiated sequentially.
+        The instantiations done in the workers are added to the instantiation_profile.
+
+        :return: A dictionary of the instantiated shells by node.
+        """
+        shells = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for node in shell_nodes:
+                try:
+                    dependencies = self.shell_dependencies(node)
+                except nx.NetworkXUnfeasible:
+                    continue
+                futures[node] = executor.submit(instantiate_step_functions, dependencies,
+                                                self.unit_conversion_factor)
+            for node, future in futures.items():
+                try:
+                    shells[node], profile = future.result()
+                except (KeyError, NotImplementedError):
+                    # Entity outside of the shell subgraph, or not supported
+                    continue
+                except Exception as error:  # pylint: disable=broad-except
+                    warnings.warn(f'Parallel instantiation of shell {node} failed, it is instantiated '
+                                  f'sequentially: {error!r}', RuntimeWarning)
+                    continue
+                self.instantiation_profile.merge(profile)
+        return shells
+
+    def postorder_nodes(self, source, object_dict):
+        """
+        Post-order traversal of the graph from source, each node coming after all the nodes it references.
+
+        Nodes already in object_dict are neither yielded nor traversed: the entities they reference, such as the
+        faces of a shell instantiated in a worker, are not instantiated again unless another node references them.
+        """
+        visited = {source}
+        stack = [(source, iter(self.graph.successors(source)))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited and child not in object_dict:
+                    visited.add(child)
+                    stack.append((child, iter(self.graph.successors(child))))
+                    break
+            else:
+                stack.pop()
+                yield node
+
+    def to_volume_model(self, show_times: bool = False, workers: int = None):
+        """
+        Instantiates the step entities, each one after the entities it references.
+
+        The number and total time of the instantiations of each entity type are stored in the instantiation_profile
+        attribute, show_times=True displays them.
+
+        With workers > 1, the shells are instantiated in a pool of this number of processes. Times of
+        instantiations done in workers are measured in the workers.
         """
 
         object_dict = {}
@@ -869,30 +1181,31 @@ class Step(dc.DessiaObject):
         not_shell_nodes = []
         assembly_nodes = []
         for node in self.graph.nodes:
-            if node != '#0' and self.functions[node].name == 'REPRESENTATION_RELATIONSHIP, REPRESENTATION_RELATIONSHIP_WITH_TRANSFORMATION, SHAPE_REPRESENTATION_RELATIONSHIP':
+            if node == '#0':
+                continue
+            function_name = self.functions.name(node)
+            if function_name == 'REPRESENTATION_RELATIONSHIP, REPRESENTATION_RELATIONSHIP_WITH_TRANSFORMATION, SHAPE_REPRESENTATION_RELATIONSHIP':
                 frame_mapping_nodes.append(node)
-            if node != '#0' and (self.functions[node].name in ["CLOSED_SHELL", "OPEN_SHELL"]):
+            if function_name in ["CLOSED_SHELL", "OPEN_SHELL"]:
                 shell_nodes.append(node)
-            if node != '#0' and self.functions[node].name == 'REPRESENTATION_RELATIONSHIP_REPRESENTATION_RELATIONSHIP_WITH_TRANSFORMATION_SHAPE_REPRESENTATION_RELATIONSHIP':
+            if function_name == 'REPRESENTATION_RELATIONSHIP_REPRESENTATION_RELATIONSHIP_WITH_TRANSFORMATION_SHAPE_REPRESENTATION_RELATIONSHIP':
                 assembly_nodes.append(node)
-            # if node != '#0' and self.functions[node].name in [
+            # if function_name in [
             #     'UNCERTAINTY_MEASURE_WITH_UNIT', 'LENGTH_UNIT, NAMED_UNIT, SI_UNIT']:
             #     unit_measure_nodes.append(node)
-            if node != '#0' and not length_global_uncertainty_node and self.functions[node].name ==\
+            if not length_global_uncertainty_node and function_name ==\
                     'UNCERTAINTY_MEASURE_WITH_UNIT':
                 length_global_uncertainty_node = node
-            # if node != '#0' and self.functions[node].name == 'SHAPE_REPRESENTATION':
+            # if function_name == 'SHAPE_REPRESENTATION':
             #     # Really a shell node ?
             #     sr_nodes.append(node)
-            if node != '#0' and self.functions[node].name == 'BREP_WITH_VOIDS':
+            if function_name == 'BREP_WITH_VOIDS':
                 shell_nodes.append(node)
                 not_shell_nodes.append(int(self.functions[node].arg[1][1:]))
-        frame_mapped_shell_node = []
-        for s_node in shell_nodes:
-            for fm_node in frame_mapping_nodes:
-                if nx.has_path(self.graph, source=fm_node, target=s_node):
-                    frame_mapped_shell_node.append(s_node)
-                    break
+        frame_mapped_nodes = set()
+        for fm_node in frame_mapping_nodes:
+            frame_mapped_nodes.update(nx.descendants(self.graph, fm_node))
+        frame_mapped_shell_node = [s_node for s_node in shell_nodes if s_node in frame_mapped_nodes]
         shell_nodes_copy = shell_nodes.copy()
         remove_nodes = list(set(frame_mapped_shell_node + not_shell_nodes))
         for node in remove_nodes:
@@ -903,53 +1216,26 @@ class Step(dc.DessiaObject):
 
         # self.draw_graph(self.graph, reduced=True)
 
-        nodes = []
-        i = 1
-        new_nodes = True
-        while new_nodes:
-            new_nodes = list(nx.descendants_at_distance(self.graph, '#0', i))[::-1]
-            nodes.extend(new_nodes)
-            i += 1
+        self.instantiation_profile = InstantiationProfile()
+        if length_global_uncertainty_node is not None:
+            for node in nx.dfs_postorder_nodes(self.graph, length_global_uncertainty_node):
+                self.instantiate_node(node, object_dict)
+            self.global_uncertainty = object_dict[length_global_uncertainty_node]
+            self.unit_conversion_factor = object_dict[
+                int(self.functions[length_global_uncertainty_node].arg[1][1:])]
 
-        # nodes = dessia_common.graph.explore_tree_from_leaves(self.graph)
+        if workers is not None and workers > 1:
+            object_dict.update(self.instantiate_shells_in_parallel(
+                [shell_node for shell_node in shell_nodes_copy
+                 if self.functions.name(shell_node) in ["CLOSED_SHELL", "OPEN_SHELL"]], workers))
 
-        times = {}
-        for i, node in enumerate([length_global_uncertainty_node] + nodes[::-1]):
-            # instanciate_ids = [edge[1]]
-            if node is None:
-                continue
-            instanciate_ids = [node]
-            error = True
-            while error:
-                try:
-                    for instanciate_id in instanciate_ids[::-1]:
-                        t = time.time()
-                        arguments = self.functions[instanciate_id].arg[:]
-                        volmdlr_object = self.instanciate(
-                            self.functions[instanciate_id].name,
-                            self.functions[instanciate_id].arg[:] + [self.unit_conversion_factor], object_dict)
-                        t = time.time() - t
-                        object_dict[instanciate_id] = volmdlr_object
-                        if show_times:
-                            if volmdlr_object.__class__ not in times:
-                                times[volmdlr_object.__class__] = [1, t]
-                            else:
-                                times[volmdlr_object.__class__][0] += 1
-                                times[volmdlr_object.__class__][1] += t
-                    error = False
-                except KeyError as key:
-                    # Sometimes the bfs search don't instantiate the nodes of a
-                    # depth in the right order, leading to error
-                    instanciate_ids.append(key.args[0])
-            if i == 0:
-                self.global_uncertainty = volmdlr_object
-                self.unit_conversion_factor = object_dict[int(arguments[1][1:])]
+        # Post-order: each node comes after all the nodes it references
+        for node in self.postorder_nodes('#0', object_dict):
+            if node != '#0':
+                self.instantiate_node(node, object_dict)
 
         if show_times:
-            print()
-            for key, value in times.items():
-                print(f'| {key} : {value}')
-            print()
+            print(self.instantiation_profile)
 
         shells = []
         if frame_mapping_nodes:
@@ -969,11 +1255,11 @@ class Step(dc.DessiaObject):
     def to_points(self):
         object_dict = {}
         points3d = []
-        for stepfunction in self.functions.values():
-            if stepfunction.name == 'CARTESIAN_POINT':
+        for function_id, function_name in self.functions.function_names():
+            if function_name == 'CARTESIAN_POINT':
                 # INSTANTIATION
-                name = self.functions[stepfunction.id].name
-                arguments = self.functions[stepfunction.id].arg[:]
+                name = function_name
+                arguments = self.functions[function_id].arg[:]
                 self.parse_arguments(arguments)
                 # for i, arg in enumerate(arguments):
                 #     if type(arg) == str and arg[0] == '#':
@@ -990,12 +1276,141 @@ class Step(dc.DessiaObject):
     def plot_data(self):
         graph = self.graph.copy()
 
-        graph.remove_nodes_from([stepfunction.id for stepfunction
-                                 in self.functions.values()
-                                 if stepfunction.name in ['CARTESIAN_POINT', 'DIRECTION']])
+        graph.remove_nodes_from([function_id for function_id, function_name
+                                 in self.functions.function_names()
+                                 if function_name in ['CARTESIAN_POINT', 'DIRECTION']])
         return [plot_data.graph.NetworkxGraph(graph=graph)]
 
 
+class StepCache:
+    """
+    Persistent on-disk cache of the volume models read from step files.
+
+    Volume models are stored as compressed pickles, keyed by the hash of the file content and of the volmdlr version.
+    When the size of the cache exceeds max_size, the least recently used models are removed.
+    As loading a pickle can execute code, the cache directory is created private to the current user, and a
+    PermissionError is raised if it is owned by another user or writable by other users.
+
+    :param directory: The directory where the models are stored. Defaults to volmdlr/step in the user cache
+        directory ($XDG_CACHE_HOME or ~/.cache).
+    :param max_size: Maximal size of the cache in bytes.
+    """
+    _extension = '.vmcache'
+
+    def __init__(self, directory: str = None, max_size: int = 2 * 1024 ** 3):
+        if directory is None:
+            cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            directory = os.path.join(cache_home, 'volmdlr', 'step')
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.check_directory(directory)
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def check_directory(directory: str):
+        """
+        Checks that a cache directory is owned by the current user and not writable by other users.
+        """
+        if not hasattr(os, 'getuid'):
+            # No POSIX ownership on this platform
+            return
+        directory_stat = os.stat(directory)
+        if directory_stat.st_uid != os.getuid():
+            raise PermissionError(f'Step cache directory {directory} is not owned by the current user')
+        if directory_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(f'Step cache directory {directory} is writable by other users')
+
+    @staticmethod
+    def file_hash(filepath: str):
+        """
+        Hash of the content of a file, and of the version of volmdlr that reads it.
+        """
+        file_hash = hashlib.sha256(volmdlr.__version__.encode())
+        with open(filepath, 'rb') as file:
+            for chunk in iter(lambda: file.read(2 ** 20), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def _path(self, key: str):
+        return os.path.join(self.directory, key + self._extension)
+
+    def _entries(self):
+        return [os.path.join(self.directory, filename) for filename in os.listdir(self.directory)
+                if filename.endswith(self._extension)]
+
+    @property
+    def size(self):
+        """
+        Size of the cache in bytes.
+        """
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def load(self, key: str):
+        """
+        Gets a volume model from the cache. Returns None if the key is not in the cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                volume_model = pickle.loads(zlib.decompress(file.read()))
+        except (FileNotFoundError, zlib.error, pickle.UnpicklingError, EOFError):
+            return None
+        # Access time is tracked in the modification time, as atime updates are often disabled
+        os.utime(path)
+        return volume_model
+
+    def save(self, key: str, volume_model: volmdlr.core.VolumeModel):
+        """
+        Stores a volume model in the cache, then evicts the least recently used models if needed.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(zlib.compress(pickle.dumps(volume_model, protocol=pickle.HIGHEST_PROTOCOL)))
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used models until the cache size is under max_size.
+        """
+        entries = sorted(((os.path.getmtime(path), os.path.getsize(path), path) for path in self._entries()),
+                         reverse=True)
+        size = 0
+        for _, entry_size, path in entries:
+            size += entry_size
+            if size > self.max_size:
+                os.remove(path)
+
+    def clear(self):
+        """
+        Removes all the models of the cache.
+        """
+        for path in self._entries():
+            os.remove(path)
+
+    def volume_model_from_file(self, filepath: str, **kwargs):
+        """
+        Reads the volume model of a step file, using the cache if the file has already been read.
+
+        :param kwargs: Arguments given to Step.to_volume_model on cache misses.
+        """
+        key = self.file_hash(filepath)
+        volume_model = self.load(key)
+        if volume_model is not None:
+            self.hits += 1
+            return volume_model
+        self.misses += 1
+        volume_model = Step.from_file(filepath).to_volume_model(**kwargs)
+        self.save(key, volume_model)
+        return volume_model
+
+
 STEP_TO_VOLMDLR = {
     # GEOMETRICAL ENTITIES
     'CARTESIAN_POINT': volmdlr.Point3D,
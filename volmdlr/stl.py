@@ -10,8 +10,8 @@ import struct
 import warnings
 from typing import List
 
+import numpy as npy
 from binaryornot.check import is_binary
-from kaitaistruct import KaitaiStream
 
 import dessia_common.core as dc  # isort: skip
 from dessia_common.files import BinaryFile, StringFile  # isort: skip
@@ -20,6 +20,27 @@ import volmdlr as vm
 import volmdlr.core as vmc
 import volmdlr.faces as vmf
 
+# Binary STL facet: normal, 3 vertices, attribute byte count (50 bytes, little endian)
+BINARY_FACET_DTYPE = npy.dtype([('normal', '<f4', (3,)),
+                                ('points', '<f4', (3, 3)),
+                                ('attribute', '<u2')])
+BINARY_HEADER_SIZE = 84
+
+
+def _weld_facets_points(points, remove_degenerated: bool = True):
+    """
+    Converts a (m, 3, 3) array of facets points into vertices and faces arrays.
+
+    Identical vertices are merged and, if asked, degenerated facets (of null area) are dropped.
+    """
+    if remove_degenerated:
+        cross = npy.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0])
+        points = points[npy.einsum('ij,ij->i', cross, cross) > 0.]
+    if not points.shape[0]:
+        return npy.zeros((0, 3), dtype=npy.float64), npy.zeros((0, 3), dtype=npy.int32)
+    vertices, inverse = npy.unique(points.reshape(-1, 3), axis=0, return_inverse=True)
+    return vertices, inverse.reshape(-1, 3).astype(npy.int32)
+
 
 class Stl(dc.DessiaObject):
     """
@@ -43,86 +64,116 @@ class Stl(dc.DessiaObject):
     _dessia_methods = ['from_text_stream', 'from_text_stream', 'to_closed_shell', 'to_open_shell']
 
     def __init__(self, triangles: List[vmf.Triangle3D], name: str = ''):
-        self.triangles = triangles
+        self._triangles = triangles
+        self._vertices = None
+        self._faces = None
         dc.DessiaObject.__init__(self, name=name)
 
         self.normals = None
 
-    @classmethod
-    def points_from_file(cls, filename: str, distance_multiplier=0.001):
-        if is_binary(filename):
-            with open(filename, 'rb') as file:
-                stream = KaitaiStream(file)
-                _ = stream.read_bytes(80).decode('utf8')
-                num_triangles = stream.read_u4le()
-
-                all_points = []
-                for i in range(num_triangles):
-                    if i % 5000 == 0:
-                        print('reading stl',
-                              round(i / num_triangles * 100, 2), '%')
-                    # First is normal, unused
-                    _ = vm.Vector3D(stream.read_f4le(),
-                                    stream.read_f4le(),
-                                    stream.read_f4le())
-                    p1 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le())
-                    p2 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le())
-                    p3 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le(),
-                                    distance_multiplier * stream.read_f4le())
-                    all_points.extend([p1, p2, p3])
-
-                    stream.read_u2le()
-        return all_points
+    @property
+    def triangles(self):
+        """
+        Triangles of the STL. For array-backed STL, they are only built on first access.
+        """
+        if self._triangles is None:
+            points = [vm.Point3D(*point) for point in self._vertices.tolist()]
+            self._triangles = [vmf.Triangle3D(points[i1], points[i2], points[i3])
+                               for i1, i2, i3 in self._faces.tolist()]
+        return self._triangles
+
+    @triangles.setter
+    def triangles(self, triangles):
+        self._triangles = triangles
+        self._vertices = None
+        self._faces = None
+
+    @property
+    def vertices(self):
+        """
+        Vertices of the STL as a (n, 3) float64 array.
+        """
+        return self.mesh_data()[0]
+
+    @property
+    def faces(self):
+        """
+        Faces of the STL as a (m, 3) int32 array of indices in vertices.
+        """
+        return self.mesh_data()[1]
+
+    def mesh_data(self):
+        """
+        Gets the vertices & faces arrays of the STL at once.
+
+        For a triangles-backed STL, the triangles are welded in a single pass: use it rather than the vertices and
+        faces properties when both are needed.
+
+        :return: The (n, 3) float64 array of the vertices and the (m, 3) int32 array of the faces.
+        """
+        if self._vertices is not None:
+            return self._vertices, self._faces
+        points = npy.array([[[*triangle.point1], [*triangle.point2], [*triangle.point3]]
+                            for triangle in self._triangles], dtype=npy.float64).reshape(-1, 3, 3)
+        return _weld_facets_points(points, remove_degenerated=False)
 
     @classmethod
-    def from_binary_stream(cls, stream: BinaryFile, distance_multiplier: float = 0.001):
-        stream.seek(0)
+    def from_arrays(cls, vertices, faces, name: str = ''):
+        """
+        Defines an array-backed STL. Triangle3D are not built until triangles attribute is accessed.
+
+        :param vertices: (n, 3) array of vertices coordinates
+        :param faces: (m, 3) array of vertices indices of each triangle
+        """
+        stl = cls(None, name=name)
+        stl._vertices = npy.asarray(vertices, dtype=npy.float64)
+        stl._faces = npy.asarray(faces, dtype=npy.int32)
+        return stl
+
+    @staticmethod
+    def _read_binary_facets(stream, memory_map: bool = False):
+        """
+        Reads all the facets of a binary stream in a single structured array.
 
-        stream = KaitaiStream(stream)
-        name_slice = stream.read_bytes(80)
+        :returns: the name in the header and the facets structured array
+        """
+        stream.seek(0)
+        name_slice = stream.read(80)
         try:
             name = name_slice.decode('utf-8')
         except UnicodeDecodeError:
             name = name_slice.decode('latin-1')
+        num_triangles = struct.unpack('<I', stream.read(4))[0]
+
+        if memory_map:
+            size = stream.seek(0, 2)
+            num_triangles = min(num_triangles, (size - BINARY_HEADER_SIZE) // BINARY_FACET_DTYPE.itemsize)
+            facets = npy.memmap(stream, dtype=BINARY_FACET_DTYPE, mode='r',
+                                offset=BINARY_HEADER_SIZE, shape=(num_triangles,))
+        else:
+            buffer = stream.read()
+            num_triangles = min(num_triangles, len(buffer) // BINARY_FACET_DTYPE.itemsize)
+            facets = npy.frombuffer(buffer, dtype=BINARY_FACET_DTYPE, count=num_triangles)
+        return name, facets
 
-        num_triangles = stream.read_u4le()
-        # print(num_triangles)
+    @classmethod
+    def points_from_file(cls, filename: str, distance_multiplier=0.001):
+        if is_binary(filename):
+            with open(filename, 'rb') as file:
+                _, facets = cls._read_binary_facets(file, memory_map=True)
+                points = distance_multiplier * facets['points'].astype(npy.float64).reshape(-1, 3)
+            return [vm.Point3D(*point) for point in points.tolist()]
+        return []
 
-        triangles = [None] * num_triangles
-        invalid_triangles = []
-        for i in range(num_triangles):
-            if i % 5000 == 0:
-                print('reading stl',
-                      round(i / num_triangles * 100, 2), '%')
-            _ = vm.Vector3D(stream.read_f4le(),
-                            stream.read_f4le(),
-                            stream.read_f4le())
-            p1 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le())
-            p2 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le())
-            p3 = vm.Point3D(distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le(),
-                            distance_multiplier * stream.read_f4le())
-            try:
-                triangles[i] = vmf.Triangle3D(p1, p2, p3)
-            except ZeroDivisionError:
-                invalid_triangles.append(i)
-
-            stream.read_u2le()
-            # print(abr)
-        if invalid_triangles:
-            # print('invalid_triangles number: ', len(invalid_triangles))
-            for i in invalid_triangles[::-1]:
-                del triangles[i]
-        return cls(triangles, name=name)
+    @classmethod
+    def from_binary_stream(cls, stream: BinaryFile, distance_multiplier: float = 0.001):
+        """
+        Reads a binary STL. The resulting STL is array-backed, see from_arrays.
+        """
+        name, facets = cls._read_binary_facets(stream)
+        points = distance_multiplier * facets['points'].astype(npy.float64)
+        vertices, faces = _weld_facets_points(points)
+        return cls.from_arrays(vertices, faces, name=name)
 
     @classmethod
     def from_text_stream(cls, stream: StringFile,
@@ -215,31 +266,22 @@ class Stl(dc.DessiaObject):
         stream.seek(0)
 
         BINARY_HEADER = "80sI"
-        BINARY_FACET = "12fH"
 
-        # counter = 0
+        vertices, faces = self.mesh_data()
         stream.write(struct.pack(BINARY_HEADER, self.name.encode('utf8'),
-                                 len(self.triangles)))
-        # counter += 1
-        for triangle in self.triangles:
-            data = [
-                0., 0., 0.,
-                distance_multiplier * triangle.point1.x,
-                distance_multiplier * triangle.point1.y,
-                distance_multiplier * triangle.point1.z,
-                distance_multiplier * triangle.point2.x,
-                distance_multiplier * triangle.point2.y,
-                distance_multiplier * triangle.point2.z,
-                distance_multiplier * triangle.point3.x,
-                distance_multiplier * triangle.point3.y,
-                distance_multiplier * triangle.point3.z,
-                0]
-            stream.write(struct.pack(BINARY_FACET, *data))
+                                 len(faces)))
+        facets = npy.zeros(len(faces), dtype=BINARY_FACET_DTYPE)
+        facets['points'] = distance_multiplier * vertices[faces]
+        stream.write(facets.tobytes())
 
     def to_closed_shell(self):
+        if self._triangles is None:
+            return vmf.ClosedTriangleShell3D.from_mesh_data(self._vertices, self._faces, name=self.name)
         return vmf.ClosedTriangleShell3D(self.triangles, name=self.name)
 
     def to_open_shell(self):
+        if self._triangles is None:
+            return vmf.OpenTriangleShell3D.from_mesh_data(self._vertices, self._faces, name=self.name)
         return vmf.OpenTriangleShell3D(self.triangles, name=self.name)
 
     def to_volume_model(self):
@@ -283,12 +325,7 @@ class Stl(dc.DessiaObject):
 
     @classmethod
     def from_display_mesh(cls, mesh):
-        triangles = []
-        for i1, i2, i3 in mesh.triangles:
-            triangles.append(vmf.Triangle3D(mesh.points[i1],
-                                            mesh.points[i2],
-                                            mesh.points[i3]))
-        return cls(triangles)
+        return cls.from_arrays(mesh.vertices, mesh.faces)
 
     def get_normals(self):
         """
@@ -173,20 +173,63 @@ BABYLON_UNPACKER_BODY_TEMPLATE = Template(
         showAxis(1);
 
 
+        // Binary meshes: base64 little-endian typed arrays, optionally quantized and deflate compressed
+        function decodeBase64(data){
+                var binary = atob(data);
+                var bytes = new Uint8Array(binary.length);
+                for (let i = 0; i < binary.length; i++){
+                        bytes[i] = binary.charCodeAt(i);
+                        }
+                return bytes;
+                }
+
+        async function inflate(bytes){
+                var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+                return new Uint8Array(await new Response(stream).arrayBuffer());
+                }
+
+        async function meshArrays(mesh_data){
+                if (!('binary' in mesh_data)){
+                        return [mesh_data['positions'], mesh_data['indices']];
+                        }
+                var binary_data = mesh_data['binary'];
+                var positions_bytes = decodeBase64(binary_data['positions']);
+                var indices_bytes = decodeBase64(binary_data['indices']);
+                if ('compression' in binary_data){
+                        positions_bytes = await inflate(positions_bytes);
+                        indices_bytes = await inflate(indices_bytes);
+                        }
+                var positions;
+                if ('quantization' in binary_data){
+                        var quantized = new Uint16Array(positions_bytes.buffer, 0, positions_bytes.byteLength / 2);
+                        var minimum = binary_data['quantization']['min'];
+                        var step = binary_data['quantization']['step'];
+                        positions = new Float32Array(quantized.length);
+                        for (let i = 0; i < quantized.length; i++){
+                                positions[i] = minimum[i % 3] + step[i % 3] * quantized[i];
+                                }
+                        }
+                else {positions = new Float32Array(positions_bytes.buffer, 0, positions_bytes.byteLength / 4)};
+                var indices = new Uint32Array(indices_bytes.buffer, 0, indices_bytes.byteLength / 4);
+                return [positions, indices];
+                }
+
         var meshes = [];
         for (let mesh_data of babylon_data['meshes']){
-                var mesh = new BABYLON.Mesh(mesh_data['name'], scene);
+                let mesh = new BABYLON.Mesh(mesh_data['name'], scene);
                 meshes.push(mesh);
 
-                var normals = [];
-                var vertexData = new BABYLON.VertexData();
-                BABYLON.VertexData.ComputeNormals(mesh_data['positions'], mesh_data['indices'], normals);
-
-                vertexData.positions = mesh_data['positions'];
-                vertexData.indices = mesh_data['indices'];
-                vertexData.normals = normals;
-                vertexData.applyToMesh(mesh);
-                mesh.enableEdgesRendering(0.9);
+                meshArrays(mesh_data).then(function([positions, indices]){
+                        var normals = [];
+                        var vertexData = new BABYLON.VertexData();
+                        BABYLON.VertexData.ComputeNormals(positions, indices, normals);
+
+                        vertexData.positions = positions;
+                        vertexData.indices = indices;
+                        vertexData.normals = normals;
+                        vertexData.applyToMesh(mesh);
+                        mesh.enableEdgesRendering(0.9);
+                        });
                 mesh.edgesWidth = max_length*0.025;
                 if ('edges_color' in mesh_data) {
                         mesh.edgesColor = new BABYLON.Color4(mesh_data['edges_color'][0],
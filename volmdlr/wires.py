@@ -4,6 +4,7 @@
 Module containing wires & contours.
 """
 
+import heapq
 import itertools
 import math
 import sys
@@ -16,7 +17,6 @@ from typing import List
 
 import matplotlib.patches
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as npy
 import plot_data.core as plot_data
 import scipy.integrate as scipy_integrate
@@ -29,7 +29,7 @@ import volmdlr.core
 import volmdlr.display as vmd
 import volmdlr.edges
 import volmdlr.utils.intersections as vm_utils_intersections
-from volmdlr.core_compiled import polygon_point_belongs
+from volmdlr.core_compiled import polygon_point_belongs, polygon_points_belong, polygon_self_intersections
 
 
 def argmax(list_of_float):
@@ -417,11 +417,15 @@ class EdgeCollection3D(WireMixin):
         indices = list(range(len(positions)))
         return positions, indices
 
-    def babylon_meshes(self):
-        """ Set the mesh for babylonjs. """
+    def babylon_meshes(self, binary: bool = False, quantize: bool = False, compress: bool = False):
+        """ Set the mesh for babylonjs, see Primitive3D.babylon_meshes for the binary options. """
         positions, indices = self.to_babylon()
-        babylon_mesh = {'positions': positions,
-                        'indices': indices}
+        if binary:
+            babylon_mesh = {'binary': vmd.babylon_binary_data(positions, indices,
+                                                              quantize=quantize, compress=compress)}
+        else:
+            babylon_mesh = {'positions': positions,
+                            'indices': indices}
         babylon_mesh.update(self.babylon_param())
         return [babylon_mesh]
 
@@ -1012,6 +1016,50 @@ class Wire3D(volmdlr.core.CompositePrimitive3D, WireMixin):
 
 # TODO: define an edge as an opened polygon and allow to compute area from this reference
 
+class PointsHashGrid:
+    """
+    A hash grid over points, to find the points close to another one without comparing it to all of them.
+
+    Coordinates are quantized in cells of size cell_size: the points closer than cell_size to a point are in its
+    cell or in the neighboring ones.
+
+    :param cell_size: The size of the cells, the largest distance that can be queried.
+    :type cell_size: float
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.points = []
+        self._cells = {}
+
+    def _cell(self, point):
+        return tuple(math.floor(coordinate / self.cell_size) for coordinate in point)
+
+    def add(self, point):
+        """
+        Adds a point to the grid.
+
+        :return: The index of the point in the grid.
+        :rtype: int
+        """
+        self.points.append(point)
+        self._cells.setdefault(self._cell(point), []).append(len(self.points) - 1)
+        return len(self.points) - 1
+
+    def close_points(self, point, tol: float):
+        """
+        Finds the points of the grid closer than tol to a point, tol being at most cell_size.
+
+        :return: The indices of the close points, in the order they were added.
+        :rtype: List[int]
+        """
+        cell = self._cell(point)
+        indices = []
+        for offset in itertools.product((-1, 0, 1), repeat=len(cell)):
+            indices.extend(self._cells.get(tuple(key + shift for key, shift in zip(cell, offset)), ()))
+        return sorted(index for index in indices if self.points[index].is_close(point, tol))
+
+
 class ContourMixin(WireMixin):
     """
     Abstract class for Contour, storing methods and attributes used by Contour2D and Contour3D.
@@ -1093,19 +1141,37 @@ class ContourMixin(WireMixin):
 
     @staticmethod
     def touching_edges_pairs(edges):  # TO DO: move this to edges?
+        """
+        Finds the pairs of edges such that an end of the first one is inside the second one.
+
+        Only the pairs of edges whose bounding boxes intersect are tested.
+        """
+        edges = list(edges)
+        if len(edges) < 2:
+            return []
+        bounds = []
+        for edge in edges:
+            if hasattr(edge, 'bounding_box'):
+                bbox = edge.bounding_box
+                bounds.append((bbox.xmin, bbox.ymin, bbox.zmin, bbox.xmax, bbox.ymax, bbox.zmax))
+            else:
+                rectangle = edge.bounding_rectangle
+                bounds.append((rectangle.xmin, rectangle.ymin, 0., rectangle.xmax, rectangle.ymax, 0.))
+        bounds = npy.array(bounds, dtype=float)
+        bvh = volmdlr.core.BoundingVolumeHierarchy(bounds[:, :3], bounds[:, 3:])
         touching_primitives = []
-        for i, primitive1 in enumerate(edges):
-            for j, primitive2 in enumerate(edges):
-                if j > i:
-                    if primitive2.end != primitive1.start != primitive2.start and \
-                            primitive2.end != primitive1.end != primitive2.start:
-                        if primitive1.unit_direction_vector(abscissa=0).is_colinear_to(
-                                primitive2.unit_direction_vector(abscissa=0)):
-                            continue
-                        if primitive1.point_belongs(primitive2.start) or primitive1.point_belongs(primitive2.end):
-                            touching_primitives.append([primitive2, primitive1])
-                        elif primitive2.point_belongs(primitive1.start) or primitive2.point_belongs(primitive1.end):
-                            touching_primitives.append([primitive1, primitive2])
+        for i, j in bvh.pairs(bvh, tol=1e-5):
+            if j > i:
+                primitive1, primitive2 = edges[i], edges[j]
+                if primitive2.end != primitive1.start != primitive2.start and \
+                        primitive2.end != primitive1.end != primitive2.start:
+                    if primitive1.unit_direction_vector(abscissa=0).is_colinear_to(
+                            primitive2.unit_direction_vector(abscissa=0)):
+                        continue
+                    if primitive1.point_belongs(primitive2.start) or primitive1.point_belongs(primitive2.end):
+                        touching_primitives.append([primitive2, primitive1])
+                    elif primitive2.point_belongs(primitive1.start) or primitive2.point_belongs(primitive1.end):
+                        touching_primitives.append([primitive1, primitive2])
         return touching_primitives
 
     @staticmethod
@@ -1194,15 +1260,35 @@ class ContourMixin(WireMixin):
 
     @staticmethod
     def get_edges_bifurcations(contour_primitives, edges, finished_loop):
-        graph = nx.Graph()
+        """
+        Moves back to edges the segments going from a node of degree more than 2 to a node of degree 1.
+
+        Nodes are the ends of the primitives, merged when they are equal, found with a hash grid.
+        """
+        nodes_grid = PointsHashGrid(1e-6)
+        adjacency = []
+
+        def node_index(point):
+            close_nodes = nodes_grid.close_points(point, 1e-6)
+            if close_nodes:
+                return close_nodes[0]
+            adjacency.append({})
+            return nodes_grid.add(point)
+
         for prim in contour_primitives[:]:
-            graph.add_edge(prim.start, prim.end)
-        for node in graph.nodes:
-            degree = graph.degree(node)
+            start_index = node_index(prim.start)
+            end_index = node_index(prim.end)
+            adjacency[start_index][end_index] = None
+            adjacency[end_index][start_index] = None
+        degrees = [len(neighbors) + (index in neighbors) for index, neighbors in enumerate(adjacency)]
+        for index, neighbors in enumerate(adjacency):
+            degree = degrees[index]
             if degree <= 2:
                 continue
-            for i, neihgbor in enumerate(graph.neighbors(node)):
-                if graph.degree(neihgbor) == 1:
+            node = nodes_grid.points[index]
+            for i, neighbor_index in enumerate(neighbors):
+                if degrees[neighbor_index] == 1:
+                    neihgbor = nodes_grid.points[neighbor_index]
                     i_edge = volmdlr.edges.LineSegment2D(node, neihgbor)
                     if i_edge in contour_primitives:
                         contour_primitives.remove(i_edge)
@@ -1212,6 +1298,125 @@ class ContourMixin(WireMixin):
                             break
         return contour_primitives, edges, finished_loop
 
+    @staticmethod
+    def connected_edges_groups(edges, tol):
+        """
+        Groups edges connected by their ends, with a graph walk on a hash grid of the ends.
+
+        Groups are made as the loop on find_connected_edges does: starting from the first remaining edge, the first
+        edge of the list connected to the group is added to it, until none is. An edge end closer than tol to a point
+        of the group, but not equal to it, is moved to this point. An edge equal to an edge of the group is not
+        added to it. The bifurcations of each group are then moved back to the remaining edges.
+
+        :param edges: The edges to group.
+        :param tol: The tolerance to consider edges ends connected.
+        :return: The lists of primitives of the groups.
+        """
+        radius = max(tol, 1e-6)
+        ends_grid = PointsHashGrid(radius)
+        ends_edges = []
+        remaining = {}
+        edges_indices = itertools.count()
+
+        def add_remaining(edge):
+            edge_index = next(edges_indices)
+            remaining[edge_index] = edge
+            for point in (edge.start, edge.end):
+                ends_grid.add(point)
+                ends_edges.append(edge_index)
+
+        for edge in edges:
+            add_remaining(edge)
+
+        groups = []
+        while remaining:
+            group = []
+            group_grid = PointsHashGrid(radius)
+            group_points_edges = []
+            candidates, in_candidates, excluded = [], set(), set()
+
+            def add_to_group(edge):
+                group.append(edge)
+                for point in (edge.start, edge.end):
+                    group_grid.add(point)
+                    group_points_edges.append(len(group) - 1)
+                    for end_index in ends_grid.close_points(point, radius):
+                        edge_index = ends_edges[end_index]
+                        if edge_index in remaining and edge_index not in in_candidates and \
+                                edge_index not in excluded:
+                            heapq.heappush(candidates, edge_index)
+                            in_candidates.add(edge_index)
+
+            add_to_group(remaining.pop(next(iter(remaining))))
+            while candidates:
+                edge_index = heapq.heappop(candidates)
+                in_candidates.discard(edge_index)
+                edge = remaining[edge_index]
+                close_points = sorted(set(group_grid.close_points(edge.start, radius)
+                                          + group_grid.close_points(edge.end, radius)))
+                if any(edge == group[group_points_edges[point_index]] for point_index in close_points):
+                    excluded.add(edge_index)
+                    continue
+                group_points = [group_grid.points[point_index] for point_index in close_points]
+                if not (edge.start in group_points or edge.end in group_points):
+                    for point in group_points:
+                        if point.is_close(edge.start, tol=tol):
+                            edge.start = point
+                            break
+                        if point.is_close(edge.end, tol=tol):
+                            edge.end = point
+                            break
+                    else:
+                        continue
+                del remaining[edge_index]
+                add_to_group(edge)
+
+            bifurcations = []
+            group, bifurcations, _ = ContourMixin.get_edges_bifurcations(group, bifurcations, True)
+            for edge in bifurcations:
+                add_remaining(edge)
+            if group:
+                groups.append(group)
+        return groups
+
+    @staticmethod
+    def chain_primitives(primitives, tol=1e-6):
+        """
+        Orders connected primitives in a chain, with a walk on a hash grid of their ends.
+
+        The chain starts with the first primitive, is extended from its end and then from its start until it is
+        closed, primitives being reversed when needed. Primitives of zero length are dropped, as ordering_contour does.
+
+        :param primitives: The primitives to order.
+        :param tol: The tolerance to consider primitives ends connected.
+        :return: The ordered primitives, or None if they do not form a single chain.
+        """
+        primitives = [primitive for primitive in primitives if not primitive.start.is_close(primitive.end, tol)
+                      or primitive is primitives[0]]
+        ends_grid = PointsHashGrid(tol)
+        for primitive in primitives:
+            ends_grid.add(primitive.start)
+            ends_grid.add(primitive.end)
+        used = [False] * len(primitives)
+        used[0] = True
+        chain = deque([primitives[0]])
+        for forward in (True, False):
+            while not chain[-1].end.is_close(chain[0].start, tol):
+                point = chain[-1].end if forward else chain[0].start
+                next_indices = [point_index // 2 for point_index in ends_grid.close_points(point, tol)
+                                if not used[point_index // 2]]
+                if not next_indices:
+                    break
+                used[next_indices[0]] = True
+                primitive = primitives[next_indices[0]]
+                if forward:
+                    chain.append(primitive if primitive.start.is_close(point, tol) else primitive.reverse())
+                else:
+                    chain.appendleft(primitive if primitive.end.is_close(point, tol) else primitive.reverse())
+        if not all(used):
+            return None
+        return list(chain)
+
     @classmethod
     def contours_from_edges(cls, edges, tol=1e-7):
         if not edges:
@@ -1228,10 +1433,22 @@ class ContourMixin(WireMixin):
         contours_list = [cls(primitives) for primitives in contours_primitives_lists]
         if not edges:
             return contours_list
+        if not contours_list:
+            # The connected groups are disjoint: their contours can't superpose each other
+            list_contours = []
+            for group in cls.connected_edges_groups(edges, tol):
+                chain = cls.chain_primitives(group)
+                if chain is None:
+                    contour_n = cls(group)
+                    contour_n.order_contour()
+                else:
+                    contour_n = cls(chain)
+                list_contours.append(contour_n)
+            return list_contours
+
         list_contours = []
         finished = False
         contour_primitives = []
-
         while not finished:
             len1 = len(edges)
             edges, contour_primitives, contours_list = cls.find_connected_edges(
@@ -2534,6 +2751,22 @@ class ClosedPolygon2D(Contour2D, ClosedPolygonMixin):
         return polygon_point_belongs((point.x, point.y),
                                      [(p.x, p.y) for p in self.points], include_edge_points=include_edge_points)
 
+    def points_belong(self, points, include_edge_points: bool = False):
+        """
+        Classifies many points against the polygon at once, with the same ray casting algorithm as point_belongs.
+
+        :param points: An array of shape (N, 2), or a list of Point2D.
+        :param include_edge_points: Whether points on the edges of the polygon belong to it. Default is False.
+        :type include_edge_points: bool, optional
+        :return: A boolean array of shape (N,).
+        :rtype: numpy.ndarray
+        """
+        if isinstance(points, list):
+            points = [[*point] for point in points]
+        points = npy.ascontiguousarray(points, dtype=npy.float64).reshape(-1, 2)
+        polygon = npy.array([[point.x, point.y] for point in self.points], dtype=npy.float64).reshape(-1, 2)
+        return polygon_points_belong(points, polygon, include_edge_points)
+
     def second_moment_area(self, point):
         Ix, Iy, Ixy = 0., 0., 0.
         for pi, pj in zip(self.points, self.points[1:] + [self.points[0]]):
@@ -2739,75 +2972,35 @@ class ClosedPolygon2D(Contour2D, ClosedPolygonMixin):
             return d_min, other_point_min
         return d_min
 
+    def self_intersections(self, first_only: bool = False):
+        """
+        Finds the pairs of intersecting edges of the polygon with a sweep line, see polygon_self_intersections.
+
+        Edge i goes from point i to point i + 1. Consecutive edges are only intersecting if they overlap, and
+        edges of zero length are ignored.
+
+        :param first_only: Whether to stop at the first intersection found. Default is False.
+        :type first_only: bool, optional
+        :return: The sorted list of the (i, j) indices of intersecting edges, i < j.
+        :rtype: List[Tuple[int, int]]
+        """
+        polygon = npy.array([[point.x, point.y] for point in self.points], dtype=npy.float64).reshape(-1, 2)
+        edges = npy.nonzero((polygon != npy.roll(polygon, -1, axis=0)).any(axis=1))[0]
+        intersections = polygon_self_intersections(npy.ascontiguousarray(polygon[edges]), first_only)
+        return [(int(edges[index1]), int(edges[index2])) for index1, index2 in intersections]
+
     def self_intersects(self):
-        epsilon = 0
-        # BENTLEY-OTTMANN ALGORITHM
-        # Sort the points along ascending x for the Sweep Line method
-        sorted_index = sorted(range(len(self.points)), key=lambda p: (
-            self.points[p][0], self.points[p][1]))
-        nb = len(sorted_index)
-        segments = []
-        deleted = []
-
-        while len(
-                sorted_index) != 0:  # While all the points haven't been swept
-            # Stock the segments between 2 consecutive edges
-            # Ex: for the ABCDE polygon, if Sweep Line is on C, the segments
-            #   will be (C,B) and (C,D)
-            if sorted_index[0] - 1 < 0:
-                segments.append((sorted_index[0], nb - 1))
-            else:
-                segments.append((sorted_index[0], sorted_index[0] - 1))
-            if sorted_index[0] >= len(self.points) - 1:
-                segments.append((sorted_index[0], 0))
-            else:
-                segments.append((sorted_index[0], sorted_index[0] + 1))
-
-            # Once two edges linked by a segment have been swept, delete the
-            # segment from the list
-            to_del = []
-            for index in deleted:
-                if abs(index - sorted_index[0]) == 1 or abs(
-                        index - sorted_index[0]) == nb - 1:
-                    to_del.append((index, sorted_index[0]))
-                    to_del.append((sorted_index[0], index))
-
-            # Keep track of which edges have been swept
-            deleted.append(sorted_index[0])
-            sorted_index.pop(0)
-
-            # Delete the segments that have just been swept
-            index_to_del = []
-            for i, segment in enumerate(segments):
-                for seg_to_del in to_del:
-                    if segment == seg_to_del:
-                        index_to_del.append(i)
-            for index in index_to_del[::-1]:
-                segments.pop(index)
-
-            # Checks if two segments are intersecting each other, returns True
-            # if yes, otherwise the algorithm continues at WHILE
-            for segment1 in segments:
-                for segment2 in segments:
-                    if segment1[0] != segment2[0] and segment1[1] != segment2[
-                        1] and segment1[0] != segment2[1] and segment1[1] != \
-                            segment2[0]:
-
-                        line1 = volmdlr.edges.LineSegment2D(
-                            self.points[segment1[0]],
-                            self.points[segment1[1]])
-                        line2 = volmdlr.edges.LineSegment2D(
-                            self.points[segment2[0]],
-                            self.points[segment2[1]])
-
-                        p, a, b = volmdlr.Point2D.line_intersection(line1,
-                                                                    line2,
-                                                                    True)
-                        if p is not None:
-                            if 0 + epsilon <= a <= 1 - epsilon \
-                                    and 0 + epsilon <= b <= 1 - epsilon:
-                                return True, line1, line2
+        """
+        Verifies if the polygon intersects itself.
 
+        :return: A boolean and, if True, two intersecting line segments of the polygon.
+        """
+        intersections = self.self_intersections(first_only=True)
+        if intersections:
+            number_points = len(self.points)
+            line1, line2 = [volmdlr.edges.LineSegment2D(self.points[index], self.points[(index + 1) % number_points])
+                            for index in intersections[0]]
+            return True, line1, line2
         return False, None, None
 
     @classmethod
@@ -3156,6 +3349,23 @@ class ClosedPolygon2D(Contour2D, ClosedPolygonMixin):
         :return: Discretization data.
         :rtype: list
         """
+        vertices, x, y, grid_indices = self.grid_triangulation_vertices(number_points_x, number_points_y)
+        points = [vmd.Node2D(*vertex) for vertex in vertices.tolist()]
+        grid_point_index = {(i, j): point for (i, j), point in zip(grid_indices.tolist(), points)}
+        return points, x, y, grid_point_index
+
+    def grid_triangulation_vertices(self, number_points_x: int = 25, number_points_y: int = 25):
+        """
+        Computes the nodes of a n by m grid that are inside the polygon and are not vertices of the polygon.
+
+        :param number_points_x: Number of discretization points in x direction.
+        :type number_points_x: int
+        :param number_points_y: Number of discretization points in y direction.
+        :type number_points_y: int
+        :return: The (k, 2) array of the nodes coordinates, the x and y values of the grid and the (k, 2) array of
+            the grid indices of the nodes.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
         x_min, x_max, y_min, y_max = self.bounding_rectangle.bounds()
 
         n = number_points_x + 2
@@ -3164,18 +3374,19 @@ class ClosedPolygon2D(Contour2D, ClosedPolygonMixin):
         x = npy.linspace(x_min, x_max, num=n)
         y = npy.linspace(y_min, y_max, num=m)
 
-        grid_point_index = {}
+        grid_indices = npy.indices((n, m)).reshape(2, -1).T
+        vertices = npy.column_stack((x[grid_indices[:, 0]], y[grid_indices[:, 1]]))
+        inside = self.points_belong(vertices, include_edge_points=True)
 
         polygon_points = {vmd.Node2D.from_point(p) for p in self.points}
-        points = []
-        for i, xi in enumerate(x):
-            for j, yi in enumerate(y):
-                point = vmd.Node2D(xi, yi)
-                if self.point_belongs(point, include_edge_points=True) and point not in polygon_points:
-                    grid_point_index[(i, j)] = point
-                    points.append(point)
-
-        return points, x, y, grid_point_index
+        # Only nodes sharing the hash of a vertex of the polygon may be equal to it
+        polygon_hashes = npy.array([int(1e6 * (point.x + point.y)) for point in polygon_points])
+        candidates = npy.flatnonzero(inside & npy.isin((1e6 * vertices.sum(axis=1)).astype(npy.int64),
+                                                       polygon_hashes))
+        for index in candidates:
+            if vmd.Node2D(*vertices[index]) in polygon_points:
+                inside[index] = False
+        return vertices[inside], x, y, grid_indices[inside]
 
     def ear_clipping_triangulation(self):
         """